@@ -0,0 +1,316 @@
+"""Asynchronous session.
+
+An asynchronous session sends requests to the server of a session over a ``grpc.aio`` channel. Awaiting a request
+does not block the event loop, and requests awaited concurrently are pipelined over a single connection.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+    from collections.abc import Callable
+    from collections.abc import Iterable
+    from typing import Any
+
+    from ansys.edb.core.edb_defs import LayoutObjType
+    from ansys.edb.core.geometry.polygon_data import PolygonData
+    from ansys.edb.core.inner.layout_obj import LayoutObj
+    from ansys.edb.core.layer.layer import Layer
+    from ansys.edb.core.layout.cell import Cell
+    from ansys.edb.core.layout.layout import Layout
+    from ansys.edb.core.layout_instance.layout_instance import LayoutInstance
+    from ansys.edb.core.layout_instance.layout_obj_instance import LayoutObjInstance
+    from ansys.edb.core.layout_instance.layout_obj_instance_2d_geometry import LayoutObjInstance2DGeometry
+    from ansys.edb.core.layout_instance.layout_obj_instance_3d_geometry import LayoutObjInstance3DGeometry
+    from ansys.edb.core.net.net import Net
+    from ansys.edb.core.session import _Session
+
+from ansys.api.edb.v1.layout_obj_instance_2d_geometry_pb2 import GetPolygonDataMessage
+from ansys.api.edb.v1.layout_obj_pb2 import LayoutObjTargetMessage
+
+from ansys.edb.core.inner import LOGGER
+from ansys.edb.core.inner import messages
+from ansys.edb.core.inner.exceptions import EDBSessionException
+from ansys.edb.core.inner.exceptions import ErrorCode
+from ansys.edb.core.inner.factory import create_lyt_obj
+from ansys.edb.core.inner.interceptors import AsyncExceptionInterceptor
+from ansys.edb.core.inner.parser import msg_to_polygon_data
+from ansys.edb.core.inner.utils import _get_service_name
+from ansys.edb.core.session import StubType
+from ansys.edb.core.session import get_current_session
+from ansys.edb.core.session import use_session
+from ansys.edb.core.utility.io_manager import _IOManager
+
+
+class AsyncSession:
+    """Provides awaitable counterparts of collection queries, geometry fetches, and heavy layout operations.
+
+    The asynchronous session shares the server of a session, and the objects that it returns are bound to that \
+    session. Their other methods and properties send synchronous requests as usual, and :meth:`run` runs any \
+    synchronous operation in a worker thread so that it does not block the event loop.
+
+    Requests sent through the asynchronous session bypass the cache and the buffer of the IO manager. Writes \
+    buffered by the session are flushed before each request so that they are not reordered, and the cache of the \
+    session is invalidated after each request that modifies the database.
+
+    Examples
+    --------
+    >>> async with AsyncSession() as async_session:
+    >>>     nets, primitives = await asyncio.gather(
+    >>>         async_session.get_items(layout, LayoutObjType.NET),
+    >>>         async_session.get_items(layout, LayoutObjType.PRIMITIVE),
+    >>>     )
+    >>>     cutout = await async_session.cutout(cell, nets, [], clipping_polygon)
+    """
+
+    def __init__(self, edb_session: _Session | None = None):
+        """Initialize an asynchronous session.
+
+        Parameters
+        ----------
+        edb_session : .Session, default: None
+            Connected session whose server to send requests to. The default is ``None``, in which case the current \
+            session is used.
+        """
+        if edb_session is None:
+            edb_session = get_current_session()
+        if edb_session is None or not edb_session.is_active():
+            raise EDBSessionException(ErrorCode.NO_SESSIONS)
+        self._session = edb_session
+        self._channel = edb_session._create_aio_channel([AsyncExceptionInterceptor(LOGGER)])
+        self._stubs = {}
+
+    async def __aenter__(self):
+        """Enter the asynchronous session."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Close the asynchronous session on exit."""
+        await self.close()
+
+    @property
+    def session(self) -> _Session:
+        """:class:`.Session`: Session whose server requests are sent to.
+
+        This property is read-only.
+        """
+        return self._session
+
+    async def close(self):
+        """Close the channel of the asynchronous session.
+
+        The session that it shares the server of stays connected.
+        """
+        await self._channel.close()
+
+    def _stub(self, stub_type: StubType):
+        if (stub := self._stubs.get(stub_type)) is None:
+            stub = self._stubs[stub_type] = stub_type.stub_class(self._channel)
+        return stub
+
+    async def _call(self, stub_type: StubType, rpc_name: str, request):
+        self._flush_buffer()
+        response = await getattr(self._stub(stub_type), rpc_name)(request)
+        if (cache := self._session.io_manager.cache) is not None and _IOManager._invalidates_cache(
+            _get_service_name(stub_type), rpc_name
+        ):
+            cache.invalidate()
+        return response
+
+    def _flush_buffer(self):
+        if (buffer := self._session.io_manager.buffer) is not None and buffer.allow_flushing:
+            with use_session(self._session):
+                buffer.flush()
+
+    async def run(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run a synchronous operation in a worker thread bound to the session.
+
+        Parameters
+        ----------
+        func : Callable
+            Function to call.
+        *args
+            Positional arguments of the function.
+        **kwargs
+            Keyword arguments of the function.
+
+        Returns
+        -------
+        Any
+            Value returned by the function.
+        """
+
+        def run_with_session():
+            with use_session(self._session):
+                return func(*args, **kwargs)
+
+        return await asyncio.get_running_loop().run_in_executor(None, run_with_session)
+
+    async def get_items(self, layout: Layout, obj_type: LayoutObjType) -> list[LayoutObj]:
+        """Get all objects of a type in a layout.
+
+        Parameters
+        ----------
+        layout : .Layout
+            Layout to get the objects of.
+        obj_type : .LayoutObjType
+            Type of the objects.
+
+        Returns
+        -------
+        list[.LayoutObj]
+        """
+        request = LayoutObjTargetMessage(target=layout.msg, type=obj_type.value)
+        items_msg = await self._call(StubType.layout, "GetItems", request)
+        return [create_lyt_obj(item, obj_type) for item in items_msg.items]
+
+    async def iter_items(self, layout: Layout, obj_type: LayoutObjType) -> AsyncIterator[LayoutObj]:
+        """Iterate over the objects of a type in a layout as they are streamed from the server.
+
+        Parameters
+        ----------
+        layout : .Layout
+            Layout to get the objects of.
+        obj_type : .LayoutObjType
+            Type of the objects.
+
+        Yields
+        ------
+        .LayoutObj
+        """
+        self._flush_buffer()
+        request = LayoutObjTargetMessage(target=layout.msg, type=obj_type.value)
+        async for items_msg in self._stub(StubType.layout).StreamItems(request):
+            for item in items_msg.items:
+                yield create_lyt_obj(item, obj_type)
+
+    async def get_geometries(
+        self, layout_obj_instance: LayoutObjInstance, layer: Layer | str
+    ) -> list[LayoutObjInstance2DGeometry | LayoutObjInstance3DGeometry]:
+        """Get the geometries of a layout object instance on a layer.
+
+        Parameters
+        ----------
+        layout_obj_instance : .LayoutObjInstance
+            Layout object instance.
+        layer : .Layer or str
+            Layer.
+
+        Returns
+        -------
+        list[.LayoutObjInstance2DGeometry or .LayoutObjInstance3DGeometry]
+        """
+        from ansys.edb.core.layout_instance.layout_obj_instance import _parse_layout_obj_instance_geometry_message
+
+        request = messages.layer_ref_property_message(layout_obj_instance, layer)
+        geometries_msg = await self._call(StubType.layout_obj_instance, "GetGeometries", request)
+        return [_parse_layout_obj_instance_geometry_message(msg) for msg in geometries_msg.geometries]
+
+    async def get_polygon_data(
+        self, geometry: LayoutObjInstance2DGeometry, apply_negatives: bool = False
+    ) -> PolygonData:
+        """Get the polygon data of a 2D geometry.
+
+        Parameters
+        ----------
+        geometry : .LayoutObjInstance2DGeometry
+            Geometry.
+        apply_negatives : bool, default: False
+            Whether to subtract the negative geometries from the polygon data.
+
+        Returns
+        -------
+        .PolygonData
+        """
+        request = GetPolygonDataMessage(layout_obj_inst_geom=geometry.msg, apply_neg=apply_negatives)
+        return msg_to_polygon_data(
+            await self._call(StubType.layout_obj_instance_2d_geometry, "GetPolygonData", request)
+        )
+
+    async def fetch_polygon_data(
+        self, layout_obj_instances: Iterable[LayoutObjInstance], layer: Layer | str, apply_negatives: bool = False
+    ) -> list[list[PolygonData]]:
+        """Get the polygon data of the 2D geometries of layout object instances on a layer.
+
+        The requests for all instances are sent concurrently.
+
+        Parameters
+        ----------
+        layout_obj_instances : Iterable[.LayoutObjInstance]
+            Layout object instances.
+        layer : .Layer or str
+            Layer.
+        apply_negatives : bool, default: False
+            Whether to subtract the negative geometries from the polygon data.
+
+        Returns
+        -------
+        list[list[.PolygonData]]
+            Polygon data of the 2D geometries of each layout object instance.
+        """
+        from ansys.edb.core.layout_instance.layout_obj_instance_2d_geometry import LayoutObjInstance2DGeometry
+
+        geometries = await asyncio.gather(*(self.get_geometries(inst, layer) for inst in layout_obj_instances))
+        return await asyncio.gather(
+            *(
+                asyncio.gather(
+                    *(
+                        self.get_polygon_data(geometry, apply_negatives)
+                        for geometry in inst_geometries
+                        if isinstance(geometry, LayoutObjInstance2DGeometry)
+                    )
+                )
+                for inst_geometries in geometries
+            )
+        )
+
+    async def cutout(
+        self,
+        cell: Cell,
+        included_nets: list[Net],
+        clipped_nets: list[Net],
+        clipping_polygon: PolygonData,
+        clean_clipping: bool = True,
+        in_place: bool = False,
+    ) -> Cell:
+        """Await :meth:`.Cell.cutout`.
+
+        Parameters
+        ----------
+        cell : .Cell
+            Cell to cut out.
+        included_nets : list[.Net]
+            Nets to keep after cutout.
+        clipped_nets : list[.Net]
+            Nets to keep and clip at the boundary after cutout.
+        clipping_polygon : .PolygonData
+            Clipping polygon.
+        clean_clipping : bool, default: True
+            Whether to perform clean clipping.
+        in_place : bool, default: False
+            Whether to perform the cutout in place.
+
+        Returns
+        -------
+        .Cell
+            Cell created.
+        """
+        from ansys.edb.core.layout.cell import Cell
+
+        request = messages.cell_cutout_message(
+            cell, included_nets, clipped_nets, clipping_polygon, clean_clipping, in_place
+        )
+        return Cell(await self._call(StubType.cell, "CutOut", request))
+
+    async def refresh(self, layout_instance: LayoutInstance):
+        """Await :meth:`.LayoutInstance.refresh`.
+
+        Parameters
+        ----------
+        layout_instance : .LayoutInstance
+            Layout instance to refresh.
+        """
+        await self._call(StubType.layout_instance, "Refresh", layout_instance.msg)
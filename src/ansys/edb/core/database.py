@@ -5,6 +5,9 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from ansys.edb.core.definition.component_def import ComponentDefEntry
     from ansys.edb.core.inner.messages import EDBObjMessage
 
 from enum import Enum
@@ -32,11 +35,15 @@ from ansys.edb.core.inner.messages import get_product_property_ids_message
 from ansys.edb.core.inner.messages import get_product_property_message
 from ansys.edb.core.inner.messages import set_product_property_message
 from ansys.edb.core.inner.messages import str_message
+from ansys.edb.core.inner.utils import iter_items_from_server
 from ansys.edb.core.inner.utils import map_list
+from ansys.edb.core.layer.layer import _invalidate_stackup_snapshots
 from ansys.edb.core.layout.cell import Cell
 from ansys.edb.core.session import DatabaseServiceStub
 from ansys.edb.core.session import StubAccessor
 from ansys.edb.core.session import StubType
+from ansys.edb.core.session import is_in_memory
+from ansys.edb.core.utility import identity_map
 
 
 class ProductIdType(Enum):
@@ -127,6 +134,9 @@ class Database(ObjBase, variable_server.VariableServer):
         """
         self.__stub.Close(self.msg)
         self.msg = None
+        identity_map.clear()
+        # The IDs of the layer collections of the database may be reused by the next database that is opened.
+        _invalidate_stackup_snapshots()
 
     @staticmethod
     def _map_cell_edb_obj_collection(cells_msg: EDBObjMessage) -> list[Cell]:
@@ -148,6 +158,39 @@ class Database(ObjBase, variable_server.VariableServer):
         """:obj:`list` of :class:`.Cell`: All footprint cells in the database."""
         return Database._map_cell_edb_obj_collection(self.__stub.GetFootprints(self.msg))
 
+    def _iter_cells(self, unary_rpc, unary_streaming_rpc) -> Iterator[Cell]:
+        """Yield the cells of a collection as they are streamed from the server."""
+        if is_in_memory():
+            return iter(Database._map_cell_edb_obj_collection(unary_rpc(self.msg)))
+        return iter_items_from_server(Cell, unary_streaming_rpc(self.msg), "items")
+
+    def iter_top_circuit_cells(self) -> Iterator[Cell]:
+        """Iterate over the top circuit cells in the database as they are streamed from the server.
+
+        Returns
+        -------
+        Iterator of .Cell
+        """
+        return self._iter_cells(self.__stub.GetTopCircuits, self.__stub.StreamTopCircuits)
+
+    def iter_circuit_cells(self) -> Iterator[Cell]:
+        """Iterate over all circuit cells in the database as they are streamed from the server.
+
+        Returns
+        -------
+        Iterator of .Cell
+        """
+        return self._iter_cells(self.__stub.GetCircuits, self.__stub.StreamCircuits)
+
+    def iter_footprint_cells(self) -> Iterator[Cell]:
+        """Iterate over all footprint cells in the database as they are streamed from the server.
+
+        Returns
+        -------
+        Iterator of .Cell
+        """
+        return self._iter_cells(self.__stub.GetFootprints, self.__stub.StreamFootprints)
+
     @property
     def edb_uid(self) -> int:
         """:obj:`int`: Unique EDB ID of the database."""
@@ -376,11 +419,57 @@ class Database(ObjBase, variable_server.VariableServer):
         """:obj:`list` of :class:`.ComponentDef`: All component definitions in the database."""
         return self._get_definition_objs(ComponentDef, DefinitionObjType.COMPONENT_DEF)
 
+    def component_catalog(self) -> list[ComponentDefEntry]:
+        """Get the names, footprints, pins, and models of all component definitions in the database.
+
+        The data is fetched from the server in chunks rather than with one request per component definition, pin, \
+        and model. If caching is enabled, the fetched data is added to the active cache.
+
+        Returns
+        -------
+        list of .ComponentDefEntry
+            Data of the component definitions. For more information, see :meth:`.ComponentDef.catalog`.
+        """
+        return ComponentDef.catalog(self.component_defs)
+
     @property
     def material_defs(self) -> list[MaterialDef]:
         """:obj:`list` of :class:`.MaterialDef`: All material definitions in the database."""
         return self._get_definition_objs(MaterialDef, DefinitionObjType.MATERIAL_DEF)
 
+    def export_materials(self) -> list[dict]:
+        """Export all material definitions in the database with their properties and thermal modifiers.
+
+        The data of all material definitions is fetched from the server in chunks rather than with one request per \
+        material definition, property, and thermal modifier.
+
+        Returns
+        -------
+        list of dict
+            Records of the material definitions. For more information on the record format, see \
+            :meth:`.MaterialDef.export_records`.
+        """
+        return MaterialDef.export_records(self.material_defs)
+
+    def apply_materials(self, records: list[dict]) -> list[MaterialDef]:
+        """Create or update material definitions in the database from records.
+
+        This method can be used with the records returned by :meth:`export_materials` to synchronize material \
+        libraries between databases. All write requests are buffered and sent to the server in chunks.
+
+        Parameters
+        ----------
+        records : list of dict
+            Records of the material definitions. For more information on the record format, see \
+            :meth:`.MaterialDef.export_records`.
+
+        Returns
+        -------
+        list of .MaterialDef
+            Material definitions created or updated, in the same order as the provided records.
+        """
+        return MaterialDef.apply_records(self, records)
+
     @property
     def dataset_defs(self) -> list[DatasetDef]:
         """:obj:`list` of :class:`.DatasetDef`: All dataset definitions in the database."""
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from typing import TYPE_CHECKING
+from typing import NamedTuple
 
 if TYPE_CHECKING:
     from ansys.edb.core.database import Database
@@ -23,11 +24,38 @@ from ansys.edb.core.inner.messages import edb_obj_pair_message
 from ansys.edb.core.inner.messages import get_product_property_ids_message
 from ansys.edb.core.inner.messages import get_product_property_message
 from ansys.edb.core.inner.messages import set_product_property_message
+from ansys.edb.core.inner.utils import batch_get
 from ansys.edb.core.inner.utils import map_list
 from ansys.edb.core.session import StubAccessor
 from ansys.edb.core.session import StubType
 
 
+class ComponentPinEntry(NamedTuple):
+    """Represents the data of a component pin returned by :meth:`ComponentDef.catalog`."""
+
+    pin: ComponentPin
+    """:class:`.ComponentPin`: Component pin the data was fetched from."""
+    name: str
+    """:obj:`str`: Name of the component pin."""
+    number: int
+    """:obj:`int`: Number of the component pin."""
+
+
+class ComponentDefEntry(NamedTuple):
+    """Represents the data of a component definition returned by :meth:`ComponentDef.catalog`."""
+
+    component_def: ComponentDef
+    """:class:`.ComponentDef`: Component definition the data was fetched from."""
+    name: str
+    """:obj:`str`: Name of the component definition."""
+    footprint_id: int
+    """:obj:`int`: ID of the footprint cell of the component definition, or ``0`` if it has no footprint."""
+    pins: tuple[ComponentPinEntry, ...]
+    """:obj:`tuple` of :class:`ComponentPinEntry`: Component pins of the component definition."""
+    models: tuple[ComponentModel, ...]
+    """:obj:`tuple` of :class:`.ComponentModel`: Component models of the component definition."""
+
+
 class ComponentDef(ObjBase):
     """Represents a component definition."""
 
@@ -212,3 +240,45 @@ class ComponentDef(ObjBase):
         """
         attr_ids = self.__stub.GetProductPropertyIds(get_product_property_ids_message(self, prod_id)).ids
         return [attr_id for attr_id in attr_ids]
+
+    @staticmethod
+    def catalog(component_defs: list[ComponentDef]) -> list[ComponentDefEntry]:
+        """Get the names, footprints, pins, and models of multiple component definitions.
+
+        The names, footprints, pin names and numbers, and model types are fetched from the server in chunks rather \
+        than with one request per component definition, pin, and model. If caching is enabled, the fetched data is \
+        added to the active cache so that subsequent reads of these properties do not query the server.
+
+        Parameters
+        ----------
+        component_defs : list of .ComponentDef
+            Component definitions to get the data of.
+
+        Returns
+        -------
+        list of ComponentDefEntry
+            Data of the component definitions in the same order as the provided component definitions.
+        """
+        def_data = batch_get(component_defs, ComponentDef._catalog_data)
+        pins = [pin for _, _, def_pins, _ in def_data for pin in def_pins]
+        models = [model for _, _, _, def_models in def_data for model in def_models]
+        pin_entries = iter(batch_get(pins, lambda pin: ComponentPinEntry(pin, pin.name, pin.number)))
+        cast_models = iter(batch_get(models, component_model.ComponentModel.cast))
+        return [
+            ComponentDefEntry(
+                comp_def,
+                name,
+                footprint_id,
+                tuple(next(pin_entries) for _ in def_pins),
+                tuple(next(cast_models) for _ in def_models),
+            )
+            for comp_def, (name, footprint_id, def_pins, def_models) in zip(component_defs, def_data)
+        ]
+
+    def _catalog_data(self):
+        return (
+            self.name,
+            self.__stub.GetFootprintCell(self.msg).id,
+            map_list(self.__stub.GetComponentPins(self.msg).items, component_pin.ComponentPin),
+            map_list(self.__stub.GetComponentModels(self.msg).items, component_model.ComponentModel),
+        )
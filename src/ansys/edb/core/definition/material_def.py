@@ -17,11 +17,14 @@ from ansys.edb.core.definition.material_property_thermal_modifier import Materia
 from ansys.edb.core.edb_defs import DefinitionObjType
 from ansys.edb.core.inner import ObjBase
 from ansys.edb.core.inner import messages
+from ansys.edb.core.inner import utils
 from ansys.edb.core.session import MaterialDefServiceStub
 from ansys.edb.core.session import StubAccessor
 from ansys.edb.core.session import StubType
 from ansys.edb.core.utility.value import Value
 
+_ANISOTROPIC_COMPONENT_IDS = (0, 1, 2)
+
 
 class MaterialProperty(Enum):
     """Enum representing material property types."""
@@ -351,6 +354,146 @@ class MaterialDef(ObjBase):
             )
         )
 
+    def _get_property_record(self, material_property):
+        """Get the values of a material property as strings shaped by the property dimensions."""
+        col, row = self.get_dimensions(material_property)
+        if col == 1 and row == 1:
+            return str(self.get_property(material_property))
+        elif col == 1 or row == 1:
+            return [
+                str(self.get_property(material_property, component_id=component_id))
+                for component_id in _ANISOTROPIC_COMPONENT_IDS
+            ]
+        return [[str(self.get_property(material_property, row=r, col=c)) for c in range(col)] for r in range(row)]
+
+    def _get_thermal_modifiers(self, material_property, property_record):
+        """Get the thermal modifiers of a material property, or ``None`` if it has none."""
+        if isinstance(property_record, str) or isinstance(property_record[0], list):
+            thermal_modifier = self.get_thermal_modifier(material_property)
+            return None if thermal_modifier.is_null else thermal_modifier
+        thermal_modifiers = [
+            self.get_anisotropic_thermal_modifier(material_property, component_id)
+            for component_id in _ANISOTROPIC_COMPONENT_IDS
+        ]
+        if all(thermal_modifier.is_null for thermal_modifier in thermal_modifiers):
+            return None
+        return [None if thermal_modifier.is_null else thermal_modifier for thermal_modifier in thermal_modifiers]
+
+    def _to_record(self):
+        """Get the name, properties, and thermal modifier objects of the material definition."""
+        properties = {}
+        thermal_modifiers = {}
+        for material_property in self.all_properties:
+            key = material_property.name.lower()
+            properties[key] = self._get_property_record(material_property)
+            if (thermal_modifier := self._get_thermal_modifiers(material_property, properties[key])) is not None:
+                thermal_modifiers[key] = thermal_modifier
+        return {"name": self.name, "properties": properties, "thermal_modifiers": thermal_modifiers}
+
+    @staticmethod
+    def export_records(material_defs: list[MaterialDef]) -> list[dict]:
+        """Export the properties and thermal modifiers of multiple material definitions.
+
+        The data of all material definitions is fetched from the server in chunks rather than with one request per \
+        material definition, property, and thermal modifier.
+
+        Parameters
+        ----------
+        material_defs : list of .MaterialDef
+            Material definitions to export.
+
+        Returns
+        -------
+        list of dict
+            Records of the material definitions in the same order as the provided material definitions. \
+            Each record has the following keys:
+
+            - ``"name"``: Name of the material definition.
+            - ``"properties"``: Dictionary mapping lowercase :class:`.MaterialProperty` names to property values. \
+              Values are strings for simple properties, lists of 3 strings for anisotropic properties, and \
+              nested lists of strings indexed by ``[row][col]`` for tensor properties.
+            - ``"thermal_modifiers"``: Dictionary mapping lowercase :class:`.MaterialProperty` names to \
+              quadratic model parameters of their thermal modifier. Anisotropic properties map to a list of \
+              3 entries, which are ``None`` for components without a thermal modifier.
+        """
+        records = utils.batch_get(material_defs, MaterialDef._to_record)
+        thermal_modifiers = [
+            thermal_modifier
+            for record in records
+            for entry in record["thermal_modifiers"].values()
+            for thermal_modifier in (entry if isinstance(entry, list) else [entry])
+            if thermal_modifier is not None
+        ]
+        params = dict(
+            zip(
+                [thermal_modifier.id for thermal_modifier in thermal_modifiers],
+                utils.batch_get(thermal_modifiers, MaterialPropertyThermalModifier._to_record),
+            )
+        )
+        for record in records:
+            for key, entry in record["thermal_modifiers"].items():
+                record["thermal_modifiers"][key] = (
+                    [None if tm is None else params[tm.id] for tm in entry]
+                    if isinstance(entry, list)
+                    else params[entry.id]
+                )
+        return records
+
+    def _apply_record(self, record):
+        """Set the properties and thermal modifiers of the material definition from a record."""
+        for key, values in record.get("properties", {}).items():
+            material_property = MaterialProperty[key.upper()]
+            if not isinstance(values, (list, tuple)):
+                self.set_property(material_property, values)
+            elif isinstance(values[0], (list, tuple)):
+                for r, row_values in enumerate(values):
+                    for c, value in enumerate(row_values):
+                        self.set_property(material_property, value, row=r, col=c)
+            else:
+                for component_id, value in zip(_ANISOTROPIC_COMPONENT_IDS, values):
+                    self.set_property(material_property, value, component_id=component_id)
+        for key, params in record.get("thermal_modifiers", {}).items():
+            material_property = MaterialProperty[key.upper()]
+            if isinstance(params, (list, tuple)):
+                for component_id, component_params in zip(_ANISOTROPIC_COMPONENT_IDS, params):
+                    if component_params is not None:
+                        self.set_anisotropic_thermal_modifier(
+                            material_property, component_id, MaterialPropertyThermalModifier._create(**component_params)
+                        )
+            else:
+                self.set_thermal_modifier(material_property, MaterialPropertyThermalModifier._create(**params))
+
+    @staticmethod
+    def apply_records(database: Database, records: list[dict]) -> list[MaterialDef]:
+        """Create or update multiple material definitions from records.
+
+        Material definitions are matched to records by name. Material definitions that do not exist yet are created. \
+        Properties and thermal modifiers in a record are set on the material definition, and other existing \
+        properties are left unchanged. All write requests are buffered and sent to the server in chunks.
+
+        Parameters
+        ----------
+        database : .Database
+            Database to create or update the material definitions in.
+        records : list of dict
+            Records in the format returned by :meth:`export_records`.
+
+        Returns
+        -------
+        list of .MaterialDef
+            Material definitions created or updated, in the same order as the provided records.
+        """
+        existing_defs = database.material_defs
+        existing_defs_by_name = dict(zip(utils.batch_get(existing_defs, lambda mat_def: mat_def.name), existing_defs))
+        material_defs = []
+        with utils.buffered_writes():
+            for record in records:
+                if (material_def := existing_defs_by_name.get(record["name"])) is None:
+                    material_def = MaterialDef.create(database, record["name"])
+                material_def._apply_record(record)
+                material_defs.append(material_def)
+        return material_defs
+
     @staticmethod
     def _tensor_pos_message(col, row):
         return pb.TensorPositionMessage(
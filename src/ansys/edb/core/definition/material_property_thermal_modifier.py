@@ -20,6 +20,15 @@ class MaterialPropertyThermalModifier(ObjBase):
     __stub: material_property_thermal_modifier_pb2_grpc.MaterialPropertyThermalModifierServiceStub = StubAccessor(
         StubType.material_property_thermal_modifier
     )
+    _VALUE_FIELDS = (
+        "temp_ref",
+        "c1",
+        "c2",
+        "temp_lower_limit",
+        "temp_upper_limit",
+        "lower_const_therm_mod",
+        "upper_const_therm_mod",
+    )
 
     @classmethod
     def create(
@@ -44,27 +53,39 @@ class MaterialPropertyThermalModifier(ObjBase):
             basic_quadratic_params = BasicQuadraticParams()
         if advanced_quadratic_params is None:
             advanced_quadratic_params = AdvancedQuadraticParams()
+        return cls._create(
+            temp_ref=basic_quadratic_params.temp_ref_val,
+            c1=basic_quadratic_params.c1_val,
+            c2=basic_quadratic_params.c2_val,
+            temp_lower_limit=advanced_quadratic_params.temp_lower_limit_val,
+            temp_upper_limit=advanced_quadratic_params.temp_upper_limit_val,
+            auto_calc_constant_thermal_modifier=advanced_quadratic_params.auto_calc_constant_thermal_modifier_vals,
+            lower_const_therm_mod=advanced_quadratic_params.lower_constant_thermal_modifier_val,
+            upper_const_therm_mod=advanced_quadratic_params.upper_constant_thermal_modifier_val,
+        )
+
+    @classmethod
+    def _create(cls, auto_calc_constant_thermal_modifier, **values):
+        """Create a thermal modifier from its quadratic model parameter values, keyed by message field name."""
         return MaterialPropertyThermalModifier(
             cls.__stub.Create(
                 pb.MaterialPropertyThermalModifierParamsMessage(
-                    temp_ref=messages.value_message(basic_quadratic_params.temp_ref_val),
-                    c1=messages.value_message(basic_quadratic_params.c1_val),
-                    c2=messages.value_message(basic_quadratic_params.c2_val),
-                    temp_lower_limit=messages.value_message(advanced_quadratic_params.temp_lower_limit_val),
-                    temp_upper_limit=messages.value_message(advanced_quadratic_params.temp_upper_limit_val),
-                    auto_calc_constant_thermal_modifier=(
-                        advanced_quadratic_params.auto_calc_constant_thermal_modifier_vals
-                    ),
-                    lower_const_therm_mod=messages.value_message(
-                        advanced_quadratic_params.lower_constant_thermal_modifier_val
-                    ),
-                    upper_const_therm_mod=messages.value_message(
-                        advanced_quadratic_params.upper_constant_thermal_modifier_val
-                    ),
+                    auto_calc_constant_thermal_modifier=auto_calc_constant_thermal_modifier,
+                    **{field: messages.value_message(value) for field, value in values.items()},
                 )
             )
         )
 
+    def _to_record(self):
+        """Get the quadratic model parameters of the thermal modifier as a dictionary keyed by message field name.
+
+        Values are stored as strings so that parameterized values are preserved.
+        """
+        msg = self.__stub.GetQuadraticModelParams(messages.edb_obj_message(self))
+        record = {field: str(Value(getattr(msg, field))) for field in self._VALUE_FIELDS}
+        record["auto_calc_constant_thermal_modifier"] = msg.auto_calc_constant_thermal_modifier
+        return record
+
     @property
     def quadratic_model_params(self) -> tuple[BasicQuadraticParams, AdvancedQuadraticParams]:
         """:obj:`tuple` of (:class:`.BasicQuadraticParams`, :class:`.AdvancedQuadraticParams`): \
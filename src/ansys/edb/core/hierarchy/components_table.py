@@ -0,0 +1,141 @@
+"""Components table."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from typing import NamedTuple
+
+if TYPE_CHECKING:
+    from ansys.edb.core.definition.component_def import ComponentDef
+    from ansys.edb.core.definition.rlc_component_property import RLCComponentProperty
+    from ansys.edb.core.layer.layer import Layer
+    from ansys.edb.core.layout.layout import Layout
+    from ansys.edb.core.utility.rlc import Rlc
+
+from ansys.edb.core.hierarchy.component_group import ComponentGroup
+from ansys.edb.core.hierarchy.component_group import ComponentType
+from ansys.edb.core.hierarchy.pin_pair_model import PinPairModel
+from ansys.edb.core.inner.utils import batch_get
+from ansys.edb.core.inner.utils import cached_reads
+from ansys.edb.core.primitive.padstack_instance import PadstackInstance
+from ansys.edb.core.utility.identity_map import enable_identity_map
+
+_RLC_COMPONENT_TYPES = (ComponentType.RESISTOR, ComponentType.INDUCTOR, ComponentType.CAPACITOR)
+
+
+class ComponentsTable(NamedTuple):
+    """Represents a column-oriented view of the components placed in a layout.
+
+    Each field is a column holding one entry per component, in the order the components are stored in the layout.
+    """
+
+    components: tuple[ComponentGroup, ...]
+    """:obj:`tuple` of :class:`.ComponentGroup`: Components the data was fetched from."""
+    names: tuple[str, ...]
+    """:obj:`tuple` of :obj:`str`: Names of the components."""
+    definitions: tuple[str, ...]
+    """:obj:`tuple` of :obj:`str`: Names of the component definitions of the components."""
+    types: tuple[ComponentType, ...]
+    """:obj:`tuple` of :class:`.ComponentType`: Types of the components."""
+    rlcs: tuple[dict[tuple[str, str], Rlc] | None, ...]
+    """:obj:`tuple` of :obj:`dict`: RLC values of the components mapped by pin pair, or ``None`` for components \
+    without a pin pair model."""
+    placement_layers: tuple[str, ...]
+    """:obj:`tuple` of :obj:`str`: Names of the placement layers of the components."""
+    pin_names: tuple[tuple[str, ...], ...]
+    """:obj:`tuple` of :obj:`tuple`: Names of the pins of the components."""
+    pin_positions: tuple[tuple[tuple[float, float], ...], ...]
+    """:obj:`tuple` of :obj:`tuple`: ``(x, y)`` positions of the pins of the components."""
+    pin_nets: tuple[tuple[str, ...], ...]
+    """:obj:`tuple` of :obj:`tuple`: Names of the nets of the pins of the components. Pins without a net have an \
+    empty net name."""
+
+    @classmethod
+    def from_layout(cls, layout: Layout) -> ComponentsTable:
+        """Fetch the data of all components placed in a layout.
+
+        The data of the components, their pins, definitions, placement layers, nets, and models is fetched from \
+        the server in chunks rather than with one request per object and property.
+
+        Parameters
+        ----------
+        layout : .Layout
+            Layout to fetch the components of.
+
+        Returns
+        -------
+        ComponentsTable
+        """
+        with cached_reads(), enable_identity_map():
+            components = [group for group in layout.groups if isinstance(group, ComponentGroup)]
+            component_data = batch_get(components, _ComponentData.from_component)
+            pins = [pin for data in component_data for pin in data.pins]
+            pin_data = dict(zip([pin.id for pin in pins], batch_get(pins, _pin_data)))
+            names = _names(
+                [data.definition for data in component_data]
+                + [data.placement_layer for data in component_data]
+                + [net for _, _, net in pin_data.values()]
+            )
+            rlc_properties = [data.rlc_property for data in component_data if data.rlc_property is not None]
+            models = batch_get(rlc_properties, _model)
+            model_rlcs = iter(batch_get([model for model in models if model is not None], _pin_pair_rlcs))
+            rlcs = iter([None if model is None else next(model_rlcs) for model in models])
+        component_pins = [[pin_data[pin.id] for pin in data.pins] for data in component_data]
+        return cls(
+            tuple(components),
+            tuple(data.name for data in component_data),
+            tuple(names[data.definition.id] for data in component_data),
+            tuple(data.type for data in component_data),
+            tuple(None if data.rlc_property is None else next(rlcs) for data in component_data),
+            tuple(names[data.placement_layer.id] for data in component_data),
+            tuple(tuple(name for name, _, _ in comp_pins) for comp_pins in component_pins),
+            tuple(tuple(position for _, position, _ in comp_pins) for comp_pins in component_pins),
+            tuple(tuple(names[net.id] for _, _, net in comp_pins) for comp_pins in component_pins),
+        )
+
+
+class _ComponentData(NamedTuple):
+    name: str
+    type: ComponentType
+    definition: ComponentDef
+    placement_layer: Layer
+    rlc_property: RLCComponentProperty | None
+    pins: list[PadstackInstance]
+
+    @classmethod
+    def from_component(cls, component):
+        comp_type = component.component_type
+        return cls(
+            component.name,
+            comp_type,
+            component.component_def,
+            component.placement_layer,
+            component.component_property if comp_type in _RLC_COMPONENT_TYPES else None,
+            [member for member in component.members if isinstance(member, PadstackInstance)],
+        )
+
+
+def _pin_data(pin):
+    x, y, _ = pin.get_position_and_rotation()
+    return pin.name, (x.double, y.double), pin.net
+
+
+def _names(edb_objs):
+    """Get the names of EDB objects mapped by ID, fetching the name of each object once."""
+    unique_objs = list({edb_obj.id: edb_obj for edb_obj in edb_objs if not edb_obj.is_null}.values())
+    names = dict(zip([edb_obj.id for edb_obj in unique_objs], batch_get(unique_objs, lambda edb_obj: edb_obj.name)))
+    names[0] = ""
+    return names
+
+
+def _model(component_property):
+    try:
+        return component_property.model
+    except TypeError:
+        return None
+
+
+def _pin_pair_rlcs(model):
+    if not isinstance(model, PinPairModel):
+        return None
+    return {pin_pair: model.rlc(pin_pair) for pin_pair in model.pin_pairs()}
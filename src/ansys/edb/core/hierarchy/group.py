@@ -6,9 +6,11 @@ from ansys.api.edb.v1.group_pb2_grpc import GroupServiceStub
 from ansys.edb.core.edb_defs import LayoutObjType
 from ansys.edb.core.hierarchy.hierarchy_obj import HierarchyObj
 from ansys.edb.core.inner import messages
+from ansys.edb.core.inner.utils import iter_lyt_object_collection
 from ansys.edb.core.inner.utils import query_lyt_object_collection
 from ansys.edb.core.session import StubAccessor
 from ansys.edb.core.session import StubType
+from ansys.edb.core.utility import identity_map
 
 
 class Group(HierarchyObj):
@@ -31,15 +33,18 @@ class Group(HierarchyObj):
         if self.is_null:
             return
 
-        group_type = self.__stub.GetGroupType(self.msg).group_type
-        if group_type == GroupTypeMessage.GroupType.GROUP:
-            return Group(self.msg)
-        elif group_type == GroupTypeMessage.GroupType.COMPONENT:
-            return ComponentGroup(self.msg)
-        elif group_type == GroupTypeMessage.GroupType.STRUCTURE_3D:
-            return Structure3D(self.msg)
-        elif group_type == GroupTypeMessage.GroupType.VIA_GROUP:
-            return ViaGroup(self.msg)
+        def creator():
+            group_type = self.__stub.GetGroupType(self.msg).group_type
+            if group_type == GroupTypeMessage.GroupType.GROUP:
+                return Group(self.msg)
+            elif group_type == GroupTypeMessage.GroupType.COMPONENT:
+                return ComponentGroup(self.msg)
+            elif group_type == GroupTypeMessage.GroupType.STRUCTURE_3D:
+                return Structure3D(self.msg)
+            elif group_type == GroupTypeMessage.GroupType.VIA_GROUP:
+                return ViaGroup(self.msg)
+
+        return identity_map.get_or_create(self, Group, creator)
 
     @classmethod
     def create(cls, layout, name):
@@ -120,3 +125,18 @@ class Group(HierarchyObj):
             self.__stub.StreamMembers,
             False,
         )
+
+    def iter_members(self):
+        """Iterate over all group members as they are streamed from the server.
+
+        Returns
+        -------
+        Iterator of :term:`Connectable`
+        """
+        return iter_lyt_object_collection(
+            self,
+            LayoutObjType.INVALID_LAYOUT_OBJ,
+            self.__stub.GetMembers,
+            self.__stub.StreamMembers,
+            False,
+        )
@@ -5,11 +5,13 @@ from ansys.api.edb.v1 import connectable_pb2
 from ansys.edb.core.edb_defs import LayoutObjType
 from ansys.edb.core.inner import layout_obj
 from ansys.edb.core.inner import messages
+from ansys.edb.core.inner import utils
 from ansys.edb.core.inner.factory import create_lyt_obj
 from ansys.edb.core.layout import mcad_model as mm
 from ansys.edb.core.session import ConnectableServiceStub
 from ansys.edb.core.session import StubAccessor
 from ansys.edb.core.session import StubType
+from ansys.edb.core.utility import identity_map
 
 
 class ConnObj(layout_obj.LayoutObj):
@@ -60,7 +62,7 @@ class ConnObj(layout_obj.LayoutObj):
         -------
         .ConnObj
         """
-        return create_lyt_obj(self.msg, self.obj_type)
+        return identity_map.get_or_create(self, ConnObj, lambda: create_lyt_obj(self.msg, self.obj_type))
 
     @property
     def obj_type(self):
@@ -137,7 +139,8 @@ class ConnObj(layout_obj.LayoutObj):
         """
         from ansys.edb.core.net.net import Net
 
-        return Net(self.__stub.GetNet(self.msg))
+        net_msg = self.__stub.GetNet(self.msg)
+        return identity_map.get_or_create(net_msg, Net, lambda: Net(net_msg))
 
     @net.setter
     def net(self, net):
@@ -148,6 +151,45 @@ class ConnObj(layout_obj.LayoutObj):
             )
         )
 
+    @staticmethod
+    def get_nets(conn_objs):
+        """Get the nets of multiple :term:`Connectable` objects.
+
+        The data of all objects is fetched from the server in chunks rather than with one request per object.
+
+        Parameters
+        ----------
+        conn_objs : list of :term:`Connectable`
+            :term:`Connectable` objects to get the nets of.
+
+        Returns
+        -------
+        list of .Net
+            Net of each :term:`Connectable` object.
+        """
+        return utils.batch_get(conn_objs, lambda conn_obj: conn_obj.net)
+
+    @staticmethod
+    def set_nets(conn_objs, net):
+        """Set the net of multiple :term:`Connectable` objects.
+
+        The requests for all objects are streamed to the server in chunks rather than sent one at a time.
+
+        Parameters
+        ----------
+        conn_objs : list of :term:`Connectable`
+            :term:`Connectable` objects to modify.
+        net : :term:`NetLike` or None
+            Net to assign to the objects.
+        """
+        net_msg = messages.net_ref_message(net)
+        utils.batch_set(
+            StubType.connectable,
+            "SetNet",
+            lambda conn_obj: connectable_pb2.SetNetMessage(target=conn_obj.msg, net=net_msg),
+            conn_objs,
+        )
+
     def create_stride(self):
         """Create a Stride model from an MCAD file.
 
@@ -1,6 +1,7 @@
 """This module allows for the creating of objects while avoid circular imports."""
 
 from ansys.edb.core.edb_defs import LayoutObjType
+from ansys.edb.core.utility import identity_map
 
 _type_creator_params_dict = None
 _primitive_type_creator_params_dict = None
@@ -118,10 +119,14 @@ def _get_terminal_type_creator_dict():
 
 def create_obj(msg, obj_type, do_cast):
     """Create an object from the provided message of the provided type."""
-    obj = obj_type(msg)
-    if do_cast:
-        obj = obj.cast()
-    return obj
+
+    def creator():
+        obj = obj_type(msg)
+        if do_cast:
+            obj = obj.cast()
+        return obj
+
+    return identity_map.get_or_create(msg, obj_type, creator)
 
 
 def create_obj_from_creator_dict(creator_dict, msg, obj_type):
@@ -2,21 +2,31 @@
 
 import abc
 from collections import namedtuple
+from functools import cache
 import logging
+from threading import Lock
+from time import perf_counter
 
+from google.protobuf import message_factory
 from grpc import ClientCallDetails
+from grpc import RpcError
 from grpc import StatusCode
 from grpc import StreamStreamClientInterceptor
 from grpc import UnaryStreamClientInterceptor
 from grpc import UnaryUnaryClientInterceptor
+from grpc import aio
 
 from ansys.edb.core.inner.exceptions import EDBSessionException
 from ansys.edb.core.inner.exceptions import ErrorCode
 from ansys.edb.core.inner.exceptions import InvalidArgumentException
 from ansys.edb.core.inner.rpc_info_utils import can_cache
-from ansys.edb.core.inner.rpc_response_map import get_rpc_response_type
+from ansys.edb.core.inner.rpc_info_utils import get_rpc_info
 from ansys.edb.core.utility.io_manager import ServerNotification
+from ansys.edb.core.utility.io_manager import _HijackedOutcome
 from ansys.edb.core.utility.io_manager import get_io_manager
+from ansys.edb.core.utility.rpc_recording import RecordedRpc
+from ansys.edb.core.utility.tracing import get_tracer
+from ansys.edb.core.utility.tracing import is_tracing
 
 
 class Interceptor(
@@ -87,6 +97,213 @@ class LoggingInterceptor(Interceptor):
                     handler(kv[1])
 
 
+class _StreamTimer:
+    """Iterates over the responses of a streaming RPC, summing the time spent waiting on them.
+
+    The time spent by the caller between responses is excluded, so it does not count as latency of the RPC.
+    """
+
+    def __init__(self, responses):
+        self._responses = iter(responses)
+        self.waited = 0.0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        start = perf_counter()
+        try:
+            return next(self._responses)
+        finally:
+            self.waited += perf_counter() - start
+
+
+class TracingInterceptor(Interceptor):
+    """Wraps each request in a span when a tracer is set."""
+
+    def _post_process(self, response):
+        pass
+
+    @staticmethod
+    def _start_attributes(client_call_details):
+        service_name, rpc_name = client_call_details.method.strip("/").split("/")
+        return f"{service_name}/{rpc_name}", {"rpc.system": "grpc", "rpc.service": service_name, "rpc.method": rpc_name}
+
+    def intercept_unary_unary(self, continuation, client_call_details, request):
+        """Intercept a gRPC call."""
+        if not is_tracing():
+            return continuation(client_call_details, request)
+        name, attributes = self._start_attributes(client_call_details)
+        attributes["edb.request_bytes"] = request.ByteSize()
+        with get_tracer().start_as_current_span(name, attributes=attributes) as span:
+            response = continuation(client_call_details, request)
+            if isinstance(response, _HijackedOutcome):
+                rpc_info = get_rpc_info(attributes["rpc.service"], attributes["rpc.method"])
+                is_buffered = rpc_info is not None and rpc_info.can_buffer
+                span.set_attribute("edb.cache_hit", not is_buffered)
+                span.set_attribute("edb.buffered", is_buffered)
+            else:
+                try:
+                    span.set_attribute("edb.response_bytes", response.result().ByteSize())
+                except RpcError:
+                    pass
+            return response
+
+    @staticmethod
+    def _trace_stream(span, responses):
+        # The span lasts until the caller is done iterating, so the time spent waiting on the server is set apart.
+        responses = _StreamTimer(responses)
+        response_bytes = 0
+        try:
+            for response in responses:
+                response_bytes += response.ByteSize()
+                yield response
+        finally:
+            span.set_attribute("edb.response_bytes", response_bytes)
+            span.set_attribute("edb.wait_time", responses.waited)
+            span.end()
+
+    def intercept_unary_stream(self, continuation, client_call_details, request):
+        """Intercept a gRPC streaming call."""
+        if not is_tracing():
+            return continuation(client_call_details, request)
+        name, attributes = self._start_attributes(client_call_details)
+        attributes["edb.request_bytes"] = request.ByteSize()
+        span = get_tracer().start_span(name, attributes=attributes)
+        return self._trace_stream(span, continuation(client_call_details, request))
+
+    def intercept_stream_stream(self, continuation, client_call_details, request_iterator):
+        """Intercept a gRPC streaming call."""
+        if not is_tracing():
+            return continuation(client_call_details, request_iterator)
+        span = get_tracer().start_span(*self._start_attributes(client_call_details))
+        return self._trace_stream(span, continuation(client_call_details, request_iterator))
+
+
+class ProfilingInterceptor(Interceptor):
+    """Attributes each request to the Python code that triggered it when an RPC profiler is active."""
+
+    def __init__(self, logger, get_profiler):
+        """Initialize a profiling interceptor with a logger and a function getting the active profiler."""
+        super().__init__(logger)
+        self._get_profiler = get_profiler
+
+    def _post_process(self, response):
+        pass
+
+    def intercept_unary_unary(self, continuation, client_call_details, request):
+        """Intercept a gRPC call."""
+        if (profiler := self._get_profiler()) is None:
+            return continuation(client_call_details, request)
+        stack = profiler.capture(client_call_details.method)
+        start = perf_counter()
+        try:
+            return continuation(client_call_details, request)
+        finally:
+            profiler.record(stack, perf_counter() - start)
+
+    def _profile_stream(self, profiler, stack, responses):
+        responses = _StreamTimer(responses)
+        try:
+            yield from responses
+        finally:
+            profiler.record(stack, responses.waited)
+
+    def intercept_unary_stream(self, continuation, client_call_details, request):
+        """Intercept a gRPC streaming call."""
+        if (profiler := self._get_profiler()) is None:
+            return continuation(client_call_details, request)
+        stack = profiler.capture(client_call_details.method)
+        return self._profile_stream(profiler, stack, continuation(client_call_details, request))
+
+    def intercept_stream_stream(self, continuation, client_call_details, request_iterator):
+        """Intercept a gRPC streaming call."""
+        if (profiler := self._get_profiler()) is None:
+            return continuation(client_call_details, request_iterator)
+        stack = profiler.capture(client_call_details.method)
+        return self._profile_stream(profiler, stack, continuation(client_call_details, request_iterator))
+
+
+class RecordingInterceptor(Interceptor):
+    """Writes each request sent to the server and its response to the active RPC recorder."""
+
+    def __init__(self, logger, get_recorder):
+        """Initialize a recording interceptor with a logger and a function getting the active recorder."""
+        super().__init__(logger)
+        self._get_recorder = get_recorder
+
+    def _post_process(self, response):
+        pass
+
+    def intercept_unary_unary(self, continuation, client_call_details, request):
+        """Intercept a gRPC call."""
+        if (recorder := self._get_recorder()) is None:
+            return continuation(client_call_details, request)
+        start = perf_counter()
+        outcome = continuation(client_call_details, request)
+        latency = perf_counter() - start
+        try:
+            responses, code, details = (outcome.result().SerializeToString(),), 0, ""
+        except RpcError as error:
+            responses, code, details = (), error.code().value[0], error.details() or ""
+        recorder.record(
+            RecordedRpc(
+                client_call_details.method,
+                (request.SerializeToString(deterministic=True),),
+                responses,
+                code,
+                details,
+                latency,
+            )
+        )
+        return outcome
+
+    @staticmethod
+    def _record_stream(recorder, client_call_details, requests, responses):
+        start = perf_counter()
+        serialized_responses = []
+        code, details = 0, ""
+        try:
+            for response in responses:
+                serialized_responses.append(response.SerializeToString())
+                yield response
+        except RpcError as error:
+            code, details = error.code().value[0], error.details() or ""
+            raise
+        finally:
+            recorder.record(
+                RecordedRpc(
+                    client_call_details.method,
+                    tuple(requests),
+                    tuple(serialized_responses),
+                    code,
+                    details,
+                    perf_counter() - start,
+                )
+            )
+
+    def intercept_unary_stream(self, continuation, client_call_details, request):
+        """Intercept a gRPC streaming call."""
+        if (recorder := self._get_recorder()) is None:
+            return continuation(client_call_details, request)
+        requests = [request.SerializeToString(deterministic=True)]
+        return self._record_stream(recorder, client_call_details, requests, continuation(client_call_details, request))
+
+    def intercept_stream_stream(self, continuation, client_call_details, request_iterator):
+        """Intercept a gRPC streaming call."""
+        if (recorder := self._get_recorder()) is None:
+            return continuation(client_call_details, request_iterator)
+        requests = []
+
+        def serialized_requests():
+            for request in request_iterator:
+                requests.append(request.SerializeToString(deterministic=True))
+                yield request
+
+        responses = continuation(client_call_details, serialized_requests())
+        return self._record_stream(recorder, client_call_details, requests, responses)
+
+
 class ExceptionInterceptor(Interceptor):
     """Handles general gRPC errors on each request."""
 
@@ -105,22 +322,66 @@ class ExceptionInterceptor(Interceptor):
             raise exception
 
 
+class AsyncExceptionInterceptor(aio.UnaryUnaryClientInterceptor, aio.UnaryStreamClientInterceptor):
+    """Handles general gRPC errors on each request of an asynchronous channel."""
+
+    def __init__(self, logger):
+        """Initialize an asynchronous exception interceptor with a logger."""
+        super().__init__()
+        self._exception_interceptor = ExceptionInterceptor(logger)
+
+    async def intercept_unary_unary(self, continuation, client_call_details, request):
+        """Intercept a gRPC call."""
+        call = await continuation(client_call_details, request)
+        try:
+            await call
+        except aio.AioRpcError as error:
+            self._exception_interceptor._post_process(error)
+            raise
+        return call
+
+    async def intercept_unary_stream(self, continuation, client_call_details, request):
+        """Intercept a gRPC streaming call."""
+        call = await continuation(client_call_details, request)
+
+        async def responses():
+            try:
+                async for response in call:
+                    yield response
+            except aio.AioRpcError as error:
+                self._exception_interceptor._post_process(error)
+                raise
+
+        return responses()
+
+
 class IOInterceptor(Interceptor):
     """Returns cached values if a given request has already been made and caching is enabled."""
 
-    def __init__(self, logger, rpc_counter):
-        """Initialize a caching interceptor with a logger and rpc counter."""
+    def __init__(self, logger, rpc_stats):
+        """Initialize a caching interceptor with a logger and RPC statistics."""
         super().__init__(logger)
-        self._rpc_counter = rpc_counter
-        self._reset_cache_entry_data()
-
-    def _reset_cache_entry_data(self):
-        self._current_rpc_method = ""
-        self._current_cache_key_details = None
-        self._hijacked = False
+        self._rpc_stats = rpc_stats
 
     def _should_log_traffic(self):
-        return self._rpc_counter is not None
+        return self._rpc_stats is not None
+
+    def _log_hijacked(self, client_call_details, is_buffered):
+        if self._should_log_traffic():
+            if is_buffered:
+                self._rpc_stats.record_buffered(client_call_details.method)
+            else:
+                self._rpc_stats.record_cache_hit(client_call_details.method)
+
+    def _log_stream(self, client_call_details, request_bytes, responses):
+        responses = _StreamTimer(responses)
+        response_bytes = 0
+        try:
+            for response in responses:
+                response_bytes += response.ByteSize()
+                yield response
+        finally:
+            self._rpc_stats.record_call(client_call_details.method, responses.waited, request_bytes(), response_bytes)
 
     class _ClientCallDetails(
         namedtuple("_ClientCallDetails", ("method", "timeout", "metadata", "credentials")),
@@ -156,65 +417,92 @@ class IOInterceptor(Interceptor):
 
     @staticmethod
     def _attempt_hijack(*args):
+        """Get the response of the buffer or of the cache, and whether it is from the buffer."""
         io_manager = get_io_manager()
-        hijacked_response = None
         if (buffer := io_manager.buffer) is not None:
-            hijacked_response = buffer.hijack_request(*args)
-        if hijacked_response is None and (cache := io_manager.cache) is not None:
-            hijacked_response = cache.hijack_request(*args)
-        return hijacked_response
+            if (hijacked_response := buffer.hijack_request(*args)) is not None:
+                return hijacked_response, True
+        if (cache := io_manager.cache) is not None:
+            return cache.hijack_request(*args), False
+        return None, False
 
     def _hijack(self, client_call_details, request):
+        """Get the hijacked result of a call, or the cache key details to store its response under.
+
+        The state of each call is returned rather than stored on the interceptor, which is shared by all threads.
+        """
         io_manager = get_io_manager()
         if io_manager.is_enabled and not io_manager.is_blocking:
             with io_manager.manage_io():
                 method_tokens = client_call_details.method.strip("/").split("/")
                 cache_key_details = method_tokens[0], method_tokens[1], request
-                if (hijacked_result := self._attempt_hijack(*cache_key_details)) is not None:
-                    self._hijacked = True
-                    return hijacked_result
-                if io_manager.cache is not None and can_cache(cache_key_details[0], cache_key_details[1]):
-                    self._current_cache_key_details = cache_key_details
+                hijacked_result, is_buffered = self._attempt_hijack(*cache_key_details)
+                if hijacked_result is not None:
+                    self._log_hijacked(client_call_details, is_buffered)
+                    return hijacked_result, None
                 io_manager.add_notification_for_server(ServerNotification.RESET_FUTURE_TRACKING)
-        if self._should_log_traffic():
-            self._current_rpc_method = client_call_details.method
+                if io_manager.cache is not None and can_cache(cache_key_details[0], cache_key_details[1]):
+                    return None, cache_key_details
+        return None, None
 
-    def _continue_unary_unary(self, continuation, client_call_details, request):
-        if (hijacked_result := self._hijack(client_call_details, request)) is not None:
+    def intercept_unary_unary(self, continuation, client_call_details, request):
+        """Intercept a gRPC call."""
+        hijacked_result, cache_key_details = self._hijack(client_call_details, request)
+        if hijacked_result is not None:
             return hijacked_result
-        return super()._continue_unary_unary(
-            continuation,
-            self._get_client_call_details_with_caching_options(client_call_details),
-            request,
-        )
+        start = perf_counter()
+        response = continuation(self._get_client_call_details_with_caching_options(client_call_details), request)
+        if cache_key_details is not None and (cache := get_io_manager().cache) is not None:
+            cache.add(*cache_key_details, response.result())
+        if self._should_log_traffic():
+            latency = perf_counter() - start
+            try:
+                response_bytes = response.result().ByteSize()
+            except RpcError:
+                response_bytes = 0
+            self._rpc_stats.record_call(client_call_details.method, latency, request.ByteSize(), response_bytes)
+        return response
 
     def _post_process(self, response):
-        io_manager = get_io_manager()
-        if (cache := io_manager.cache) is not None and self._current_cache_key_details is not None:
-            cache.add(*self._current_cache_key_details, response.result())
-        if self._should_log_traffic() and not self._hijacked:
-            self._rpc_counter[self._current_rpc_method] += 1
-        self._reset_cache_entry_data()
+        pass
 
     def intercept_unary_stream(self, continuation, client_call_details, request):
         """Intercept a gRPC streaming call."""
-        if (hijacked_result := self._hijack(client_call_details, request)) is not None:
+        if (hijacked_result := self._hijack(client_call_details, request)[0]) is not None:
             return hijacked_result
-        return super().intercept_unary_stream(
+        responses = super().intercept_unary_stream(
             continuation,
             self._get_client_call_details_with_caching_options(client_call_details),
             request,
         )
+        if self._should_log_traffic():
+            request_bytes = request.ByteSize()
+            return self._log_stream(client_call_details, lambda: request_bytes, responses)
+        return responses
 
     def intercept_stream_stream(self, continuation, client_call_details, request_iterator):
         """Intercept a gRPC streaming call."""
-        if (hijacked_result := self._hijack(client_call_details, request_iterator)) is not None:
+        if (hijacked_result := self._hijack(client_call_details, request_iterator)[0]) is not None:
             return hijacked_result
-        return super().intercept_stream_stream(
+        if not self._should_log_traffic():
+            return super().intercept_stream_stream(
+                continuation,
+                self._get_client_call_details_with_caching_options(client_call_details),
+                request_iterator,
+            )
+        request_sizes = []
+
+        def sized_requests():
+            for request in request_iterator:
+                request_sizes.append(request.ByteSize())
+                yield request
+
+        responses = super().intercept_stream_stream(
             continuation,
             self._get_client_call_details_with_caching_options(client_call_details),
-            request_iterator,
+            sized_requests(),
         )
+        return self._log_stream(client_call_details, lambda: sum(request_sizes), responses)
 
 
 class _SharedMemoryResult:
@@ -225,10 +513,23 @@ class _SharedMemoryResult:
         return self._result
 
 
+@cache
+def _get_rpc_response_type(service_name, rpc_name):
+    """Get the response type of an RPC from the descriptor of its service.
+
+    Only the message module defining the service is imported, rather than the message modules of all services.
+    """
+    # Imported here because the session module imports this one.
+    from ansys.edb.core.session import _import_service_messages
+
+    service = _import_service_messages(service_name).DESCRIPTOR.services_by_name[service_name.rsplit(".", 1)[1]]
+    return message_factory.GetMessageClass(service.methods_by_name[rpc_name].output_type)
+
+
 class SharedMemoryInterceptor(Interceptor):
     """Routes RPC calls through a shared-memory transport to EDB_RPC_Server."""
 
-    def __init__(self, logger, transport):
+    def __init__(self, logger, transport, rpc_stats=None):
         """Initialize a shared-memory interceptor.
 
         Parameters
@@ -236,16 +537,28 @@ class SharedMemoryInterceptor(Interceptor):
         logger : logging.Logger
         transport : SharedMemoryTransport
             An already-connected shared-memory transport instance.
+        rpc_stats : RpcStats, default: None
+            Statistics to record each request in.
         """
         super().__init__(logger)
         self._transport = transport
+        self._rpc_stats = rpc_stats
+        # The transport has a single shared-memory region, so only one request can be in flight at a time.
+        self._transport_lock = Lock()
 
     def _continue_unary_unary(self, continuation, client_call_details, request):
         method_tokens = client_call_details.method.strip("/").split("/")
-        response_type = get_rpc_response_type(method_tokens[0], method_tokens[1])
-        success, serialized_response, error_message = self._transport.execute_rpc(
-            method_tokens[0], method_tokens[1], request.SerializeToString()
-        )
+        response_type = _get_rpc_response_type(method_tokens[0], method_tokens[1])
+        serialized_request = request.SerializeToString()
+        start = perf_counter()
+        with self._transport_lock:
+            success, serialized_response, error_message = self._transport.execute_rpc(
+                method_tokens[0], method_tokens[1], serialized_request
+            )
+        if self._rpc_stats is not None:
+            self._rpc_stats.record_call(
+                client_call_details.method, perf_counter() - start, len(serialized_request), len(serialized_response)
+            )
         if success:
             response = response_type()
             response.ParseFromString(serialized_response)
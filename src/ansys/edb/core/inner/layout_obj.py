@@ -8,6 +8,7 @@ import ansys.edb.core.inner.messages as messages
 from ansys.edb.core.session import LayoutObjServiceStub
 from ansys.edb.core.session import StubAccessor
 from ansys.edb.core.session import StubType
+from ansys.edb.core.utility import identity_map
 
 
 class LayoutObj(ObjBase):
@@ -37,6 +38,7 @@ class LayoutObj(ObjBase):
     def delete(self):
         """Delete the layout object."""
         self.__stub.Delete(LayoutObj._layout_obj_target_msg(self, self.layout_obj_type))
+        identity_map.invalidate(self)
 
     def get_product_property(self, prod_id, attr_id):
         """Get the product property of the layout object for a given product ID and attribute ID.
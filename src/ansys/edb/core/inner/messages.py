@@ -1,5 +1,7 @@
 """Protobuf interface for message creatia."""
 
+import numbers
+
 from ansys.api.edb.v1 import arc_data_pb2
 from ansys.api.edb.v1.cell_instance_pb2 import CellInstanceCreationMessage
 from ansys.api.edb.v1.cell_instance_pb2 import CellInstanceParameterOverride
@@ -1029,6 +1031,13 @@ def value_message(val):
     elif isinstance(val, complex):
         msg.constant.real = val.real
         msg.constant.imag = val.imag
+    elif isinstance(val, numbers.Real):
+        # NumPy scalars and other numeric types registered with the numbers module
+        msg.constant.real = float(val)
+        msg.constant.imag = 0
+    elif isinstance(val, numbers.Complex):
+        msg.constant.real = float(val.real)
+        msg.constant.imag = float(val.imag)
     else:
         raise TypeError(f"Invalid Value. Received {val}")
     return msg
@@ -1,8 +1,14 @@
 """This module contains utility functions for API development work."""
 
+from collections.abc import Iterable
+from contextlib import contextmanager
+from contextlib import nullcontext
+from importlib import import_module
+
 from ansys.api.edb.v1.layout_obj_pb2 import LayoutObjTargetMessage
 
 from ansys.edb.core.inner.factory import create_lyt_obj
+from ansys.edb.core.utility.tracing import get_tracer
 
 
 def map_list(iterable_to_operate_on, operator=None):
@@ -37,19 +43,186 @@ def query_lyt_object_collection(owner, obj_type, unary_rpc, unary_streaming_rpc,
         for item in edb_obj_collection_msg.items:
             items.append(create_lyt_obj(item, obj_type))
 
-    if cache is None:
-        add_msgs_to_items(unary_rpc(request))
-    else:
-        for streamed_items in unary_streaming_rpc(request):
-            add_msgs_to_items(streamed_items)
+    span_attributes = {"edb.collection.type": obj_type.name, "edb.collection.streamed": cache is not None}
+    with get_tracer().start_as_current_span("edb.collection", attributes=span_attributes) as span:
+        if cache is None:
+            add_msgs_to_items(unary_rpc(request))
+        else:
+            for streamed_items in unary_streaming_rpc(request):
+                add_msgs_to_items(streamed_items)
+        span.set_attribute("edb.collection.items", len(items))
     return items
 
 
+def iter_lyt_object_collection(owner, obj_type, unary_rpc, unary_streaming_rpc, request_requires_type=True):
+    """For the provided request, yield the objects of a collection as they are streamed from the server.
+
+    Only the chunk currently being processed is held in memory, so iteration can be stopped early without creating \
+    the remaining objects.
+    """
+    from ansys.edb.core.session import is_in_memory
+
+    request = LayoutObjTargetMessage(target=owner.msg, type=obj_type.value) if request_requires_type else owner.msg
+    streamed = not is_in_memory()
+    span_attributes = {"edb.collection.type": obj_type.name, "edb.collection.streamed": streamed}
+    # The span is not made current because it lasts across the iterations of the caller.
+    span = get_tracer().start_span("edb.collection", attributes=span_attributes)
+    item_count = 0
+    try:
+        edb_obj_collection_msgs = unary_streaming_rpc(request) if streamed else (unary_rpc(request),)
+        for edb_obj_collection_msg in edb_obj_collection_msgs:
+            for item in edb_obj_collection_msg.items:
+                item_count += 1
+                yield create_lyt_obj(item, obj_type)
+    finally:
+        span.set_attribute("edb.collection.items", item_count)
+        span.end()
+
+
+def batch_get(edb_objs, getter):
+    """Apply the getter to each of the provided objects after fetching the data of all the objects from the server \
+    in chunks.
+
+    The fetched data is added to the active cache if caching is enabled.
+    """
+    from ansys.edb.core.utility.io_manager import get_io_manager
+
+    edb_objs = list(edb_objs)
+    with get_io_manager().prefetch(edb_objs):
+        return [getter(edb_obj) for edb_obj in edb_objs]
+
+
+@contextmanager
+def cached_reads():
+    """Cache the data of objects fetched from the server within the context manager.
+
+    Collections are streamed along with the cached data of their items. If the IO manager is already active, \
+    its settings are used instead.
+    """
+    from ansys.edb.core.utility.io_manager import IOMangementType
+    from ansys.edb.core.utility.io_manager import enable_io_manager
+    from ansys.edb.core.utility.io_manager import get_io_manager
+
+    with nullcontext() if get_io_manager().is_enabled else enable_io_manager(IOMangementType.READ):
+        yield
+
+
+@contextmanager
+def buffered_writes():
+    """Buffer the write requests made within the context manager and send them to the server in chunks on exit.
+
+    If the IO manager is already active, its settings are used instead.
+    """
+    from ansys.edb.core.utility.io_manager import IOMangementType
+    from ansys.edb.core.utility.io_manager import enable_io_manager
+    from ansys.edb.core.utility.io_manager import get_io_manager
+
+    with nullcontext() if get_io_manager().is_enabled else enable_io_manager(IOMangementType.WRITE):
+        yield
+
+
+def _get_service_name(stub_type):
+    """Get the full name of the service corresponding to the provided stub type."""
+    stub_cls = stub_type.stub_class
+    pb2_module = import_module(stub_cls.__module__.removesuffix("_grpc"))
+    return pb2_module.DESCRIPTOR.services_by_name[stub_cls.__name__.removesuffix("Stub")].full_name
+
+
+def batch_set(stub_type, rpc_name, request_creator, edb_objs, *args):
+    """Send the write requests created for each of the provided objects to the server in chunks rather than with \
+    one request per object.
+
+    The request for each object is created by calling ``request_creator(edb_obj, *arg_entries)``, where each entry of
+    ``arg_entries`` is taken from the corresponding sequence in ``args``.
+    """
+    from ansys.edb.core.session import StubAccessor
+    from ansys.edb.core.session import is_in_memory
+    from ansys.edb.core.utility.io_manager import get_io_manager
+
+    requests = [request_creator(*entry) for entry in zip(edb_objs, *args, strict=True)]
+    if is_in_memory():
+        rpc = getattr(StubAccessor(stub_type).__get__(), rpc_name)
+        for request in requests:
+            rpc(request)
+    else:
+        get_io_manager().stream_write_requests(_get_service_name(stub_type), rpc_name, requests)
+
+
+def batch_create(stub_type, rpc_name, requests, follow_up=None):
+    """Send the provided creation requests to the server in chunks rather than with one request per object.
+
+    Parameters
+    ----------
+    stub_type : .StubType
+    rpc_name : str
+    requests : list
+    follow_up : tuple of (.StubType, str, callable), optional
+        Stub type, RPC name, and request creator of a write request sent right after the creation request of each
+        object. The request creator is called with the message of the object and its index.
+
+    Returns
+    -------
+    list of EDBObjMessage
+        Message of each created object. If a buffer is active, the messages are futures that are resolved when the
+        buffer is flushed.
+    """
+    from ansys.edb.core.session import StubAccessor
+    from ansys.edb.core.session import is_in_memory
+    from ansys.edb.core.utility.io_manager import get_io_manager
+
+    if is_in_memory():
+        rpc = getattr(StubAccessor(stub_type).__get__(), rpc_name)
+        created_msgs = [rpc(request) for request in requests]
+        if follow_up is not None:
+            follow_up_stub_type, follow_up_rpc_name, follow_up_request_creator = follow_up
+            follow_up_rpc = getattr(StubAccessor(follow_up_stub_type).__get__(), follow_up_rpc_name)
+            for idx, created_msg in enumerate(created_msgs):
+                if created_msg.id != 0:
+                    follow_up_rpc(follow_up_request_creator(created_msg, idx))
+        return created_msgs
+    if follow_up is not None:
+        follow_up_stub_type, follow_up_rpc_name, follow_up_request_creator = follow_up
+        follow_up = _get_service_name(follow_up_stub_type), follow_up_rpc_name, follow_up_request_creator
+    return get_io_manager().stream_create_requests(_get_service_name(stub_type), rpc_name, requests, follow_up)
+
+
+def broadcast(arg, count):
+    """Return a list of ``count`` entries from an argument that is either a single value or a sequence of values.
+
+    Strings are treated as single values. Sequences, including NumPy arrays, must contain exactly ``count`` entries.
+    """
+    if isinstance(arg, str) or not isinstance(arg, Iterable):
+        return [arg] * count
+    entries = list(arg)
+    if len(entries) != count:
+        raise ValueError(f"Expected {count} entries. Received {len(entries)}.")
+    return entries
+
+
+def point_coordinates(point):
+    """Return the x and y coordinates of a point-like object, such as a ``PointData`` object, a tuple, or a row of \
+    a NumPy array.
+    """
+    if hasattr(point, "x") and hasattr(point, "y"):
+        return point.x, point.y
+    x, y = point
+    return x, y
+
+
+def iter_items_from_server(parser, stream, chunk_items_att_name):
+    """Yield the items from the provided unary server stream as they arrive, converted to \
+    the corresponding pyedb-core data type using the provided parser.
+    """
+    for chunk in stream:
+        for chunk_entry in getattr(chunk, chunk_items_att_name):
+            yield parser(chunk_entry)
+
+
 def stream_items_from_server(parser, stream, chunk_items_att_name):
     """Stream all items from the provided unary server stream and convert them to \
     the corresponding pyedb-core data type using the provided parser.
     """
-    return [parser(chunk_entry) for chunk in stream for chunk_entry in getattr(chunk, chunk_items_att_name)]
+    return list(iter_items_from_server(parser, stream, chunk_items_att_name))
 
 
 def client_stream_iterator(
@@ -3,6 +3,7 @@
 import ansys.api.edb.v1.variable_server_pb2 as variable_server_msgs
 
 from ansys.edb.core.inner.messages import value_message
+from ansys.edb.core.layer.layer import _invalidate_stackup_snapshots
 from ansys.edb.core.session import get_variable_server_stub
 from ansys.edb.core.utility.value import Value
 
@@ -69,6 +70,7 @@ class VariableServer:
             isparam=is_param,
         )
         get_variable_server_stub().AddVariable(temp)
+        _invalidate_stackup_snapshots()
 
     def add_menu_variable(self, name, values, is_param=False, index=0):
         """Add a menu variable.
@@ -97,6 +99,7 @@ class VariableServer:
             index=index,
         )
         get_variable_server_stub().AddMenuVariable(temp)
+        _invalidate_stackup_snapshots()
 
     def delete_variable(self, name):
         """Delete a variable.
@@ -108,6 +111,7 @@ class VariableServer:
         """
         temp = variable_server_msgs.VariableNameMessage(variable_owner=self._variable_owner_msg, name=name)
         get_variable_server_stub().DeleteVariable(temp)
+        _invalidate_stackup_snapshots()
 
     def set_variable_value(self, name, new_value):
         """Set a variable to a new value.
@@ -123,6 +127,8 @@ class VariableServer:
             variable_owner=self._variable_owner_msg, name=name, value=value_message(new_value)
         )
         get_variable_server_stub().SetVariableValue(temp)
+        # Layer elevations and thicknesses can depend on the variable.
+        _invalidate_stackup_snapshots()
 
     def get_variable_value(self, name):
         """Get the value for a given variable.
@@ -12,6 +12,7 @@ from ansys.edb.core.inner.messages import get_product_property_message
 from ansys.edb.core.inner.messages import set_product_property_message
 from ansys.edb.core.session import StubAccessor
 from ansys.edb.core.session import StubType
+from ansys.edb.core.utility import identity_map
 
 
 # Message creation helper method
@@ -20,6 +21,20 @@ def _is_in_zone_message(lyr, zone):
     return layer_pb2.ZoneMessage(layer=lyr.msg, zone=zone)
 
 
+_stackup_revision = 0
+
+
+def _invalidate_stackup_snapshots():
+    """Invalidate the stackup snapshots of all layer collections after a layer modification."""
+    global _stackup_revision
+    _stackup_revision += 1
+
+
+def _get_stackup_revision():
+    """Get the revision that stackup snapshots are compared against to determine if they are up to date."""
+    return _stackup_revision
+
+
 class LayerType(Enum):
     """Provides an enum representing the types of layers."""
 
@@ -89,14 +104,17 @@ class Layer(ObjBase):
         from ansys.edb.core.layer.stackup_layer import StackupLayer
         from ansys.edb.core.layer.via_layer import ViaLayer
 
-        lyr = Layer(self.msg)
-        if lyr.is_stackup_layer:
-            if lyr.is_via_layer:
-                return ViaLayer(self.msg)
+        def creator():
+            lyr = Layer(self.msg)
+            if lyr.is_stackup_layer:
+                if lyr.is_via_layer:
+                    return ViaLayer(self.msg)
+                else:
+                    return StackupLayer(self.msg)
             else:
-                return StackupLayer(self.msg)
-        else:
-            return lyr
+                return lyr
+
+        return identity_map.get_or_create(self, Layer, creator)
 
     @staticmethod
     def create(name, lyr_type):
@@ -123,6 +141,8 @@ class Layer(ObjBase):
     @type.setter
     def type(self, lyr_type):
         self.__stub.SetLayerType(layer_pb2.SetLayerTypeMessage(layer=self.msg, type=lyr_type.value))
+        identity_map.invalidate(self)
+        _invalidate_stackup_snapshots()
 
     @property
     def is_stackup_layer(self):
@@ -153,6 +173,7 @@ class Layer(ObjBase):
     @name.setter
     def name(self, name):
         self.__stub.SetName(layer_pb2.SetNameMessage(layer=self.msg, name=name))
+        _invalidate_stackup_snapshots()
 
     def clone(self, copy_id=True):
         """Create a clone of the layer.
@@ -1,6 +1,7 @@
 """Layer collection."""
 
 from enum import Enum
+import weakref
 
 import ansys.api.edb.v1.layer_collection_pb2 as layer_collection_pb2
 
@@ -8,10 +9,24 @@ from ansys.edb.core.inner import ObjBase
 from ansys.edb.core.inner.messages import get_product_property_ids_message
 from ansys.edb.core.inner.messages import get_product_property_message
 from ansys.edb.core.inner.messages import set_product_property_message
+from ansys.edb.core.inner.utils import batch_get
+from ansys.edb.core.inner.utils import stream_items_from_server
 from ansys.edb.core.layer.layer import Layer
 from ansys.edb.core.layer.layer import LayerType
+from ansys.edb.core.layer.layer import _get_stackup_revision
+from ansys.edb.core.layer.layer import _invalidate_stackup_snapshots
 from ansys.edb.core.layer.stackup_layer import StackupLayer
+from ansys.edb.core.layer.stackup_snapshot import SnapshotLayer
+from ansys.edb.core.layer.stackup_snapshot import StackupSnapshot
+from ansys.edb.core.session import get_current_session
 from ansys.edb.core.session import get_layer_collection_stub
+from ansys.edb.core.session import is_in_memory
+
+# Stackup snapshots by layer collection ID, stored per session, and the stackup revision that they were taken at.
+# Layouts return a new layer collection object on each access, so snapshots are not cached on the objects. Sessions
+# are held weakly, so their snapshots are released with them.
+_snapshots = weakref.WeakKeyDictionary()
+_snapshots_revision = None
 
 
 class LayerCollectionMode(Enum):
@@ -86,6 +101,7 @@ class LayerCollection(ObjBase):
         get_layer_collection_stub().SetMode(
             layer_collection_pb2.SetLayerCollectionModeMessage(layer_collection=self.msg, mode=mode.value)
         )
+        _invalidate_stackup_snapshots()
 
     def add_layers(self, layers):
         """Add a list of layers to the layer collection.
@@ -99,6 +115,7 @@ class LayerCollection(ObjBase):
         get_layer_collection_stub().AddLayers(
             layer_collection_pb2.AddLayersMessage(layer_collection=self.msg, layers=layer_msgs)
         )
+        _invalidate_stackup_snapshots()
 
     def import_from_control_file(self, control_file_path, schema_file_path=None):
         """Import layers from a control file and optional XML schema file.
@@ -116,6 +133,7 @@ class LayerCollection(ObjBase):
         if schema_file_path is not None:
             import_msg.schema_path = schema_file_path
         get_layer_collection_stub().ImportFromControlFile(import_msg)
+        _invalidate_stackup_snapshots()
 
     def _add_layer(self, layer, above_below=None, add_top=None):
         """Pack layer addition arguments into the ``AddLayersMessage`` object and send to the server."""
@@ -127,7 +145,9 @@ class LayerCollection(ObjBase):
             add_layer_msg.above_below_msg.CopyFrom(above_below_msg)
         elif add_top is not None:
             add_layer_msg.add_top = add_top
-        return Layer(get_layer_collection_stub().AddLayer(add_layer_msg)).cast()
+        added_layer = Layer(get_layer_collection_stub().AddLayer(add_layer_msg)).cast()
+        _invalidate_stackup_snapshots()
+        return added_layer
 
     def _add_layer_relative(self, layer, relative_layer_name, add_above):
         """Add a layer above or below another layer."""
@@ -346,6 +366,36 @@ class LayerCollection(ObjBase):
 
         return [Layer(msg).cast() for msg in response.items]
 
+    def snapshot(self):
+        """Get an immutable, client-side snapshot of the layers in the layer collection.
+
+        The layers are streamed from the server and the data of all layers is fetched in chunks rather than with \
+        one request per layer and property. The snapshot is cached by layer collection ID and reused until a layer \
+        is modified through a setter, a layer is added to a layer collection, a layout is given a new layer \
+        collection, a variable is added, changed, or deleted, or a database is closed.
+
+        Returns
+        -------
+        .StackupSnapshot
+            Snapshot of the stackup indexed by layer name, layer ID, and elevation.
+        """
+        global _snapshots_revision
+        if _snapshots_revision != (revision := _get_stackup_revision()):
+            _snapshots.clear()
+            _snapshots_revision = revision
+        session_snapshots = _snapshots.setdefault(get_current_session(), {})
+        if (snapshot := session_snapshots.get(self.id)) is None:
+            request = layer_collection_pb2.GetLayersMessage(
+                layer_collection=self.msg,
+                layer_filter=LayerCollection._get_layer_filter_from_layer_type_set(LayerTypeSet.ALL_LAYER_SET),
+            )
+            if is_in_memory():
+                layers = [Layer(msg) for msg in get_layer_collection_stub().GetLayers(request).items]
+            else:
+                layers = stream_items_from_server(Layer, get_layer_collection_stub().StreamLayers(request), "items")
+            snapshot = session_snapshots[self.id] = StackupSnapshot(batch_get(layers, SnapshotLayer.from_layer))
+        return snapshot
+
     def get_product_property(self, prod_id, attr_it):
         """Get the product property of the layer collection for a given product ID and attribute ID.
 
@@ -421,6 +471,7 @@ class LayerCollection(ObjBase):
         -------
         StackupLayer
         """
+        _invalidate_stackup_snapshots()
         return StackupLayer(
             get_layer_collection_stub().MergeDielectrics(
                 layer_collection_pb2.MergeDielectricsMessage(
@@ -518,6 +569,7 @@ class LayerCollection(ObjBase):
         list[StackupLayer]
             List of dielectric layers created during the dielectric simplification process.
         """
+        _invalidate_stackup_snapshots()
         simplified_lyrs = (
             get_layer_collection_stub()
             .SimplifyDielectricsForPhi(
@@ -545,3 +597,4 @@ class LayerCollection(ObjBase):
             layer_collection=self.msg, layer=layer.msg, zone=zone, in_zone=in_zone
         )
         get_layer_collection_stub().AddZoneToLayer(request)
+        _invalidate_stackup_snapshots()
@@ -6,6 +6,7 @@ import ansys.api.edb.v1.stackup_layer_pb2 as stackup_layer_pb2
 
 from ansys.edb.core.inner import messages
 from ansys.edb.core.layer.layer import Layer
+from ansys.edb.core.layer.layer import _invalidate_stackup_snapshots
 from ansys.edb.core.session import get_stackup_layer_stub
 from ansys.edb.core.utility.value import Value
 
@@ -101,6 +102,7 @@ class StackupLayer(Layer):
         get_stackup_layer_stub().SetNegative(
             stackup_layer_pb2.SetNegativeMessage(layer=self.msg, is_negative=is_negative)
         )
+        _invalidate_stackup_snapshots()
 
     @property
     def thickness(self):
@@ -113,6 +115,7 @@ class StackupLayer(Layer):
     @thickness.setter
     def thickness(self, thickness):
         get_stackup_layer_stub().SetThickness(_stackup_layer_value_message(self, thickness))
+        _invalidate_stackup_snapshots()
 
     @property
     def lower_elevation(self):
@@ -125,6 +128,7 @@ class StackupLayer(Layer):
     @lower_elevation.setter
     def lower_elevation(self, lower_elevation):
         get_stackup_layer_stub().SetLowerElevation(_stackup_layer_value_message(self, lower_elevation))
+        _invalidate_stackup_snapshots()
 
     @property
     def upper_elevation(self):
@@ -158,6 +162,7 @@ class StackupLayer(Layer):
             New name of the material.
         """
         get_stackup_layer_stub().SetMaterial(_set_layer_material_name_message(self, material_name))
+        _invalidate_stackup_snapshots()
 
     def get_fill_material(self, evaluated=True):
         """Get the name of the fill material of the layer.
@@ -183,6 +188,7 @@ class StackupLayer(Layer):
             New name of the fill material.
         """
         get_stackup_layer_stub().SetFillMaterial(_set_layer_material_name_message(self, fill_material_name))
+        _invalidate_stackup_snapshots()
 
     @property
     def roughness_enabled(self):
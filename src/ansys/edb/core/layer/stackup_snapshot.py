@@ -0,0 +1,225 @@
+"""Stackup snapshot."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from bisect import bisect_right
+from typing import TYPE_CHECKING
+from typing import NamedTuple
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from collections.abc import Iterator
+
+from ansys.edb.core.layer.layer import Layer
+from ansys.edb.core.layer.layer import LayerType
+from ansys.edb.core.layer.stackup_layer import StackupLayer
+from ansys.edb.core.layer.via_layer import ViaLayer
+
+
+class SnapshotLayer(NamedTuple):
+    """Represents the data of a layer captured in a :class:`StackupSnapshot`.
+
+    The elevation, thickness, material and negative fields are ``None`` for non-stackup layers.
+    """
+
+    layer: Layer
+    """:class:`.Layer`: Layer the data was captured from."""
+    name: str
+    """:obj:`str`: Name of the layer."""
+    layer_id: int
+    """:obj:`int`: ID of the layer."""
+    type: LayerType
+    """:class:`.LayerType`: Type of the layer."""
+    is_via_layer: bool
+    """:obj:`bool`: Flag indicating if the layer is a :class:`.ViaLayer` instance."""
+    lower_elevation: float | None = None
+    """:obj:`float`: Lower elevation of the layer."""
+    upper_elevation: float | None = None
+    """:obj:`float`: Upper elevation of the layer."""
+    thickness: float | None = None
+    """:obj:`float`: Thickness of the layer."""
+    material: str | None = None
+    """:obj:`str`: Name of the material of the layer."""
+    fill_material: str | None = None
+    """:obj:`str`: Name of the fill material of the layer."""
+    negative: bool | None = None
+    """:obj:`bool`: Flag indicating if the layer is a negative layer."""
+
+    @property
+    def is_stackup_layer(self) -> bool:
+        """:obj:`bool`: Flag indicating if the layer is a :class:`.StackupLayer` instance."""
+        return self.lower_elevation is not None
+
+    @classmethod
+    def from_layer(cls, layer: Layer) -> SnapshotLayer:
+        """Capture the data of a layer.
+
+        Parameters
+        ----------
+        layer : .Layer
+            Layer to capture the data of.
+
+        Returns
+        -------
+        SnapshotLayer
+        """
+        layer = layer.cast()
+        if not isinstance(layer, StackupLayer):
+            return cls(layer, layer.name, layer.layer_id, layer.type, False)
+        return cls(
+            layer,
+            layer.name,
+            layer.layer_id,
+            layer.type,
+            isinstance(layer, ViaLayer),
+            layer.lower_elevation.double,
+            layer.upper_elevation.double,
+            layer.thickness.double,
+            layer.get_material(),
+            layer.get_fill_material(),
+            layer.negative,
+        )
+
+
+class StackupSnapshot:
+    """Represents an immutable, client-side view of the layers of a layer collection.
+
+    The snapshot is indexed by layer name and ID. Non-via stackup layers are additionally sorted by lower \
+    elevation so that the layer at a given elevation can be found without querying the server.
+    """
+
+    def __init__(self, layers: Iterable[SnapshotLayer]):
+        """Initialize a stackup snapshot.
+
+        Parameters
+        ----------
+        layers : Iterable[SnapshotLayer]
+            Data of the layers in layer collection order.
+        """
+        self._layers = tuple(layers)
+        self._by_name = {lyr.name: lyr for lyr in self._layers}
+        self._by_id = {lyr.layer_id: lyr for lyr in self._layers}
+        self._stackup_layers = tuple(
+            sorted(
+                (lyr for lyr in self._layers if lyr.is_stackup_layer and not lyr.is_via_layer),
+                key=lambda lyr: (lyr.lower_elevation, lyr.upper_elevation),
+            )
+        )
+        self._lower_elevations = [lyr.lower_elevation for lyr in self._stackup_layers]
+        self._max_upper_elevations = []
+        for lyr in self._stackup_layers:
+            prev_max = self._max_upper_elevations[-1] if self._max_upper_elevations else lyr.upper_elevation
+            self._max_upper_elevations.append(max(prev_max, lyr.upper_elevation))
+
+    def __len__(self) -> int:
+        """Get the number of layers in the snapshot."""
+        return len(self._layers)
+
+    def __iter__(self) -> Iterator[SnapshotLayer]:
+        """Iterate over the layers in layer collection order."""
+        return iter(self._layers)
+
+    def __getitem__(self, name: str) -> SnapshotLayer:
+        """Get a layer by name, raising a ``KeyError`` if it does not exist."""
+        return self._by_name[name]
+
+    def __contains__(self, name: str) -> bool:
+        """Check if a layer with the provided name is in the snapshot."""
+        return name in self._by_name
+
+    @property
+    def layers(self) -> tuple[SnapshotLayer, ...]:
+        """:obj:`tuple` of :class:`SnapshotLayer`: All layers in layer collection order.
+
+        This property is read-only.
+        """
+        return self._layers
+
+    @property
+    def stackup_layers(self) -> tuple[SnapshotLayer, ...]:
+        """:obj:`tuple` of :class:`SnapshotLayer`: Non-via stackup layers sorted by ascending elevation.
+
+        This property is read-only.
+        """
+        return self._stackup_layers
+
+    @property
+    def via_layers(self) -> tuple[SnapshotLayer, ...]:
+        """:obj:`tuple` of :class:`SnapshotLayer`: Via layers in layer collection order.
+
+        This property is read-only.
+        """
+        return tuple(lyr for lyr in self._layers if lyr.is_via_layer)
+
+    def find_by_name(self, name: str) -> SnapshotLayer | None:
+        """Find a layer by name.
+
+        Parameters
+        ----------
+        name : str
+            Name of the layer.
+
+        Returns
+        -------
+        SnapshotLayer or None
+            Layer found or ``None`` if no layer has the provided name.
+        """
+        return self._by_name.get(name)
+
+    def find_by_id(self, layer_id: int) -> SnapshotLayer | None:
+        """Find a layer by ID.
+
+        Parameters
+        ----------
+        layer_id : int
+            ID of the layer.
+
+        Returns
+        -------
+        SnapshotLayer or None
+            Layer found or ``None`` if no layer has the provided ID.
+        """
+        return self._by_id.get(layer_id)
+
+    def layer_at_elevation(self, elevation: float) -> SnapshotLayer | None:
+        """Find the stackup layer containing an elevation.
+
+        The lookup is a binary search over the layers sorted by lower elevation. Elevations lying on the boundary \
+        of two layers resolve to the upper layer. In collections with overlapping layers, the layer with the \
+        highest lower elevation containing the elevation is returned.
+
+        Parameters
+        ----------
+        elevation : float
+            Elevation to look up.
+
+        Returns
+        -------
+        SnapshotLayer or None
+            Layer containing the elevation or ``None`` if the elevation is outside of the stackup.
+        """
+        idx = bisect_right(self._lower_elevations, elevation) - 1
+        while idx >= 0 and self._max_upper_elevations[idx] >= elevation:
+            if elevation <= (lyr := self._stackup_layers[idx]).upper_elevation:
+                return lyr
+            idx -= 1
+        return None
+
+    def layers_between(self, lower_elevation: float, upper_elevation: float) -> tuple[SnapshotLayer, ...]:
+        """Get the stackup layers overlapping an elevation range.
+
+        Parameters
+        ----------
+        lower_elevation : float
+            Lower bound of the elevation range.
+        upper_elevation : float
+            Upper bound of the elevation range.
+
+        Returns
+        -------
+        tuple of SnapshotLayer
+            Non-via stackup layers overlapping the range sorted by ascending elevation.
+        """
+        end = bisect_left(self._lower_elevations, upper_elevation)
+        return tuple(lyr for lyr in self._stackup_layers[:end] if lyr.upper_elevation > lower_elevation)
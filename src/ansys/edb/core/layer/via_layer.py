@@ -12,6 +12,7 @@ import ansys.api.edb.v1.via_layer_pb2 as via_layer_pb2
 from ansys.edb.core.inner.messages import bool_property_message
 from ansys.edb.core.inner.messages import int_property_message
 from ansys.edb.core.inner.messages import value_message
+from ansys.edb.core.layer.layer import _invalidate_stackup_snapshots
 from ansys.edb.core.layer.stackup_layer import StackupLayer
 from ansys.edb.core.session import get_via_layer_stub
 from ansys.edb.core.utility.value import Value
@@ -83,6 +84,7 @@ class ViaLayer(StackupLayer):
                 new_ref_layer=ref_layer.msg,
             )
         )
+        _invalidate_stackup_snapshots()
 
     @property
     def is_tsv(self) -> bool:
@@ -15,6 +15,7 @@ from ansys.edb.core.primitive.primitive import Primitive
 from ansys.edb.core.session import StubAccessor
 from ansys.edb.core.session import StubType
 from ansys.edb.core.simulation_setup.simulation_setup import SimulationSetup
+from ansys.edb.core.utility import identity_map
 from ansys.edb.core.utility.hfss_extent_info import HfssExtentInfo
 from ansys.edb.core.utility.hfss_extent_info import HFSSExtentInfoType
 from ansys.edb.core.utility.hfss_extent_info import OpenRegionType
@@ -214,6 +215,7 @@ class Cell(ObjBase, variable_server.VariableServer):
     def delete(self):
         """Delete the cell."""
         self.__stub.Delete(self.msg)
+        identity_map.clear()
 
     @property
     def database(self):
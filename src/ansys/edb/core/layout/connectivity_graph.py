@@ -0,0 +1,266 @@
+"""Connectivity graph."""
+
+from __future__ import annotations
+
+from array import array
+from enum import Enum
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from ansys.edb.core.layout.layout import Layout
+    from ansys.edb.core.net.net import Net
+    from ansys.edb.core.primitive.padstack_instance import PadstackInstance
+    from ansys.edb.core.primitive.primitive import Primitive
+
+from ansys.edb.core.hierarchy.component_group import ComponentGroup
+from ansys.edb.core.inner.conn_obj import ConnObj
+from ansys.edb.core.inner.utils import batch_get
+from ansys.edb.core.inner.utils import cached_reads
+from ansys.edb.core.utility.identity_map import enable_identity_map
+
+
+class GraphNodeType(Enum):
+    """Enum representing the types of nodes in a :class:`ConnectivityGraph`.
+
+    Nodes are indexed by type in the order of the enum values.
+    """
+
+    NET = 0
+    COMPONENT = 1
+    PADSTACK_INSTANCE = 2
+    PRIMITIVE = 3
+
+
+class ConnectivityGraph:
+    """Represents the connectivity of a layout as an undirected graph in compressed sparse row (CSR) format.
+
+    Nets, components, padstack instances, and primitives are the nodes of the graph and share a single integer \
+    index space. Nets are connected to the padstack instances and primitives on them, and components are connected \
+    to the padstack instances that are their pins.
+
+    The neighbors of node ``i`` are ``indices[indptr[i]:indptr[i + 1]]``. Both arrays are :class:`array.array` \
+    objects, so they can be wrapped without copying, for example with ``numpy.frombuffer(graph.indices, "q")`` or \
+    ``scipy.sparse.csr_matrix((data, graph.indices, graph.indptr))``.
+    """
+
+    def __init__(
+        self,
+        nets: Iterable[Net],
+        components: Iterable[ComponentGroup],
+        padstack_instances: Iterable[PadstackInstance],
+        primitives: Iterable[Primitive],
+        edges: Iterable[tuple[int, int]],
+        net_names: Iterable[str],
+        component_names: Iterable[str],
+    ):
+        """Initialize a connectivity graph.
+
+        Parameters
+        ----------
+        nets : Iterable[.Net]
+            Nets of the graph.
+        components : Iterable[.ComponentGroup]
+            Components of the graph.
+        padstack_instances : Iterable[.PadstackInstance]
+            Padstack instances of the graph.
+        primitives : Iterable[.Primitive]
+            Primitives of the graph.
+        edges : Iterable[tuple[int, int]]
+            Pairs of connected node indices. Each edge is added in both directions.
+        net_names : Iterable[str]
+            Names of the nets.
+        component_names : Iterable[str]
+            Names of the components.
+        """
+        self._nodes = (tuple(nets), tuple(components), tuple(padstack_instances), tuple(primitives))
+        self._offsets = [0]
+        for nodes in self._nodes:
+            self._offsets.append(self._offsets[-1] + len(nodes))
+        self._net_index = {name: idx for idx, name in enumerate(net_names)}
+        self._component_index = {
+            name: idx + self._offsets[GraphNodeType.COMPONENT.value] for idx, name in enumerate(component_names)
+        }
+        adjacency = [[] for _ in range(len(self))]
+        for node_1, node_2 in edges:
+            adjacency[node_1].append(node_2)
+            adjacency[node_2].append(node_1)
+        self._indptr = array("q", [0])
+        self._indices = array("q")
+        for neighbors in adjacency:
+            self._indices.extend(sorted(neighbors))
+            self._indptr.append(len(self._indices))
+
+    @classmethod
+    def from_layout(cls, layout: Layout) -> ConnectivityGraph:
+        """Fetch the connectivity of a layout.
+
+        The nets of all padstack instances and primitives, the pins of all components, and the names of all nets \
+        and components are fetched from the server in chunks rather than with one request per object.
+
+        Parameters
+        ----------
+        layout : .Layout
+            Layout to fetch the connectivity of.
+
+        Returns
+        -------
+        ConnectivityGraph
+        """
+        with cached_reads(), enable_identity_map():
+            nets = layout.nets
+            components = [group for group in layout.groups if isinstance(group, ComponentGroup)]
+            padstack_instances = layout.padstack_instances
+            primitives = layout.primitives
+            conn_objs = padstack_instances + primitives
+            conn_obj_nets = ConnObj.get_nets(conn_objs)
+            component_pin_ids = batch_get(components, lambda comp: [member.id for member in comp.members])
+            net_names = batch_get(nets, lambda net: net.name)
+            component_names = batch_get(components, lambda comp: comp.name)
+        component_offset = len(nets)
+        conn_obj_offset = component_offset + len(components)
+        net_nodes = {net.id: idx for idx, net in enumerate(nets)}
+        pin_nodes = {pin.id: idx + conn_obj_offset for idx, pin in enumerate(padstack_instances)}
+        edges = [
+            (net_nodes[net.id], idx + conn_obj_offset) for idx, net in enumerate(conn_obj_nets) if net.id in net_nodes
+        ]
+        edges.extend(
+            (idx + component_offset, pin_nodes[pin_id])
+            for idx, pin_ids in enumerate(component_pin_ids)
+            for pin_id in pin_ids
+            if pin_id in pin_nodes
+        )
+        return cls(nets, components, padstack_instances, primitives, edges, net_names, component_names)
+
+    def __len__(self) -> int:
+        """Get the number of nodes in the graph."""
+        return self._offsets[-1]
+
+    @property
+    def indptr(self) -> array:
+        """:class:`array.array`: Offsets of the neighbors of each node in :attr:`indices`, of length ``len(graph) + 1``.
+
+        This property is read-only.
+        """
+        return self._indptr
+
+    @property
+    def indices(self) -> array:
+        """:class:`array.array`: Indices of the neighbors of all nodes, sorted by node.
+
+        This property is read-only.
+        """
+        return self._indices
+
+    @property
+    def net_index(self) -> dict[str, int]:
+        """:obj:`dict` of :obj:`str` to :obj:`int`: Node indices of the nets mapped by net name.
+
+        This property is read-only.
+        """
+        return self._net_index
+
+    @property
+    def component_index(self) -> dict[str, int]:
+        """:obj:`dict` of :obj:`str` to :obj:`int`: Node indices of the components mapped by component name.
+
+        This property is read-only.
+        """
+        return self._component_index
+
+    def node_range(self, node_type: GraphNodeType) -> range:
+        """Get the range of node indices of a node type.
+
+        Parameters
+        ----------
+        node_type : GraphNodeType
+            Type of the nodes.
+
+        Returns
+        -------
+        range
+        """
+        return range(self._offsets[node_type.value], self._offsets[node_type.value + 1])
+
+    def node_type(self, node: int) -> GraphNodeType:
+        """Get the type of a node.
+
+        Parameters
+        ----------
+        node : int
+            Index of the node.
+
+        Returns
+        -------
+        GraphNodeType
+        """
+        if not 0 <= node < len(self):
+            raise IndexError(f"Node index {node} is out of range.")
+        return next(node_type for node_type in GraphNodeType if node < self._offsets[node_type.value + 1])
+
+    def node(self, node: int) -> Net | ComponentGroup | PadstackInstance | Primitive:
+        """Get the EDB object of a node.
+
+        Parameters
+        ----------
+        node : int
+            Index of the node.
+
+        Returns
+        -------
+        .Net or .ComponentGroup or .PadstackInstance or .Primitive
+        """
+        node_type = self.node_type(node)
+        return self._nodes[node_type.value][node - self._offsets[node_type.value]]
+
+    def neighbors(self, node: int) -> array:
+        """Get the indices of the neighbors of a node.
+
+        Parameters
+        ----------
+        node : int
+            Index of the node.
+
+        Returns
+        -------
+        array.array
+        """
+        return self._indices[self._indptr[node] : self._indptr[node + 1]]
+
+    def connected_nodes(
+        self,
+        node: int,
+        cross_node_types: Iterable[GraphNodeType] = (
+            GraphNodeType.NET,
+            GraphNodeType.PADSTACK_INSTANCE,
+            GraphNodeType.PRIMITIVE,
+        ),
+    ) -> set[int]:
+        """Get the indices of all nodes reachable from a node, including the node itself.
+
+        By default, the traversal doesn't cross components, so the nets connected by the pins of a component are not \
+        reached from one another.
+
+        Parameters
+        ----------
+        node : int
+            Index of the node to start from.
+        cross_node_types : Iterable[GraphNodeType], default: all types except ``COMPONENT``
+            Types of the nodes that the traversal can continue through. Reached nodes of other types are included \
+            in the result, but their neighbors are not visited. The start node is always traversed.
+
+        Returns
+        -------
+        set of int
+        """
+        crossed_ranges = [self.node_range(node_type) for node_type in set(cross_node_types)]
+        visited = {node}
+        stack = [node]
+        while stack:
+            for neighbor in self.neighbors(stack.pop()):
+                if neighbor not in visited:
+                    visited.add(neighbor)
+                    if any(neighbor in crossed_range for crossed_range in crossed_ranges):
+                        stack.append(neighbor)
+        return visited
@@ -6,9 +6,12 @@ from typing import TYPE_CHECKING
 from typing import Union
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from ansys.edb.core.geometry.polygon_data import ExtentType
     from ansys.edb.core.geometry.polygon_data import PolygonData
     from ansys.edb.core.layout.cell import Cell
+    from ansys.edb.core.layout.connectivity_graph import ConnectivityGraph
     from ansys.edb.core.net.net import Net
     from ansys.edb.core.typing import LayerLike
     from ansys.edb.core.typing import NetLike
@@ -17,6 +20,7 @@ if TYPE_CHECKING:
 
     LayerListLike = Union[LayerLike, list[LayerLike]]
     from ansys.edb.core.hierarchy.cell_instance import CellInstance
+    from ansys.edb.core.hierarchy.components_table import ComponentsTable
     from ansys.edb.core.hierarchy.group import Group
     from ansys.edb.core.hierarchy.pin_group import PinGroup
     from ansys.edb.core.layout.voltage_regulator import VoltageRegulator
@@ -40,6 +44,7 @@ from ansys.edb.core.inner import messages
 from ansys.edb.core.inner import parser
 from ansys.edb.core.inner import utils
 from ansys.edb.core.inner import variable_server
+from ansys.edb.core.layer.layer import _invalidate_stackup_snapshots
 from ansys.edb.core.layer.layer_collection import LayerCollection
 from ansys.edb.core.layout.mcad_model import McadModel
 from ansys.edb.core.layout_instance import layout_instance
@@ -118,11 +123,16 @@ class Layout(ObjBase, variable_server.VariableServer):
         self.__stub.SetLayerCollection(
             layout_pb2.SetLayerCollectionMessage(layout=self.msg, layer_collection=layer_collection.msg)
         )
+        _invalidate_stackup_snapshots()
 
     def _get_items(self, lyt_obj_type_enum):
         """Get a list of layout objects."""
         return utils.query_lyt_object_collection(self, lyt_obj_type_enum, self.__stub.GetItems, self.__stub.StreamItems)
 
+    def _iter_items(self, lyt_obj_type_enum):
+        """Get a generator of layout objects that are yielded as they are streamed from the server."""
+        return utils.iter_lyt_object_collection(self, lyt_obj_type_enum, self.__stub.GetItems, self.__stub.StreamItems)
+
     @property
     def primitives(self) -> list[Primitive]:
         """:obj:`list` of :class:`.Primitive`: List of all primitives in the layout.
@@ -211,6 +221,133 @@ class Layout(ObjBase, variable_server.VariableServer):
         """
         return self._get_items(LayoutObjType.EXTENDED_NET)
 
+    def iter_primitives(self) -> Iterator[Primitive]:
+        """Iterate over all primitives in the layout as they are streamed from the server.
+
+        Returns
+        -------
+        Iterator of .Primitive
+        """
+        return self._iter_items(LayoutObjType.PRIMITIVE)
+
+    def iter_padstack_instances(self) -> Iterator[PadstackInstance]:
+        """Iterate over all padstack instances in the layout as they are streamed from the server.
+
+        Returns
+        -------
+        Iterator of .PadstackInstance
+        """
+        return self._iter_items(LayoutObjType.PADSTACK_INSTANCE)
+
+    def iter_terminals(self) -> Iterator[Terminal]:
+        """Iterate over all terminals in the layout as they are streamed from the server.
+
+        Returns
+        -------
+        Iterator of .Terminal
+        """
+        return self._iter_items(LayoutObjType.TERMINAL)
+
+    def iter_cell_instances(self) -> Iterator[CellInstance]:
+        """Iterate over all cell instances in the layout as they are streamed from the server.
+
+        Returns
+        -------
+        Iterator of .CellInstance
+        """
+        return self._iter_items(LayoutObjType.CELL_INSTANCE)
+
+    def iter_nets(self) -> Iterator[Net]:
+        """Iterate over all nets in the layout as they are streamed from the server.
+
+        Returns
+        -------
+        Iterator of .Net
+        """
+        return self._iter_items(LayoutObjType.NET)
+
+    def iter_groups(self) -> Iterator[Group]:
+        """Iterate over all groups in the layout as they are streamed from the server.
+
+        Returns
+        -------
+        Iterator of .Group
+        """
+        return self._iter_items(LayoutObjType.GROUP)
+
+    def iter_net_classes(self) -> Iterator[NetClass]:
+        """Iterate over all net classes in the layout as they are streamed from the server.
+
+        Returns
+        -------
+        Iterator of .NetClass
+        """
+        return self._iter_items(LayoutObjType.NET_CLASS)
+
+    def iter_differential_pairs(self) -> Iterator[DifferentialPair]:
+        """Iterate over all differential pairs in the layout as they are streamed from the server.
+
+        Returns
+        -------
+        Iterator of .DifferentialPair
+        """
+        return self._iter_items(LayoutObjType.DIFFERENTIAL_PAIR)
+
+    def iter_pin_groups(self) -> Iterator[PinGroup]:
+        """Iterate over all pin groups in the layout as they are streamed from the server.
+
+        Returns
+        -------
+        Iterator of .PinGroup
+        """
+        return self._iter_items(LayoutObjType.PIN_GROUP)
+
+    def iter_voltage_regulators(self) -> Iterator[VoltageRegulator]:
+        """Iterate over all voltage regulators in the layout as they are streamed from the server.
+
+        Returns
+        -------
+        Iterator of .VoltageRegulator
+        """
+        return self._iter_items(LayoutObjType.VOLTAGE_REGULATOR)
+
+    def iter_extended_nets(self) -> Iterator[ExtendedNet]:
+        """Iterate over all extended nets in the layout as they are streamed from the server.
+
+        Returns
+        -------
+        Iterator of .ExtendedNet
+        """
+        return self._iter_items(LayoutObjType.EXTENDED_NET)
+
+    def components_table(self) -> ComponentsTable:
+        """Get the names, definitions, types, RLC values, placement layers, and pins of all components in the layout.
+
+        The data is fetched from the server in chunks rather than with one request per component, pin, and property.
+
+        Returns
+        -------
+        .ComponentsTable
+            Column-oriented view of the components, with one entry per component in each column.
+        """
+        from ansys.edb.core.hierarchy.components_table import ComponentsTable
+
+        return ComponentsTable.from_layout(self)
+
+    def connectivity_graph(self) -> ConnectivityGraph:
+        """Get the connectivity of the nets, components, padstack instances, and primitives in the layout.
+
+        The data is fetched from the server in chunks rather than with one request per object.
+
+        Returns
+        -------
+        .ConnectivityGraph
+            Graph in compressed sparse row (CSR) format with integer-indexed nodes.
+        """
+        from ansys.edb.core.layout.connectivity_graph import ConnectivityGraph
+
+        return ConnectivityGraph.from_layout(self)
+
     @parser.to_polygon_data
     def expanded_extent(
         self,
@@ -3,8 +3,15 @@
 from __future__ import annotations
 
 from typing import TYPE_CHECKING
+from typing import NamedTuple
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from ansys.edb.core.geometry.triangle3d_data import Triangle3DData
+    from ansys.edb.core.layer.layer import Layer
+    from ansys.edb.core.layout_instance.layout_obj_instance import LayoutObjInstance
+    from ansys.edb.core.layout_instance.layout_obj_instance_geometry import LayoutObjInstanceGeometry
     from ansys.edb.core.typing import LayerLike
     from ansys.edb.core.typing import NetLike
 
@@ -21,10 +28,39 @@ from ansys.edb.core.inner.messages import polygon_data_message
 from ansys.edb.core.inner.messages import strings_message
 from ansys.edb.core.inner.utils import client_stream_iterator
 from ansys.edb.core.layout_instance import layout_obj_instance
+from ansys.edb.core.layout_instance.layout_obj_instance_2d_geometry import LayoutObjInstance2DGeometry
 from ansys.edb.core.session import LayoutInstanceServiceStub
 from ansys.edb.core.session import StubAccessor
 from ansys.edb.core.session import StubType
 from ansys.edb.core.session import is_in_memory
+from ansys.edb.core.utility.identity_map import enable_identity_map
+
+_GEOMETRY_CHUNK_SIZE = 256
+
+
+class FetchedGeometry(NamedTuple):
+    """Represents a geometry returned by :meth:`LayoutInstance.fetch_geometries`."""
+
+    instance: LayoutObjInstance
+    """:class:`.LayoutObjInstance`: Layout object instance the geometry belongs to."""
+    layout_obj_id: int
+    """:obj:`int`: ID of the layout object of the layout object instance."""
+    layer: Layer
+    """:class:`.Layer`: Layer the geometry is on."""
+    geometry: LayoutObjInstanceGeometry
+    """:class:`.LayoutObjInstance2DGeometry` or :class:`.LayoutObjInstance3DGeometry`: Geometry."""
+    data: PolygonData | list[Triangle3DData]
+    """:class:`.PolygonData` or :obj:`list` of :class:`.Triangle3DData`: Polygon data of a 2D geometry or \
+    tessellation data of a 3D geometry."""
+
+
+def _layer_filter(layers):
+    if layers is None:
+        return None
+    layers = utils.ensure_is_list(layers)
+    layer_names = {layer for layer in layers if isinstance(layer, str)}
+    layer_ids = {layer.id for layer in layers if not isinstance(layer, str)}
+    return lambda layer: layer.id in layer_ids or (bool(layer_names) and layer.name in layer_names)
 
 
 class LayoutInstance(ObjBase):
@@ -195,3 +231,57 @@ class LayoutInstance(ObjBase):
             )
         )
         return utils.map_list(hits.items, layout_obj_instance.LayoutObjInstance)
+
+    @staticmethod
+    def fetch_geometries(
+        instances: list[LayoutObjInstance],
+        layers: LayerLike | list[LayerLike] = None,
+        apply_negatives: bool = False,
+        include_3d: bool = True,
+        chunk_size: int = _GEOMETRY_CHUNK_SIZE,
+    ) -> Iterator[FetchedGeometry]:
+        """Iterate over the geometries of many layout object instances.
+
+        The layers, geometries, and polygon or tessellation data of the layout object instances are fetched from the \
+        server in chunks of instances as iteration progresses rather than with one request per object. No IO manager \
+        state is held between chunks, so multiple iterators can be interleaved.
+
+        Parameters
+        ----------
+        instances : list of .LayoutObjInstance
+            Layout object instances to get the geometries of, such as the hits of \
+            :meth:`query_layout_obj_instances`.
+        layers : :term:`LayerLike` or list of :term:`LayerLike`, default: None
+            Layers to get the geometries on. The default is ``None``, in which case all layers are used.
+        apply_negatives : bool, default: False
+            Whether to apply negatives to the polygon data of 2D geometries.
+        include_3d : bool, default: True
+            Whether to include 3D geometries.
+        chunk_size : int, default: 256
+            Number of layout object instances to fetch the geometries of at a time.
+
+        Yields
+        ------
+        FetchedGeometry
+        """
+        layer_filter = _layer_filter(layers)
+
+        def get_data(geometry):
+            if isinstance(geometry, LayoutObjInstance2DGeometry):
+                return geometry.get_polygon_data(apply_negatives)
+            return geometry.tesselation_data
+
+        for start in range(0, len(instances), chunk_size):
+            chunk = instances[start : start + chunk_size]
+            with enable_identity_map():
+                inst_geometries = utils.batch_get(
+                    chunk, lambda inst: (inst._layout_obj_id(), inst._layer_geometries(layer_filter))
+                )
+                fetched = [
+                    (inst, obj_id, layer, geometry)
+                    for inst, (obj_id, layer_geometries) in zip(chunk, inst_geometries)
+                    for layer, geometry in layer_geometries
+                    if include_3d or isinstance(geometry, LayoutObjInstance2DGeometry)
+                ]
+                data = utils.batch_get([entry[-1] for entry in fetched], get_data)
+            yield from (FetchedGeometry(*entry, geometry_data) for entry, geometry_data in zip(fetched, data))
@@ -97,3 +97,15 @@ class LayoutObjInstance(ObjBase):
             Bounding box of the layout object instance.
         """
         return self.__stub.GetBBox(bool_property_message(self, local))
+
+    def _layout_obj_id(self):
+        return self.__stub.GetLayoutObj(self.msg).id
+
+    def _layer_geometries(self, layer_filter=None):
+        """Get the geometries of the layout object instance paired with their layer, optionally filtered by layer."""
+        return [
+            (layer, geometry)
+            for layer in self.layers
+            if layer_filter is None or layer_filter(layer)
+            for geometry in self.get_geometries(layer)
+        ]
@@ -1,5 +1,7 @@
 """Layout object instance 3D geometry."""
 
+from array import array
+
 from ansys.edb.core.geometry.triangle3d_data import Triangle3DData
 from ansys.edb.core.inner import utils
 from ansys.edb.core.inner.parser import to_point3d_data
@@ -31,3 +33,47 @@ class LayoutObjInstance3DGeometry(LayoutObjInstanceGeometry):
             )
 
         return utils.map_list(tesselation_data.tesselation_data, to_3d_triangle)
+
+    def _tesselation_buffers(self, indexed=False):
+        """Decode the tessellation data into flat coordinate and, optionally, index buffers."""
+        coords = array("d")
+        for triangle_msg in self.__stub.GetTesselationData(self.msg).tesselation_data:
+            for point_msg in (triangle_msg.point_1, triangle_msg.point_2, triangle_msg.point_3):
+                coords.extend((point_msg.x.constant.real, point_msg.y.constant.real, point_msg.z.constant.real))
+        if not indexed:
+            return coords
+        vertex_indices = {}
+        indices = array("q")
+        for i in range(0, len(coords), 3):
+            indices.append(vertex_indices.setdefault(tuple(coords[i : i + 3]), len(vertex_indices)))
+        vertices = array("d")
+        for vertex in vertex_indices:
+            vertices.extend(vertex)
+        return vertices, indices
+
+    def tesselation_arrays(self, indexed=False):
+        """Get the tessellation data of the geometry as NumPy arrays.
+
+        The coordinates are decoded straight from the server response without creating a \
+        :class:`.Triangle3DData` object per triangle. This method requires NumPy, which is installed with the \
+        ``numpy`` extra, for example ``pip install ansys-edb-core[numpy]``.
+
+        Parameters
+        ----------
+        indexed : bool, default: False
+            Whether to return deduplicated vertices and an index buffer instead of the coordinates of each triangle.
+
+        Returns
+        -------
+        numpy.ndarray or tuple of (numpy.ndarray, numpy.ndarray)
+            If ``indexed`` is ``False``, a ``(T, 3, 3)`` array of ``float64`` with the coordinates of the three \
+            vertices of each of the ``T`` triangles. Otherwise, a ``(V, 3)`` array of ``float64`` with the \
+            coordinates of the ``V`` unique vertices and a ``(T, 3)`` array of ``int64`` with the vertex indices of \
+            each triangle.
+        """
+        import numpy as np
+
+        if not indexed:
+            return np.frombuffer(self._tesselation_buffers(), np.float64).reshape(-1, 3, 3)
+        vertices, indices = self._tesselation_buffers(indexed=True)
+        return np.frombuffer(vertices, np.float64).reshape(-1, 3), np.frombuffer(indices, np.int64).reshape(-1, 3)
@@ -8,6 +8,8 @@ from ansys.edb.core.session import NetServiceStub
 from ansys.edb.core.session import StubAccessor
 from ansys.edb.core.session import StubType
 
+_GEOMETRY_CHUNK_SIZE = 256
+
 
 class Net(layout_obj.LayoutObj):
     """Represents a net."""
@@ -22,6 +24,12 @@ class Net(layout_obj.LayoutObj):
             self, obj_type, self.__stub.GetLayoutObjects, self.__stub.StreamLayoutObjects
         )
 
+    def _iter_layout_objs(self, obj_type):
+        """Get a generator of layout objects on a net that are yielded as they are streamed from the server."""
+        return utils.iter_lyt_object_collection(
+            self, obj_type, self.__stub.GetLayoutObjects, self.__stub.StreamLayoutObjects
+        )
+
     @classmethod
     def create(cls, layout, name):
         """Create a net.
@@ -102,6 +110,57 @@ class Net(layout_obj.LayoutObj):
         """
         return self._layout_objs(LayoutObjType.TERMINAL)
 
+    def iter_primitives(self):
+        """Iterate over all primitives on the net as they are streamed from the server.
+
+        Returns
+        -------
+        Iterator of .Primitive
+        """
+        return self._iter_layout_objs(LayoutObjType.PRIMITIVE)
+
+    def iter_padstack_instances(self):
+        """Iterate over all padstack instances on the net as they are streamed from the server.
+
+        Returns
+        -------
+        Iterator of .PadstackInstance
+        """
+        return self._iter_layout_objs(LayoutObjType.PADSTACK_INSTANCE)
+
+    def iter_terminals(self):
+        """Iterate over all terminals on the net as they are streamed from the server.
+
+        Returns
+        -------
+        Iterator of .Terminal
+        """
+        return self._iter_layout_objs(LayoutObjType.TERMINAL)
+
+    def stream_geometry(self, layers=None, chunk_size=_GEOMETRY_CHUNK_SIZE):
+        """Iterate over the 2D geometries of all layout object instances on the net.
+
+        The layout object instances on the net are queried once and their geometries are then fetched with \
+        :meth:`.LayoutInstance.fetch_geometries`, so the generators of multiple nets can be interleaved.
+
+        Parameters
+        ----------
+        layers : :term:`LayerLike` or list of :term:`LayerLike`, default: None
+            Layers to get the geometries on. The default is ``None``, in which case all layers are used.
+        chunk_size : int, default: 256
+            Number of layout object instances to fetch the geometries of at a time.
+
+        Yields
+        ------
+        tuple of (.Layer, int, .PolygonData)
+            Layer of the geometry, ID of the layout object that the geometry belongs to, and polygon data of the \
+            geometry. 3D geometries are skipped.
+        """
+        layout_instance = self.layout.layout_instance
+        instances = layout_instance.query_layout_obj_instances(layer_filter=layers, net_filter=self)
+        for fetched in layout_instance.fetch_geometries(instances, layers, include_3d=False, chunk_size=chunk_size):
+            yield fetched.layer, fetched.layout_obj_id, fetched.data
+
     @property
     def terminal_instances(self):
         """:obj:`list` of :class:`.Layer`: All terminal instances on the net object instance."""
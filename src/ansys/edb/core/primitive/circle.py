@@ -5,10 +5,13 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from ansys.edb.core.geometry.polygon_data import PolygonData
     from ansys.edb.core.layout.layout import Layout
     from ansys.edb.core.typing import LayerLike
     from ansys.edb.core.typing import NetLike
+    from ansys.edb.core.typing import PointLike
     from ansys.edb.core.typing import ValueLike
 
 from ansys.api.edb.v1 import circle_pb2
@@ -16,6 +19,7 @@ from ansys.api.edb.v1 import circle_pb2_grpc
 
 from ansys.edb.core.inner import messages
 from ansys.edb.core.inner import parser
+from ansys.edb.core.inner import utils
 from ansys.edb.core.primitive.primitive import Primitive
 from ansys.edb.core.session import StubAccessor
 from ansys.edb.core.session import StubType
@@ -72,6 +76,56 @@ class Circle(Primitive):
             )
         )
 
+    @classmethod
+    def create_many(
+        cls,
+        layout: Layout,
+        layer: LayerLike,
+        net: NetLike | None,
+        centers: Iterable[PointLike],
+        radii: ValueLike | Iterable[ValueLike],
+    ) -> list[Circle]:
+        """Create multiple circles.
+
+        The creation requests are streamed to the server in chunks rather than sent one at a time. Array-like
+        arguments such as NumPy arrays are accepted.
+
+        Parameters
+        ----------
+        layout : .Layout
+            Layout to create the circles in.
+        layer : :term:`LayerLike`
+            Layer to place the circles on.
+        net : :term:`NetLike` or None
+            Net of the circles.
+        centers : list of :term:`Point2DLike`
+            Center point of each circle. An array of shape ``(N, 2)`` is accepted.
+        radii : :term:`ValueLike` or list of :term:`ValueLike`
+            Radius of each circle or a single radius for all circles.
+
+        Returns
+        -------
+        list of Circle
+            Circles created. If a write buffer is active, the circles are resolved when the buffer is flushed.
+            Circles that failed to be created are null.
+        """
+        centers = list(centers)
+        layout_msg, layer_msg, net_msg = layout.msg, messages.layer_ref_message(layer), messages.net_ref_message(net)
+        requests = [
+            circle_pb2.CircleCreationMessage(
+                layout=layout_msg,
+                layer=layer_msg,
+                net=net_msg,
+                center_x=messages.value_message(center_x),
+                center_y=messages.value_message(center_y),
+                radius=messages.value_message(radius),
+            )
+            for (center_x, center_y), radius in zip(
+                map(utils.point_coordinates, centers), utils.broadcast(radii, len(centers))
+            )
+        ]
+        return [Circle(msg) for msg in utils.batch_create(StubType.circle, "Create", requests)]
+
     @classmethod
     @parser.to_polygon_data
     def render(cls, center_x: ValueLike, center_y: ValueLike, radius: ValueLike, is_hole: bool) -> PolygonData:
@@ -7,10 +7,13 @@ from typing import Literal
 from typing import overload
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from ansys.edb.core.hierarchy.pin_group import PinGroup
     from ansys.edb.core.layout.layout import Layout
     from ansys.edb.core.typing import LayerLike
     from ansys.edb.core.typing import NetLike
+    from ansys.edb.core.typing import PointLike
     from ansys.edb.core.typing import ValueLike
 
 
@@ -21,8 +24,10 @@ from ansys.api.edb.v1 import padstack_instance_pb2_grpc
 
 from ansys.edb.core.definition.padstack_def import PadstackDef
 from ansys.edb.core.edb_defs import LayoutObjType
+from ansys.edb.core.inner import LOGGER
 from ansys.edb.core.inner import conn_obj
 from ansys.edb.core.inner import messages
+from ansys.edb.core.inner import utils
 from ansys.edb.core.layer.layer import Layer
 from ansys.edb.core.session import StubAccessor
 from ansys.edb.core.session import StubType
@@ -112,6 +117,96 @@ class PadstackInstance(conn_obj.ConnObj):
         padstack_instance.set_position_and_rotation(position_x, position_y, rotation)
         return padstack_instance
 
+    @classmethod
+    def create_many(
+        cls,
+        layout: Layout,
+        padstack_def: PadstackDef,
+        top_layer: LayerLike,
+        bottom_layer: LayerLike,
+        positions: Iterable[PointLike],
+        names: str | Iterable[str] | None = None,
+        nets: NetLike | Iterable[NetLike] | None = None,
+        rotation: ValueLike = 0.0,
+        solder_ball_layer: LayerLike | None = None,
+        layer_map: LayerMap | None = None,
+    ) -> list[PadstackInstance]:
+        """Create multiple padstack instances sharing the same definition, layer range, and rotation.
+
+        This is intended for via arrays, stitching vias, and BGA breakouts. The creation requests are streamed to
+        the server in chunks rather than sent one at a time. Array-like arguments such as NumPy arrays are accepted.
+
+        Parameters
+        ----------
+        layout : .Layout
+            Layout to create the padstack instances in.
+        padstack_def : .PadstackDef
+            Padstack definition of the padstack instances.
+        top_layer : :term:`LayerLike`
+            Top layer of the padstack instances.
+        bottom_layer : :term:`LayerLike`
+            Bottom layer of the padstack instances.
+        positions : list of :term:`Point2DLike`
+            Position of each padstack instance. An array of shape ``(N, 2)`` is accepted.
+        names : str or list of str or None, default: None
+            Name of each padstack instance or a single name for all padstack instances. ``None`` leaves the names \
+            empty.
+        nets : :term:`NetLike` or list of :term:`NetLike` or None, default: None
+            Net of each padstack instance or a single net for all padstack instances.
+        rotation : :term:`ValueLike`, default: 0.0
+            Rotation of the padstack instances.
+        solder_ball_layer : :term:`LayerLike` or None, default: None
+            Solder ball layer of the padstack instances or ``None`` for none.
+        layer_map : .LayerMap or None, default: None
+            Layer map of the padstack instances. ``None`` or empty results in auto-mapping.
+
+        Returns
+        -------
+        list of PadstackInstance
+            Padstack instances created. A failure to create one padstack instance does not abort the batch.
+            Padstack instances that failed to be created are null. If a write buffer is active, the padstack
+            instances are resolved when the buffer is flushed.
+        """
+        positions = list(positions)
+        count = len(positions)
+        names = [""] * count if names is None else utils.broadcast(names, count)
+        net_msgs = [messages.net_ref_message(net) for net in utils.broadcast(nets, count)]
+        rotation_msg = messages.value_message(rotation)
+        common_fields = dict(
+            layout=layout.msg,
+            padstack_def=padstack_def.msg,
+            rotation=rotation_msg,
+            top_layer=messages.layer_ref_message(top_layer),
+            bottom_layer=messages.layer_ref_message(bottom_layer),
+            solder_ball_layer=messages.layer_ref_message(solder_ball_layer),
+            layer_map=messages.edb_obj_message(layer_map),
+        )
+        requests = [
+            padstack_instance_pb2.PadstackInstCreateMessage(net=net_msg, name=name, **common_fields)
+            for name, net_msg in zip(names, net_msgs)
+        ]
+        position_msgs = [messages.point_message(utils.point_coordinates(position)) for position in positions]
+
+        def position_request_creator(padstack_instance_msg, idx):
+            return padstack_instance_pb2.PadstackInstSetPositionAndRotationMessage(
+                target=padstack_instance_msg,
+                params=padstack_instance_pb2.PadstackInstPositionAndRotationMessage(
+                    position=position_msgs[idx],
+                    rotation=rotation_msg,
+                ),
+            )
+
+        created_msgs = utils.batch_create(
+            StubType.padstack_instance,
+            "Create",
+            requests,
+            (StubType.padstack_instance, "SetPositionAndRotation", position_request_creator),
+        )
+        padstack_instances = [PadstackInstance(msg) for msg in created_msgs]
+        if num_failures := sum(1 for msg in created_msgs if msg.id == 0 and not msg.is_future):
+            LOGGER.warning(f"Failed to create {num_failures} of {count} padstack instances.")
+        return padstack_instances
+
     @property
     def padstack_def(self) -> PadstackDef:
         """:class:`.PadstackDef`: \
@@ -154,6 +249,28 @@ class PadstackInstance(conn_obj.ConnObj):
             Value(params.rotation),
         )
 
+    @staticmethod
+    def get_positions_and_rotations(
+        padstack_instances: list[PadstackInstance],
+    ) -> list[tuple[Value, Value, Value]]:
+        """Get the positions and rotations of multiple padstack instances.
+
+        The data of all padstack instances is fetched from the server in chunks rather than with one request per \
+        padstack instance.
+
+        Parameters
+        ----------
+        padstack_instances : list of .PadstackInstance
+            Padstack instances to get the positions and rotations of.
+
+        Returns
+        -------
+        list of tuple of (.Value, .Value, .Value)
+            Position and rotation of each padstack instance in the format returned by \
+            :meth:`get_position_and_rotation`.
+        """
+        return utils.batch_get(padstack_instances, lambda inst: inst.get_position_and_rotation())
+
     def set_position_and_rotation(self, x: ValueLike, y: ValueLike, rotation: ValueLike):
         """Set the position and rotation of the padstack instance.
 
@@ -176,6 +293,44 @@ class PadstackInstance(conn_obj.ConnObj):
             )
         )
 
+    @staticmethod
+    def set_positions(
+        padstack_instances: list[PadstackInstance],
+        xs: list[ValueLike],
+        ys: list[ValueLike],
+        rotations: list[ValueLike],
+    ):
+        """Set the positions and rotations of multiple padstack instances.
+
+        The requests for all padstack instances are streamed to the server in chunks rather than sent one at a time.
+
+        Parameters
+        ----------
+        padstack_instances : list of .PadstackInstance
+            Padstack instances to modify.
+        xs : list of :term:`ValueLike`
+            X coordinate of each padstack instance.
+        ys : list of :term:`ValueLike`
+            Y coordinate of each padstack instance.
+        rotations : list of :term:`ValueLike`
+            Rotation in radians of each padstack instance.
+        """
+        utils.batch_set(
+            StubType.padstack_instance,
+            "SetPositionAndRotation",
+            lambda inst, x, y, rotation: padstack_instance_pb2.PadstackInstSetPositionAndRotationMessage(
+                target=inst.msg,
+                params=padstack_instance_pb2.PadstackInstPositionAndRotationMessage(
+                    position=messages.point_message((x, y)),
+                    rotation=messages.value_message(rotation),
+                ),
+            ),
+            padstack_instances,
+            xs,
+            ys,
+            rotations,
+        )
+
     def get_layer_range(self) -> tuple[Layer, Layer]:
         """Get the top and bottom layers of the padstack instance.
 
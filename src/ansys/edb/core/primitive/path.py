@@ -5,6 +5,8 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from ansys.edb.core.geometry.polygon_data import PolygonData
     from ansys.edb.core.layout.layout import Layout
     from ansys.edb.core.typing import LayerLike
@@ -18,6 +20,7 @@ from ansys.api.edb.v1 import path_pb2_grpc
 
 from ansys.edb.core.inner import messages
 from ansys.edb.core.inner import parser
+from ansys.edb.core.inner import utils
 from ansys.edb.core.primitive.primitive import Primitive
 from ansys.edb.core.session import StubAccessor
 from ansys.edb.core.session import StubType
@@ -100,6 +103,64 @@ class Path(Primitive):
             )
         )
 
+    @classmethod
+    def create_many(
+        cls,
+        layout: Layout,
+        layer: LayerLike,
+        net: NetLike | None,
+        widths: ValueLike | Iterable[ValueLike],
+        end_cap1: PathEndCapType,
+        end_cap2: PathEndCapType,
+        corner_style: PathCornerType,
+        center_lines: Iterable[PolygonData],
+    ) -> list[Path]:
+        """Create multiple paths sharing the same end cap and corner styles.
+
+        The creation requests are streamed to the server in chunks rather than sent one at a time.
+
+        Parameters
+        ----------
+        layout : .Layout
+            Layout to create the paths in.
+        layer : :term:`LayerLike`
+            Layer to place the paths on.
+        net : :term:`NetLike` or None
+            Net of the paths.
+        widths : :term:`ValueLike` or list of :term:`ValueLike`
+            Width of each path or a single width for all paths.
+        end_cap1 : .PathEndCapType
+            End cap style for the start of the paths.
+        end_cap2 : .PathEndCapType
+            End cap style for the end of the paths.
+        corner_style : .PathCornerType
+            Corner style.
+        center_lines : list of .PolygonData
+            Centerline polygon data of each path.
+
+        Returns
+        -------
+        list of Path
+            Paths created. If a write buffer is active, the paths are resolved when the buffer is flushed.
+            Paths that failed to be created are null.
+        """
+        center_lines = list(center_lines)
+        layout_msg, layer_msg, net_msg = layout.msg, messages.layer_ref_message(layer), messages.net_ref_message(net)
+        requests = [
+            path_pb2.PathCreationMessage(
+                layout=layout_msg,
+                layer=layer_msg,
+                net=net_msg,
+                width=messages.value_message(width),
+                end_cap1=end_cap1.value,
+                end_cap2=end_cap2.value,
+                corner=corner_style.value,
+                points=messages.polygon_data_message(center_line),
+            )
+            for width, center_line in zip(utils.broadcast(widths, len(center_lines)), center_lines)
+        ]
+        return [Path(msg) for msg in utils.batch_create(StubType.path, "Create", requests)]
+
     @classmethod
     @parser.to_polygon_data
     def render(
@@ -261,6 +322,45 @@ class Path(Primitive):
             )
         )
 
+    @staticmethod
+    def get_widths(paths: list[Path]) -> list[Value]:
+        """Get the widths of multiple paths.
+
+        The data of all paths is fetched from the server in chunks rather than with one request per path.
+
+        Parameters
+        ----------
+        paths : list of .Path
+            Paths to get the widths of.
+
+        Returns
+        -------
+        list of .Value
+            Width of each path.
+        """
+        return utils.batch_get(paths, lambda path: path.width)
+
+    @staticmethod
+    def set_widths(paths: list[Path], width: ValueLike):
+        """Set the width of multiple paths.
+
+        The requests for all paths are streamed to the server in chunks rather than sent one at a time.
+
+        Parameters
+        ----------
+        paths : list of .Path
+            Paths to modify.
+        width : :term:`ValueLike`
+            Width to set.
+        """
+        width_msg = path_pb2.WidthMessage(width=messages.value_message(width))
+        utils.batch_set(
+            StubType.path,
+            "SetWidth",
+            lambda path: path_pb2.SetWidthMessage(target=path.msg, width=width_msg),
+            paths,
+        )
+
     @property
     def miter_ratio(self) -> Value:
         """:class:`.Value`: Miter ratio."""
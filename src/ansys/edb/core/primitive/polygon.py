@@ -5,6 +5,8 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from ansys.edb.core.geometry.polygon_data import PolygonData
     from ansys.edb.core.layout.layout import Layout
     from ansys.edb.core.typing import LayerLike
@@ -15,6 +17,7 @@ from ansys.api.edb.v1 import polygon_pb2_grpc
 
 from ansys.edb.core.inner import messages
 from ansys.edb.core.inner import parser
+from ansys.edb.core.inner import utils
 from ansys.edb.core.primitive.primitive import Primitive
 from ansys.edb.core.session import StubAccessor
 from ansys.edb.core.session import StubType
@@ -56,6 +59,43 @@ class Polygon(Primitive):
             )
         )
 
+    @classmethod
+    def create_many(
+        cls, layout: Layout, layer: LayerLike, net: NetLike | None, polygons: Iterable[PolygonData]
+    ) -> list[Polygon]:
+        """Create multiple polygons.
+
+        The creation requests are streamed to the server in chunks rather than sent one at a time.
+
+        Parameters
+        ----------
+        layout : .Layout
+            Layout to create the polygons in.
+        layer : :term:`LayerLike`
+            Layer to place the polygons on.
+        net : :term:`NetLike` or None
+            Net of the polygons.
+        polygons : list of .PolygonData
+            Outer contour of each polygon.
+
+        Returns
+        -------
+        list of Polygon
+            Polygons created. If a write buffer is active, the polygons are resolved when the buffer is flushed.
+            Polygons that failed to be created are null.
+        """
+        layout_msg, layer_msg, net_msg = layout.msg, messages.layer_ref_message(layer), messages.net_ref_message(net)
+        requests = [
+            polygon_pb2.PolygonCreationMessage(
+                layout=layout_msg,
+                layer=layer_msg,
+                net=net_msg,
+                points=messages.polygon_data_message(polygon_data),
+            )
+            for polygon_data in polygons
+        ]
+        return [Polygon(msg) for msg in utils.batch_create(StubType.polygon, "Create", requests)]
+
     @property
     @parser.to_polygon_data
     def polygon_data(self) -> PolygonData:
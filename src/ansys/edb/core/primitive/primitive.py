@@ -3,6 +3,12 @@
 from __future__ import annotations
 
 from enum import Enum
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from ansys.edb.core.typing import LayerLike
 
 from ansys.api.edb.v1 import primitive_pb2
 from ansys.api.edb.v1 import primitive_pb2_grpc
@@ -15,6 +21,7 @@ from ansys.edb.core.inner import utils
 from ansys.edb.core.layer.layer import Layer
 from ansys.edb.core.session import StubAccessor
 from ansys.edb.core.session import StubType
+from ansys.edb.core.utility import identity_map
 
 
 class PrimitiveType(Enum):
@@ -47,7 +54,11 @@ class Primitive(conn_obj.ConnObj):
         -------
         .Primitive
         """
-        return None if self.is_null else factory.create_primitive(self.msg, self.primitive_type)
+        if self.is_null:
+            return None
+        return identity_map.get_or_create(
+            self, Primitive, lambda: factory.create_primitive(self.msg, self.primitive_type)
+        )
 
     @property
     def primitive_type(self) -> PrimitiveType:
@@ -91,6 +102,45 @@ class Primitive(conn_obj.ConnObj):
     def layer(self, layer: Layer):
         self.__stub.SetLayer(primitive_pb2.SetLayerMessage(target=self.msg, layer=messages.layer_ref_message(layer)))
 
+    @staticmethod
+    def get_layers(primitives: list[Primitive]) -> list[Layer]:
+        """Get the layers of multiple primitives.
+
+        The data of all primitives is fetched from the server in chunks rather than with one request per primitive.
+
+        Parameters
+        ----------
+        primitives : list of .Primitive
+            Primitives to get the layers of.
+
+        Returns
+        -------
+        list of .Layer
+            Layer of each primitive.
+        """
+        return utils.batch_get(primitives, lambda prim: prim.layer)
+
+    @staticmethod
+    def set_layers(primitives: list[Primitive], layer: LayerLike):
+        """Move multiple primitives to a layer.
+
+        The requests for all primitives are streamed to the server in chunks rather than sent one at a time.
+
+        Parameters
+        ----------
+        primitives : list of .Primitive
+            Primitives to move.
+        layer : :term:`LayerLike`
+            Layer to move the primitives to.
+        """
+        layer_msg = messages.layer_ref_message(layer)
+        utils.batch_set(
+            StubType.primitive,
+            "SetLayer",
+            lambda prim: primitive_pb2.SetLayerMessage(target=prim.msg, layer=layer_msg),
+            primitives,
+        )
+
     @property
     def is_negative(self) -> bool:
         """:obj:`bool`: Flag indicating if the primitive is negative."""
@@ -100,6 +150,26 @@ class Primitive(conn_obj.ConnObj):
     def is_negative(self, is_negative: bool):
         self.__stub.SetIsNegative(primitive_pb2.SetIsNegativeMessage(target=self.msg, is_negative=is_negative))
 
+    @staticmethod
+    def set_negative_flags(primitives: list[Primitive], is_negative: bool):
+        """Set the flag indicating if a primitive is negative for multiple primitives.
+
+        The requests for all primitives are streamed to the server in chunks rather than sent one at a time.
+
+        Parameters
+        ----------
+        primitives : list of .Primitive
+            Primitives to modify.
+        is_negative : bool
+            Flag indicating if the primitives are negative.
+        """
+        utils.batch_set(
+            StubType.primitive,
+            "SetIsNegative",
+            lambda prim: primitive_pb2.SetIsNegativeMessage(target=prim.msg, is_negative=is_negative),
+            primitives,
+        )
+
     @property
     def is_void(self) -> bool:
         """:obj:`bool`: Flag indicating if a primitive is a void.
@@ -108,6 +178,24 @@ class Primitive(conn_obj.ConnObj):
         """
         return self.__stub.IsVoid(self.msg).value
 
+    @staticmethod
+    def get_void_flags(primitives: list[Primitive]) -> list[bool]:
+        """Get the flags indicating if multiple primitives are voids.
+
+        The data of all primitives is fetched from the server in chunks rather than with one request per primitive.
+
+        Parameters
+        ----------
+        primitives : list of .Primitive
+            Primitives to get the void flags of.
+
+        Returns
+        -------
+        list of bool
+            Flag indicating if each primitive is a void.
+        """
+        return utils.batch_get(primitives, lambda prim: prim.is_void)
+
     @property
     def has_voids(self) -> bool:
         """:obj:`bool`: Flag indicating if a primitive has voids inside.
@@ -127,6 +215,17 @@ class Primitive(conn_obj.ConnObj):
             self, LayoutObjType.PRIMITIVE, self.__stub.Voids, self.__stub.StreamVoids, False
         )
 
+    def iter_voids(self) -> Iterator[Primitive]:
+        """Iterate over the void primitive objects inside the primitive as they are streamed from the server.
+
+        Returns
+        -------
+        Iterator of .Primitive
+        """
+        return utils.iter_lyt_object_collection(
+            self, LayoutObjType.PRIMITIVE, self.__stub.Voids, self.__stub.StreamVoids, False
+        )
+
     @property
     def owner(self) -> Primitive:
         """:class:`.Primitive`: Owner of the primitive object.
@@ -161,6 +260,24 @@ class Primitive(conn_obj.ConnObj):
         prop_msg = self.__stub.GetHfssProp(self.msg)
         return prop_msg.material_name, prop_msg.solve_inside
 
+    @staticmethod
+    def get_hfss_props(primitives: list[Primitive]) -> list[tuple[str, bool]]:
+        """Get the HFSS properties of multiple primitives.
+
+        The data of all primitives is fetched from the server in chunks rather than with one request per primitive.
+
+        Parameters
+        ----------
+        primitives : list of .Primitive
+            Primitives to get the HFSS properties of.
+
+        Returns
+        -------
+        list of tuple of (str, bool)
+            HFSS properties of each primitive in the format returned by :meth:`get_hfss_prop`.
+        """
+        return utils.batch_get(primitives, lambda prim: prim.get_hfss_prop())
+
     def remove_hfss_prop(self):
         """Remove HFSS properties."""
         self.__stub.RemoveHfssProp(self.msg)
@@ -5,10 +5,13 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from ansys.edb.core.geometry.polygon_data import PolygonData
     from ansys.edb.core.layout.layout import Layout
     from ansys.edb.core.typing import LayerLike
     from ansys.edb.core.typing import NetLike
+    from ansys.edb.core.typing import PointLike
     from ansys.edb.core.typing import ValueLike
 
 from enum import Enum
@@ -18,6 +21,7 @@ from ansys.api.edb.v1 import rectangle_pb2_grpc
 
 from ansys.edb.core.inner import messages
 from ansys.edb.core.inner import parser
+from ansys.edb.core.inner import utils
 from ansys.edb.core.primitive.primitive import Primitive
 from ansys.edb.core.session import StubAccessor
 from ansys.edb.core.session import StubType
@@ -98,6 +102,74 @@ class Rectangle(Primitive):
             )
         )
 
+    @classmethod
+    def create_many(
+        cls,
+        layout: Layout,
+        layer: LayerLike,
+        net: NetLike | None,
+        centers: Iterable[PointLike],
+        widths: ValueLike | Iterable[ValueLike],
+        heights: ValueLike | Iterable[ValueLike],
+        corner_rads: ValueLike | Iterable[ValueLike] = 0.0,
+        rotations: ValueLike | Iterable[ValueLike] = 0.0,
+    ) -> list[Rectangle]:
+        """Create multiple rectangles defined by their center points, widths, and heights.
+
+        The creation requests are streamed to the server in chunks rather than sent one at a time. Array-like
+        arguments such as NumPy arrays are accepted.
+
+        Parameters
+        ----------
+        layout : .Layout
+            Layout to create the rectangles in.
+        layer : :term:`LayerLike`
+            Layer the rectangles are to be created on.
+        net : :term:`NetLike` or None
+            Net the rectangles are to have.
+        centers : list of :term:`Point2DLike`
+            Center point of each rectangle. An array of shape ``(N, 2)`` is accepted.
+        widths : :term:`ValueLike` or list of :term:`ValueLike`
+            Width of each rectangle or a single width for all rectangles.
+        heights : :term:`ValueLike` or list of :term:`ValueLike`
+            Height of each rectangle or a single height for all rectangles.
+        corner_rads : :term:`ValueLike` or list of :term:`ValueLike`, default: 0.0
+            Corner radius of each rectangle or a single corner radius for all rectangles.
+        rotations : :term:`ValueLike` or list of :term:`ValueLike`, default: 0.0
+            Rotation of each rectangle or a single rotation for all rectangles.
+
+        Returns
+        -------
+        list of Rectangle
+            Rectangles created. If a write buffer is active, the rectangles are resolved when the buffer is flushed.
+            Rectangles that failed to be created are null.
+        """
+        centers = list(centers)
+        count = len(centers)
+        layout_msg, layer_msg, net_msg = layout.msg, messages.layer_ref_message(layer), messages.net_ref_message(net)
+        requests = [
+            rectangle_pb2.RectangleCreationMessage(
+                layout=layout_msg,
+                layer=layer_msg,
+                net=net_msg,
+                representation_type=RectangleRepresentationType.CENTER_WIDTH_HEIGHT.value,
+                parameter1=messages.value_message(center_x),
+                parameter2=messages.value_message(center_y),
+                parameter3=messages.value_message(width),
+                parameter4=messages.value_message(height),
+                corner_radius=messages.value_message(corner_rad),
+                rotation=messages.value_message(rotation),
+            )
+            for (center_x, center_y), width, height, corner_rad, rotation in zip(
+                map(utils.point_coordinates, centers),
+                utils.broadcast(widths, count),
+                utils.broadcast(heights, count),
+                utils.broadcast(corner_rads, count),
+                utils.broadcast(rotations, count),
+            )
+        ]
+        return [Rectangle(msg) for msg in utils.batch_create(StubType.rectangle, "Create", requests)]
+
     def get_parameters(
         self,
     ) -> tuple[RectangleRepresentationType, Value, Value, Value, Value, Value, Value]:
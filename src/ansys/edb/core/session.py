@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
-from collections import defaultdict
 from contextlib import contextmanager
+from contextvars import ContextVar
 from enum import Enum
 import errno
-import json
+from functools import cache
+from importlib import import_module
 import os
 from pathlib import Path
 from platform import system
@@ -16,144 +17,150 @@ from struct import pack
 from struct import unpack
 import subprocess
 from sys import modules
+from threading import Lock
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ansys.api.edb.v1.arc_data_pb2_grpc import ArcDataServiceStub
+    from ansys.api.edb.v1.board_bend_def_pb2_grpc import BoardBendDefServiceStub
+    from ansys.api.edb.v1.bondwire_def_pb2_grpc import ApdBondwireDefServiceStub
+    from ansys.api.edb.v1.bondwire_def_pb2_grpc import BondwireDefServiceStub
+    from ansys.api.edb.v1.bondwire_def_pb2_grpc import Jedec4BondwireDefServiceStub
+    from ansys.api.edb.v1.bondwire_def_pb2_grpc import Jedec5BondwireDefServiceStub
+    from ansys.api.edb.v1.bondwire_pb2_grpc import BondwireServiceStub
+    from ansys.api.edb.v1.bundle_term_pb2_grpc import BundleTerminalServiceStub
+    from ansys.api.edb.v1.cell_instance_pb2_grpc import CellInstanceServiceStub
+    from ansys.api.edb.v1.cell_pb2_grpc import CellServiceStub
+    from ansys.api.edb.v1.circle_pb2_grpc import CircleServiceStub
+    from ansys.api.edb.v1.component_def_pb2_grpc import ComponentDefServiceStub
+    from ansys.api.edb.v1.component_group_pb2_grpc import ComponentGroupServiceStub
+    from ansys.api.edb.v1.component_model_pb2_grpc import ComponentModelServiceStub
+    from ansys.api.edb.v1.component_model_pb2_grpc import DynamicLinkComponentModelServiceStub
+    from ansys.api.edb.v1.component_model_pb2_grpc import NPortComponentModelServiceStub
+    from ansys.api.edb.v1.component_pin_pb2_grpc import ComponentPinServiceStub
+    from ansys.api.edb.v1.component_property_pb2_grpc import ComponentPropertyServiceStub
+    from ansys.api.edb.v1.connectable_pb2_grpc import ConnectableServiceStub
+    from ansys.api.edb.v1.database_pb2_grpc import DatabaseServiceStub
+    from ansys.api.edb.v1.dataset_def_pb2_grpc import DatasetDefServiceStub
+    from ansys.api.edb.v1.debye_model_pb2_grpc import DebyeModelServiceStub
+    from ansys.api.edb.v1.die_property_pb2_grpc import DiePropertyServiceStub
+    from ansys.api.edb.v1.dielectric_material_model_pb2_grpc import DielectricMaterialModelServiceStub
+    from ansys.api.edb.v1.differential_pair_pb2_grpc import DifferentialPairServiceStub
+    from ansys.api.edb.v1.djordjecvic_sarkar_model_pb2_grpc import DjordjecvicSarkarModelServiceStub
+    from ansys.api.edb.v1.edb_error_manager_pb2_grpc import EDBErrorManagerServiceStub
+    from ansys.api.edb.v1.edge_term_pb2_grpc import EdgeServiceStub
+    from ansys.api.edb.v1.edge_term_pb2_grpc import EdgeTerminalServiceStub
+    from ansys.api.edb.v1.extended_net_pb2_grpc import ExtendedNetServiceStub
+    from ansys.api.edb.v1.group_pb2_grpc import GroupServiceStub
+    from ansys.api.edb.v1.hfss_pi_simulation_settings_pb2_grpc import HFSSPIAdvancedSettingsServiceStub
+    from ansys.api.edb.v1.hfss_pi_simulation_settings_pb2_grpc import HFSSPIGeneralSettingsServiceStub
+    from ansys.api.edb.v1.hfss_pi_simulation_settings_pb2_grpc import HFSSPISolverSettingsServiceStub
+    from ansys.api.edb.v1.hfss_simulation_settings_pb2_grpc import DCRSettingsServiceStub
+    from ansys.api.edb.v1.hfss_simulation_settings_pb2_grpc import HFSSAdvancedMeshingSettingsServiceStub
+    from ansys.api.edb.v1.hfss_simulation_settings_pb2_grpc import HFSSAdvancedSettingsServiceStub
+    from ansys.api.edb.v1.hfss_simulation_settings_pb2_grpc import HFSSGeneralSettingsServiceStub
+    from ansys.api.edb.v1.hfss_simulation_settings_pb2_grpc import HFSSOptionsSettingsServiceStub
+    from ansys.api.edb.v1.hfss_simulation_settings_pb2_grpc import HFSSSolverSettingsServiceStub
+    from ansys.api.edb.v1.hfss_simulation_setup_pb2_grpc import HfssSimulationSetupServiceStub
+    from ansys.api.edb.v1.hierarchy_obj_pb2_grpc import HierarchyObjectServiceStub
+    from ansys.api.edb.v1.ic_component_property_pb2_grpc import ICComponentPropertyServiceStub
+    from ansys.api.edb.v1.inst_array_pb2_grpc import InstArrayServiceStub
+    from ansys.api.edb.v1.io_component_property_pb2_grpc import IOComponentPropertyServiceStub
+    from ansys.api.edb.v1.io_manager_pb2_grpc import IOManagerServiceStub
+    from ansys.api.edb.v1.layer_collection_pb2_grpc import LayerCollectionServiceStub
+    from ansys.api.edb.v1.layer_map_pb2_grpc import LayerMapServiceStub
+    from ansys.api.edb.v1.layer_pb2_grpc import LayerServiceStub
+    from ansys.api.edb.v1.layout_component_pb2_grpc import LayoutComponentServiceStub
+    from ansys.api.edb.v1.layout_instance_context_pb2_grpc import LayoutInstanceContextServiceStub
+    from ansys.api.edb.v1.layout_instance_pb2_grpc import LayoutInstanceServiceStub
+    from ansys.api.edb.v1.layout_obj_instance_2d_geometry_pb2_grpc import LayoutObjInstance2DGeometryServiceStub
+    from ansys.api.edb.v1.layout_obj_instance_3d_geometry_pb2_grpc import LayoutObjInstance3DGeometryServiceStub
+    from ansys.api.edb.v1.layout_obj_instance_geometry_pb2_grpc import LayoutObjInstanceGeometryServiceStub
+    from ansys.api.edb.v1.layout_obj_instance_pb2_grpc import LayoutObjInstanceServiceStub
+    from ansys.api.edb.v1.layout_obj_pb2_grpc import LayoutObjServiceStub
+    from ansys.api.edb.v1.layout_pb2_grpc import LayoutServiceStub
+    from ansys.api.edb.v1.material_def_pb2_grpc import MaterialDefServiceStub
+    from ansys.api.edb.v1.material_property_thermal_modifier_pb2_grpc import MaterialPropertyThermalModifierServiceStub
+    from ansys.api.edb.v1.mcad_model_pb2_grpc import McadModelServiceStub
+    from ansys.api.edb.v1.model_pb2_grpc import ModelServiceStub
+    from ansys.api.edb.v1.multipole_debye_model_pb2_grpc import MultipoleDebyeModelServiceStub
+    from ansys.api.edb.v1.net_class_pb2_grpc import NetClassServiceStub
+    from ansys.api.edb.v1.net_pb2_grpc import NetServiceStub
+    from ansys.api.edb.v1.netlist_model_pb2_grpc import NetlistModelServiceStub
+    from ansys.api.edb.v1.package_def_pb2_grpc import PackageDefServiceStub
+    from ansys.api.edb.v1.padstack_def_data_pb2_grpc import PadstackDefDataServiceStub
+    from ansys.api.edb.v1.padstack_def_pb2_grpc import PadstackDefServiceStub
+    from ansys.api.edb.v1.padstack_inst_term_pb2_grpc import PadstackInstanceTerminalServiceStub
+    from ansys.api.edb.v1.padstack_instance_pb2_grpc import PadstackInstanceServiceStub
+    from ansys.api.edb.v1.path_pb2_grpc import PathServiceStub
+    from ansys.api.edb.v1.pin_group_pb2_grpc import PinGroupServiceStub
+    from ansys.api.edb.v1.pin_group_term_pb2_grpc import PinGroupTerminalServiceStub
+    from ansys.api.edb.v1.pin_pair_model_pb2_grpc import PinPairModelServiceStub
+    from ansys.api.edb.v1.point_data_pb2_grpc import PointDataServiceStub
+    from ansys.api.edb.v1.point_term_pb2_grpc import PointTerminalServiceStub
+    from ansys.api.edb.v1.polygon_data_pb2_grpc import PolygonDataServiceStub
+    from ansys.api.edb.v1.polygon_pb2_grpc import PolygonServiceStub
+    from ansys.api.edb.v1.port_property_pb2_grpc import PortPropertyServiceStub
+    from ansys.api.edb.v1.primitive_instance_collection_pb2_grpc import PrimitiveInstanceCollectionServiceStub
+    from ansys.api.edb.v1.primitive_pb2_grpc import PrimitiveServiceStub
+    from ansys.api.edb.v1.q3d_simulation_settings_pb2_grpc import Q3DAdvancedMeshingSettingsServiceStub
+    from ansys.api.edb.v1.q3d_simulation_settings_pb2_grpc import Q3DAdvancedSettingsServiceStub
+    from ansys.api.edb.v1.q3d_simulation_settings_pb2_grpc import Q3DCGSettingsServiceStub
+    from ansys.api.edb.v1.q3d_simulation_settings_pb2_grpc import Q3DDCRLSettingsServiceStub
+    from ansys.api.edb.v1.q3d_simulation_settings_pb2_grpc import Q3DGeneralSettingsServiceStub
+    from ansys.api.edb.v1.q3d_simulation_settings_pb2_grpc import Q3DSettingsServiceStub
+    from ansys.api.edb.v1.r_tree_pb2_grpc import RTreeServiceStub
+    from ansys.api.edb.v1.raptor_x_simulation_settings_pb2_grpc import RaptorXAdvancedSettingsServiceStub
+    from ansys.api.edb.v1.raptor_x_simulation_settings_pb2_grpc import RaptorXGeneralSettingsServiceStub
+    from ansys.api.edb.v1.rectangle_pb2_grpc import RectangleServiceStub
+    from ansys.api.edb.v1.rlc_component_property_pb2_grpc import RLCComponentPropertyServiceStub
+    from ansys.api.edb.v1.s_parameter_model_pb2_grpc import SParameterModelServiceStub
+    from ansys.api.edb.v1.si_wave_cpa_simulation_settings_pb2_grpc import SIWaveCPAAdvancedSettingsServiceStub
+    from ansys.api.edb.v1.si_wave_cpa_simulation_settings_pb2_grpc import SIWaveCPAChannelComponentSettingsServiceStub
+    from ansys.api.edb.v1.si_wave_cpa_simulation_settings_pb2_grpc import SIWaveCPADieConfigSettingsServiceStub
+    from ansys.api.edb.v1.si_wave_cpa_simulation_settings_pb2_grpc import SIWaveCPAExternalEnvSettingsServiceStub
+    from ansys.api.edb.v1.si_wave_cpa_simulation_settings_pb2_grpc import SIWaveCPAHotSpotComponentSettingsServiceStub
+    from ansys.api.edb.v1.si_wave_cpa_simulation_settings_pb2_grpc import SIWaveCPANetSettingsServiceStub
+    from ansys.api.edb.v1.si_wave_cpa_simulation_settings_pb2_grpc import SIWaveCPAQ3DSettingsServiceStub
+    from ansys.api.edb.v1.si_wave_cpa_simulation_settings_pb2_grpc import SIWaveCPASettingsServiceStub
+    from ansys.api.edb.v1.si_wave_cpa_simulation_settings_pb2_grpc import SIWaveCPASimulationSettingsServiceStub
+    from ansys.api.edb.v1.si_wave_cpa_simulation_settings_pb2_grpc import SIWaveCPAUnconnectedDiePinSettingsServiceStub
+    from ansys.api.edb.v1.si_wave_cpa_simulation_settings_pb2_grpc import SIWaveCPAVRMSettingsServiceStub
+    from ansys.api.edb.v1.si_wave_dcir_simulation_settings_pb2_grpc import SIWaveDCIRSimulationSettingsServiceStub
+    from ansys.api.edb.v1.si_wave_psi_simulation_settings_pb2_grpc import SIWavePSIGeneralSettingsServiceStub
+    from ansys.api.edb.v1.si_wave_psi_simulation_settings_pb2_grpc import SIWavePSINetProcessingSettingsServiceStub
+    from ansys.api.edb.v1.si_wave_psi_simulation_settings_pb2_grpc import SIWavePSIPowerGroundNetsServiceStub
+    from ansys.api.edb.v1.si_wave_psi_simulation_settings_pb2_grpc import SIWavePSISignalNetsSettingsServiceStub
+    from ansys.api.edb.v1.si_wave_simulation_settings_pb2_grpc import SIWaveAdvancedSettingsServiceStub
+    from ansys.api.edb.v1.si_wave_simulation_settings_pb2_grpc import SIWaveDCAdvancedSettingsServiceStub
+    from ansys.api.edb.v1.si_wave_simulation_settings_pb2_grpc import SIWaveDCSettingsServiceStub
+    from ansys.api.edb.v1.si_wave_simulation_settings_pb2_grpc import SIWaveGeneralSettingsServiceStub
+    from ansys.api.edb.v1.si_wave_simulation_settings_pb2_grpc import SIWaveSParameterSettingsServiceStub
+    from ansys.api.edb.v1.simulation_settings_pb2_grpc import AdvancedMeshingSettingsServiceStub
+    from ansys.api.edb.v1.simulation_settings_pb2_grpc import AdvancedSettingsServiceStub
+    from ansys.api.edb.v1.simulation_settings_pb2_grpc import SettingsOptionsServiceStub
+    from ansys.api.edb.v1.simulation_settings_pb2_grpc import SimulationSettingsServiceStub
+    from ansys.api.edb.v1.simulation_settings_pb2_grpc import SolverSettingsServiceStub
+    from ansys.api.edb.v1.simulation_setup_pb2_grpc import SimulationSetupServiceStub
+    from ansys.api.edb.v1.solder_ball_property_pb2_grpc import SolderBallPropertyServiceStub
+    from ansys.api.edb.v1.spice_model_pb2_grpc import SpiceModelServiceStub
+    from ansys.api.edb.v1.stackup_layer_pb2_grpc import StackupLayerServiceStub
+    from ansys.api.edb.v1.structure_3d_pb2_grpc import Structure3DServiceStub
+    from ansys.api.edb.v1.technology_def_pb2_grpc import TechnologyDefServiceStub
+    from ansys.api.edb.v1.term_inst_pb2_grpc import TerminalInstanceServiceStub
+    from ansys.api.edb.v1.term_inst_term_pb2_grpc import TerminalInstanceTerminalServiceStub
+    from ansys.api.edb.v1.term_pb2_grpc import TerminalServiceStub
+    from ansys.api.edb.v1.text_pb2_grpc import TextServiceStub
+    from ansys.api.edb.v1.transform_3d_pb2_grpc import Transform3DServiceStub
+    from ansys.api.edb.v1.transform_pb2_grpc import TransformServiceStub
+    from ansys.api.edb.v1.value_pb2_grpc import ValueServiceStub
+    from ansys.api.edb.v1.variable_server_pb2_grpc import VariableServerServiceStub
+    from ansys.api.edb.v1.via_group_pb2_grpc import ViaGroupServiceStub
+    from ansys.api.edb.v1.via_layer_pb2_grpc import ViaLayerServiceStub
+    from ansys.api.edb.v1.voltage_regulator_pb2_grpc import VoltageRegulatorServiceStub
+
+    from ansys.edb.core.utility.rpc_stats import RpcMethodStats
 
-from ansys.api.edb.v1.arc_data_pb2_grpc import ArcDataServiceStub
-from ansys.api.edb.v1.board_bend_def_pb2_grpc import BoardBendDefServiceStub
-from ansys.api.edb.v1.bondwire_def_pb2_grpc import ApdBondwireDefServiceStub
-from ansys.api.edb.v1.bondwire_def_pb2_grpc import BondwireDefServiceStub
-from ansys.api.edb.v1.bondwire_def_pb2_grpc import Jedec4BondwireDefServiceStub
-from ansys.api.edb.v1.bondwire_def_pb2_grpc import Jedec5BondwireDefServiceStub
-from ansys.api.edb.v1.bondwire_pb2_grpc import BondwireServiceStub
-from ansys.api.edb.v1.bundle_term_pb2_grpc import BundleTerminalServiceStub
-from ansys.api.edb.v1.cell_instance_pb2_grpc import CellInstanceServiceStub
-from ansys.api.edb.v1.cell_pb2_grpc import CellServiceStub
-from ansys.api.edb.v1.circle_pb2_grpc import CircleServiceStub
-from ansys.api.edb.v1.component_def_pb2_grpc import ComponentDefServiceStub
-from ansys.api.edb.v1.component_group_pb2_grpc import ComponentGroupServiceStub
-from ansys.api.edb.v1.component_model_pb2_grpc import ComponentModelServiceStub
-from ansys.api.edb.v1.component_model_pb2_grpc import DynamicLinkComponentModelServiceStub
-from ansys.api.edb.v1.component_model_pb2_grpc import NPortComponentModelServiceStub
-from ansys.api.edb.v1.component_pin_pb2_grpc import ComponentPinServiceStub
-from ansys.api.edb.v1.component_property_pb2_grpc import ComponentPropertyServiceStub
-from ansys.api.edb.v1.connectable_pb2_grpc import ConnectableServiceStub
-from ansys.api.edb.v1.database_pb2_grpc import DatabaseServiceStub
-from ansys.api.edb.v1.dataset_def_pb2_grpc import DatasetDefServiceStub
-from ansys.api.edb.v1.debye_model_pb2_grpc import DebyeModelServiceStub
-from ansys.api.edb.v1.die_property_pb2_grpc import DiePropertyServiceStub
-from ansys.api.edb.v1.dielectric_material_model_pb2_grpc import DielectricMaterialModelServiceStub
-from ansys.api.edb.v1.differential_pair_pb2_grpc import DifferentialPairServiceStub
-from ansys.api.edb.v1.djordjecvic_sarkar_model_pb2_grpc import DjordjecvicSarkarModelServiceStub
-from ansys.api.edb.v1.edb_error_manager_pb2_grpc import EDBErrorManagerServiceStub
-from ansys.api.edb.v1.edge_term_pb2_grpc import EdgeServiceStub
-from ansys.api.edb.v1.edge_term_pb2_grpc import EdgeTerminalServiceStub
-from ansys.api.edb.v1.extended_net_pb2_grpc import ExtendedNetServiceStub
-from ansys.api.edb.v1.group_pb2_grpc import GroupServiceStub
-from ansys.api.edb.v1.hfss_pi_simulation_settings_pb2_grpc import HFSSPIAdvancedSettingsServiceStub
-from ansys.api.edb.v1.hfss_pi_simulation_settings_pb2_grpc import HFSSPIGeneralSettingsServiceStub
-from ansys.api.edb.v1.hfss_pi_simulation_settings_pb2_grpc import HFSSPISolverSettingsServiceStub
-from ansys.api.edb.v1.hfss_simulation_settings_pb2_grpc import DCRSettingsServiceStub
-from ansys.api.edb.v1.hfss_simulation_settings_pb2_grpc import HFSSAdvancedMeshingSettingsServiceStub
-from ansys.api.edb.v1.hfss_simulation_settings_pb2_grpc import HFSSAdvancedSettingsServiceStub
-from ansys.api.edb.v1.hfss_simulation_settings_pb2_grpc import HFSSGeneralSettingsServiceStub
-from ansys.api.edb.v1.hfss_simulation_settings_pb2_grpc import HFSSOptionsSettingsServiceStub
-from ansys.api.edb.v1.hfss_simulation_settings_pb2_grpc import HFSSSolverSettingsServiceStub
-from ansys.api.edb.v1.hfss_simulation_setup_pb2_grpc import HfssSimulationSetupServiceStub
-from ansys.api.edb.v1.hierarchy_obj_pb2_grpc import HierarchyObjectServiceStub
-from ansys.api.edb.v1.ic_component_property_pb2_grpc import ICComponentPropertyServiceStub
-from ansys.api.edb.v1.inst_array_pb2_grpc import InstArrayServiceStub
-from ansys.api.edb.v1.io_component_property_pb2_grpc import IOComponentPropertyServiceStub
-from ansys.api.edb.v1.io_manager_pb2_grpc import IOManagerServiceStub
-from ansys.api.edb.v1.layer_collection_pb2_grpc import LayerCollectionServiceStub
-from ansys.api.edb.v1.layer_map_pb2_grpc import LayerMapServiceStub
-from ansys.api.edb.v1.layer_pb2_grpc import LayerServiceStub
-from ansys.api.edb.v1.layout_component_pb2_grpc import LayoutComponentServiceStub
-from ansys.api.edb.v1.layout_instance_context_pb2_grpc import LayoutInstanceContextServiceStub
-from ansys.api.edb.v1.layout_instance_pb2_grpc import LayoutInstanceServiceStub
-from ansys.api.edb.v1.layout_obj_instance_2d_geometry_pb2_grpc import LayoutObjInstance2DGeometryServiceStub
-from ansys.api.edb.v1.layout_obj_instance_3d_geometry_pb2_grpc import LayoutObjInstance3DGeometryServiceStub
-from ansys.api.edb.v1.layout_obj_instance_geometry_pb2_grpc import LayoutObjInstanceGeometryServiceStub
-from ansys.api.edb.v1.layout_obj_instance_pb2_grpc import LayoutObjInstanceServiceStub
-from ansys.api.edb.v1.layout_obj_pb2_grpc import LayoutObjServiceStub
-from ansys.api.edb.v1.layout_pb2_grpc import LayoutServiceStub
-from ansys.api.edb.v1.material_def_pb2_grpc import MaterialDefServiceStub
-from ansys.api.edb.v1.material_property_thermal_modifier_pb2_grpc import MaterialPropertyThermalModifierServiceStub
-from ansys.api.edb.v1.mcad_model_pb2_grpc import McadModelServiceStub
-from ansys.api.edb.v1.model_pb2_grpc import ModelServiceStub
-from ansys.api.edb.v1.multipole_debye_model_pb2_grpc import MultipoleDebyeModelServiceStub
-from ansys.api.edb.v1.net_class_pb2_grpc import NetClassServiceStub
-from ansys.api.edb.v1.net_pb2_grpc import NetServiceStub
-from ansys.api.edb.v1.netlist_model_pb2_grpc import NetlistModelServiceStub
-from ansys.api.edb.v1.package_def_pb2_grpc import PackageDefServiceStub
-from ansys.api.edb.v1.padstack_def_data_pb2_grpc import PadstackDefDataServiceStub
-from ansys.api.edb.v1.padstack_def_pb2_grpc import PadstackDefServiceStub
-from ansys.api.edb.v1.padstack_inst_term_pb2_grpc import PadstackInstanceTerminalServiceStub
-from ansys.api.edb.v1.padstack_instance_pb2_grpc import PadstackInstanceServiceStub
-from ansys.api.edb.v1.path_pb2_grpc import PathServiceStub
-from ansys.api.edb.v1.pin_group_pb2_grpc import PinGroupServiceStub
-from ansys.api.edb.v1.pin_group_term_pb2_grpc import PinGroupTerminalServiceStub
-from ansys.api.edb.v1.pin_pair_model_pb2_grpc import PinPairModelServiceStub
-from ansys.api.edb.v1.point_data_pb2_grpc import PointDataServiceStub
-from ansys.api.edb.v1.point_term_pb2_grpc import PointTerminalServiceStub
-from ansys.api.edb.v1.polygon_data_pb2_grpc import PolygonDataServiceStub
-from ansys.api.edb.v1.polygon_pb2_grpc import PolygonServiceStub
-from ansys.api.edb.v1.port_property_pb2_grpc import PortPropertyServiceStub
-from ansys.api.edb.v1.primitive_instance_collection_pb2_grpc import PrimitiveInstanceCollectionServiceStub
-from ansys.api.edb.v1.primitive_pb2_grpc import PrimitiveServiceStub
-from ansys.api.edb.v1.q3d_simulation_settings_pb2_grpc import Q3DAdvancedMeshingSettingsServiceStub
-from ansys.api.edb.v1.q3d_simulation_settings_pb2_grpc import Q3DAdvancedSettingsServiceStub
-from ansys.api.edb.v1.q3d_simulation_settings_pb2_grpc import Q3DCGSettingsServiceStub
-from ansys.api.edb.v1.q3d_simulation_settings_pb2_grpc import Q3DDCRLSettingsServiceStub
-from ansys.api.edb.v1.q3d_simulation_settings_pb2_grpc import Q3DGeneralSettingsServiceStub
-from ansys.api.edb.v1.q3d_simulation_settings_pb2_grpc import Q3DSettingsServiceStub
-from ansys.api.edb.v1.r_tree_pb2_grpc import RTreeServiceStub
-from ansys.api.edb.v1.raptor_x_simulation_settings_pb2_grpc import RaptorXAdvancedSettingsServiceStub
-from ansys.api.edb.v1.raptor_x_simulation_settings_pb2_grpc import RaptorXGeneralSettingsServiceStub
-from ansys.api.edb.v1.rectangle_pb2_grpc import RectangleServiceStub
-from ansys.api.edb.v1.rlc_component_property_pb2_grpc import RLCComponentPropertyServiceStub
-from ansys.api.edb.v1.s_parameter_model_pb2_grpc import SParameterModelServiceStub
-from ansys.api.edb.v1.si_wave_cpa_simulation_settings_pb2_grpc import SIWaveCPAAdvancedSettingsServiceStub
-from ansys.api.edb.v1.si_wave_cpa_simulation_settings_pb2_grpc import SIWaveCPAChannelComponentSettingsServiceStub
-from ansys.api.edb.v1.si_wave_cpa_simulation_settings_pb2_grpc import SIWaveCPADieConfigSettingsServiceStub
-from ansys.api.edb.v1.si_wave_cpa_simulation_settings_pb2_grpc import SIWaveCPAExternalEnvSettingsServiceStub
-from ansys.api.edb.v1.si_wave_cpa_simulation_settings_pb2_grpc import SIWaveCPAHotSpotComponentSettingsServiceStub
-from ansys.api.edb.v1.si_wave_cpa_simulation_settings_pb2_grpc import SIWaveCPANetSettingsServiceStub
-from ansys.api.edb.v1.si_wave_cpa_simulation_settings_pb2_grpc import SIWaveCPAQ3DSettingsServiceStub
-from ansys.api.edb.v1.si_wave_cpa_simulation_settings_pb2_grpc import SIWaveCPASettingsServiceStub
-from ansys.api.edb.v1.si_wave_cpa_simulation_settings_pb2_grpc import SIWaveCPASimulationSettingsServiceStub
-from ansys.api.edb.v1.si_wave_cpa_simulation_settings_pb2_grpc import SIWaveCPAUnconnectedDiePinSettingsServiceStub
-from ansys.api.edb.v1.si_wave_cpa_simulation_settings_pb2_grpc import SIWaveCPAVRMSettingsServiceStub
-from ansys.api.edb.v1.si_wave_dcir_simulation_settings_pb2_grpc import SIWaveDCIRSimulationSettingsServiceStub
-from ansys.api.edb.v1.si_wave_psi_simulation_settings_pb2_grpc import SIWavePSIGeneralSettingsServiceStub
-from ansys.api.edb.v1.si_wave_psi_simulation_settings_pb2_grpc import SIWavePSINetProcessingSettingsServiceStub
-from ansys.api.edb.v1.si_wave_psi_simulation_settings_pb2_grpc import SIWavePSIPowerGroundNetsServiceStub
-from ansys.api.edb.v1.si_wave_psi_simulation_settings_pb2_grpc import SIWavePSISignalNetsSettingsServiceStub
-from ansys.api.edb.v1.si_wave_simulation_settings_pb2_grpc import SIWaveAdvancedSettingsServiceStub
-from ansys.api.edb.v1.si_wave_simulation_settings_pb2_grpc import SIWaveDCAdvancedSettingsServiceStub
-from ansys.api.edb.v1.si_wave_simulation_settings_pb2_grpc import SIWaveDCSettingsServiceStub
-from ansys.api.edb.v1.si_wave_simulation_settings_pb2_grpc import SIWaveGeneralSettingsServiceStub
-from ansys.api.edb.v1.si_wave_simulation_settings_pb2_grpc import SIWaveSParameterSettingsServiceStub
-from ansys.api.edb.v1.simulation_settings_pb2_grpc import AdvancedMeshingSettingsServiceStub
-from ansys.api.edb.v1.simulation_settings_pb2_grpc import AdvancedSettingsServiceStub
-from ansys.api.edb.v1.simulation_settings_pb2_grpc import SettingsOptionsServiceStub
-from ansys.api.edb.v1.simulation_settings_pb2_grpc import SimulationSettingsServiceStub
-from ansys.api.edb.v1.simulation_settings_pb2_grpc import SolverSettingsServiceStub
-from ansys.api.edb.v1.simulation_setup_pb2_grpc import SimulationSetupServiceStub
-from ansys.api.edb.v1.solder_ball_property_pb2_grpc import SolderBallPropertyServiceStub
-from ansys.api.edb.v1.spice_model_pb2_grpc import SpiceModelServiceStub
-from ansys.api.edb.v1.stackup_layer_pb2_grpc import StackupLayerServiceStub
-from ansys.api.edb.v1.structure_3d_pb2_grpc import Structure3DServiceStub
-from ansys.api.edb.v1.technology_def_pb2_grpc import TechnologyDefServiceStub
-from ansys.api.edb.v1.term_inst_pb2_grpc import TerminalInstanceServiceStub
-from ansys.api.edb.v1.term_inst_term_pb2_grpc import TerminalInstanceTerminalServiceStub
-from ansys.api.edb.v1.term_pb2_grpc import TerminalServiceStub
-from ansys.api.edb.v1.text_pb2_grpc import TextServiceStub
-from ansys.api.edb.v1.transform_3d_pb2_grpc import Transform3DServiceStub
-from ansys.api.edb.v1.transform_pb2_grpc import TransformServiceStub
-from ansys.api.edb.v1.value_pb2_grpc import ValueServiceStub
-from ansys.api.edb.v1.variable_server_pb2_grpc import VariableServerServiceStub
-from ansys.api.edb.v1.via_group_pb2_grpc import ViaGroupServiceStub
-from ansys.api.edb.v1.via_layer_pb2_grpc import ViaLayerServiceStub
-from ansys.api.edb.v1.voltage_regulator_pb2_grpc import VoltageRegulatorServiceStub
 from ansys.tools.common.cyberchannel import create_channel
 import grpc
 
@@ -162,8 +169,15 @@ from ansys.edb.core.inner.exceptions import EDBSessionException
 from ansys.edb.core.inner.exceptions import ErrorCode
 from ansys.edb.core.inner.interceptors import ExceptionInterceptor
 from ansys.edb.core.inner.interceptors import IOInterceptor
+from ansys.edb.core.inner.interceptors import ProfilingInterceptor
+from ansys.edb.core.inner.interceptors import RecordingInterceptor
 from ansys.edb.core.inner.interceptors import SharedMemoryInterceptor
+from ansys.edb.core.inner.interceptors import TracingInterceptor
 from ansys.edb.core.inner.shared_memory_transport import SharedMemoryTransport
+from ansys.edb.core.utility import identity_map
+from ansys.edb.core.utility import io_manager
+from ansys.edb.core.utility.io_manager import _IOManager
+from ansys.edb.core.utility.rpc_stats import RpcStats
 
 DEFAULT_ADDRESS = "localhost"
 
@@ -171,6 +185,14 @@ DEFAULT_ADDRESS = "localhost"
 MOD = modules[__name__]
 MOD.current_session = None
 
+# Session bound to the current thread or task by use_session(). It takes precedence over the module session.
+_BOUND_SESSION = ContextVar("bound_session", default=None)
+
+# Ports returned by _find_available_port that are not released yet. Servers launched concurrently don't listen on
+# their port yet when the next port is searched, so the ports already handed out must be skipped.
+_reserved_ports = set()
+_reserved_ports_lock = Lock()
+
 
 class StubAccessor(object):
     """Provides a descriptor for assignig a specific stub to a model."""
@@ -186,8 +208,8 @@ class StubAccessor(object):
 
     def __get__(self, instance=None, owner=None):
         """Get the corresponding stub service if a session is active."""
-        if MOD.current_session is not None:
-            return MOD.current_session.stub(self.__stub_name)
+        if (edb_session := get_current_session()) is not None:
+            return edb_session.stub(self.__stub_name)
         raise EDBSessionException(ErrorCode.NO_SESSIONS)
 
 
@@ -200,8 +222,9 @@ class _Session:
         ansys_em_root: str,
         dump_traffic_log: bool,
         use_shared_memory_ipc: bool = False,
+        make_current: bool = True,
     ):
-        if MOD.current_session is not None:
+        if make_current and MOD.current_session is not None:
             raise EDBSessionException(ErrorCode.STARTUP_MULTI_SESSIONS)
 
         self.ip_address = ip_address or DEFAULT_ADDRESS
@@ -212,14 +235,18 @@ class _Session:
         self.local_server_proc = None
         self.stubs = None
         self.session = None
-        self.rpc_counter = defaultdict(int) if dump_traffic_log else None
+        self.rpc_stats = RpcStats() if dump_traffic_log else None
+        self.rpc_profiler = None
+        self.rpc_recorder = None
+        self.io_manager = _IOManager()
         self._shm_transport = None
 
         # Shared memory is only used when explicitly requested via
         # use_shared_memory_ipc=True and a local server is being launched.
         self.shared_memory = use_shared_memory_ipc and self.is_local() and ansys_em_root is not None
         if self.shared_memory:
-            self._shm_name = f"edb_shm_{os.getpid()}"
+            # The port is unique among the sessions of the process, so it tells the regions of their servers apart.
+            self._shm_name = f"edb_shm_{os.getpid()}_{self.port_num}"
 
         # Interceptors are set up in connect() after the transport mode
         # is finalised (shared-memory vs gRPC fallback).
@@ -236,7 +263,8 @@ class _Session:
         self.disconnect()
 
     def _initialize_stubs(self):
-        self.stubs = {stub.name: stub.value(self.channel) for stub in StubType}
+        # Stubs are created on first use so that only the services actually used are imported.
+        self.stubs = {}
 
     @property
     def server_url(self) -> str:
@@ -269,7 +297,24 @@ class _Session:
 
     def stub(self, name: str):
         if self.is_active():
-            return self.stubs.get(name)
+            stub = self.stubs.get(name)
+            if stub is None:
+                stub = self.stubs[name] = StubType[name].stub_class(self.channel)
+            return stub
+
+    def stats(self) -> dict[str, RpcMethodStats]:
+        """Get the statistics of each RPC method called by the session so far.
+
+        Statistics are only collected by sessions created with ``dump_traffic_log=True``. Use the ``rpc_stats`` \
+        attribute to export or reset them.
+
+        Returns
+        -------
+        dict of str to .RpcMethodStats
+            Statistics mapped by full name of the RPC method, sorted by decreasing total latency. The dictionary is \
+            empty if statistics are not collected.
+        """
+        return {} if self.rpc_stats is None else self.rpc_stats.snapshot()
 
     def is_active(self) -> bool:
         return self.channel is not None and self.stubs is not None
@@ -333,17 +378,44 @@ class _Session:
             channel_params["port"] = self.port_num
         return grpc.intercept_channel(create_channel(**channel_params), *self.interceptors)
 
+    def _create_aio_channel(self, interceptors):
+        # The transport helpers only create synchronous channels, so the target and options that they use for
+        # each transport mode are reproduced here.
+        options = (("grpc.default_authority", "localhost"),)
+        if self.shared_memory:
+            target = self.server_url
+        elif self._uses_uds():
+            target = f"unix:{self._get_uds_file()}"
+        elif self.transport_mode == "wnua" and self._is_windows():
+            target = f"localhost:{self.port_num}"
+        elif self.transport_mode == "insecure":
+            target, options = f"localhost:{self.port_num}", None
+        else:
+            raise ValueError(f'Asynchronous sessions do not support the "{self.transport_mode}" transport mode.')
+        return grpc.aio.insecure_channel(target, options=options, interceptors=interceptors)
+
     def _uses_uds(self):
         return self.transport_mode == "uds"
 
     def _setup_interceptors(self):
         """Create the interceptor chain based on the current transport mode."""
+        tracing_interceptor = TracingInterceptor(LOGGER)
+        profiling_interceptor = ProfilingInterceptor(LOGGER, lambda: self.rpc_profiler)
+        recording_interceptor = RecordingInterceptor(LOGGER, lambda: self.rpc_recorder)
         if self.shared_memory:
-            self.interceptors = [SharedMemoryInterceptor(LOGGER, self._shm_transport)]
+            self.interceptors = [
+                tracing_interceptor,
+                profiling_interceptor,
+                recording_interceptor,
+                SharedMemoryInterceptor(LOGGER, self._shm_transport, self.rpc_stats),
+            ]
         else:
             self.interceptors = [
-                IOInterceptor(LOGGER, self.rpc_counter),
+                tracing_interceptor,
+                profiling_interceptor,
+                IOInterceptor(LOGGER, self.rpc_stats),
                 ExceptionInterceptor(LOGGER),
+                recording_interceptor,
             ]
 
     def connect(self):
@@ -389,11 +461,13 @@ class _Session:
         )
 
     def disconnect(self):
-        if self.rpc_counter is not None:
-            print("pyedb-core session traffic:" + os.linesep + json.dumps(self.rpc_counter, indent=4))
+        if self.rpc_stats is not None:
+            print("pyedb-core session traffic:" + os.linesep + self.rpc_stats.to_json())
         if self.stubs is not None:
             self.stubs = None
 
+        identity_map.clear_session(self)
+
         if self.channel is not None:
             self.channel.close()
             self.channel = None
@@ -413,6 +487,7 @@ class _Session:
         if self.is_launch():
             self.stop_server()
             self.clean_up_uds_file()
+            _release_port(self.port_num)
 
     def start_server(self):
         if not self.is_local():
@@ -486,148 +561,205 @@ class _Session:
 
 
 class StubType(Enum):
-    """Provides an enum representing available service stub types."""
-
-    cell = CellServiceStub
-    database = DatabaseServiceStub
-    layer_collection = LayerCollectionServiceStub
-    layer = LayerServiceStub
-    stackup_layer = StackupLayerServiceStub
-    via_layer = ViaLayerServiceStub
-    layout = LayoutServiceStub
-    material = MaterialDefServiceStub
-    net = NetServiceStub
-    primitive = PrimitiveServiceStub
-    polygon = PolygonServiceStub
-    polygon_data = PolygonDataServiceStub
-    path = PathServiceStub
-    rectangle = RectangleServiceStub
-    via_group = ViaGroupServiceStub
-    circle = CircleServiceStub
-    technology = TechnologyDefServiceStub
-    text = TextServiceStub
-    terminal = TerminalServiceStub
-    terminal_instance = TerminalInstanceServiceStub
-    terminal_instance_terminal = TerminalInstanceTerminalServiceStub
-    bundle_terminal = BundleTerminalServiceStub
-    edge = EdgeServiceStub
-    edge_terminal = EdgeTerminalServiceStub
-    point_terminal = PointTerminalServiceStub
-    padstack_instance_terminal = PadstackInstanceTerminalServiceStub
-    pin_group = PinGroupServiceStub
-    pin_group_terminal = PinGroupTerminalServiceStub
-    bondwire = BondwireServiceStub
-    bondwire_def = BondwireDefServiceStub
-    apd_bondwire_def = ApdBondwireDefServiceStub
-    jedec4_bondwire_def = Jedec4BondwireDefServiceStub
-    jedec5_bondwire_def = Jedec5BondwireDefServiceStub
-    padstack_def = PadstackDefServiceStub
-    value = ValueServiceStub
-    variable_server = VariableServerServiceStub
-    cell_instance = CellInstanceServiceStub
-    inst_array = InstArrayServiceStub
-    hierarchy_obj = HierarchyObjectServiceStub
-    group = GroupServiceStub
-    netclass = NetClassServiceStub
-    layer_map = LayerMapServiceStub
-    point_data = PointDataServiceStub
-    arc_data = ArcDataServiceStub
-    padstack_instance = PadstackInstanceServiceStub
-    voltage_regulator = VoltageRegulatorServiceStub
-    connectable = ConnectableServiceStub
-    component_group = ComponentGroupServiceStub
-    layout_obj = LayoutObjServiceStub
-    structure3d = Structure3DServiceStub
-    layout_instance = LayoutInstanceServiceStub
-    layout_instance_context = LayoutInstanceContextServiceStub
-    layout_obj_instance = LayoutObjInstanceServiceStub
-    layout_obj_instance_geometry = LayoutObjInstanceGeometryServiceStub
-    layout_obj_instance_2d_geometry = LayoutObjInstance2DGeometryServiceStub
-    layout_obj_instance_3d_geometry = LayoutObjInstance3DGeometryServiceStub
-    component_def = ComponentDefServiceStub
-    component_pin = ComponentPinServiceStub
-    component_model = ComponentModelServiceStub
-    nport_component_model = NPortComponentModelServiceStub
-    dyn_link_component_model = DynamicLinkComponentModelServiceStub
-    extended_net = ExtendedNetServiceStub
-    padstack_def_data = PadstackDefDataServiceStub
-    differential_pair = DifferentialPairServiceStub
-    solder_ball_property = SolderBallPropertyServiceStub
-    component_property = ComponentPropertyServiceStub
-    ic_component_property = ICComponentPropertyServiceStub
-    die_property = DiePropertyServiceStub
-    port_property = PortPropertyServiceStub
-    dataset_def = DatasetDefServiceStub
-    package_def = PackageDefServiceStub
-    dielectric_material_model = DielectricMaterialModelServiceStub
-    debye_model = DebyeModelServiceStub
-    multipole_debye_model = MultipoleDebyeModelServiceStub
-    djordecvic_sarkar_model = DjordjecvicSarkarModelServiceStub
-    mcad_model = McadModelServiceStub
-    material_property_thermal_modifier = MaterialPropertyThermalModifierServiceStub
-    r_tree = RTreeServiceStub
-    pin_pair_model = PinPairModelServiceStub
-    board_bend_def = BoardBendDefServiceStub
-    sparameter_model = SParameterModelServiceStub
-    spice_model = SpiceModelServiceStub
-    netlist_model = NetlistModelServiceStub
-    model = ModelServiceStub
-    transform = TransformServiceStub
-    io_component_property = IOComponentPropertyServiceStub
-    rlc_component_property = RLCComponentPropertyServiceStub
-    transform3d = Transform3DServiceStub
-    hfss_general_sim_settings = HFSSGeneralSettingsServiceStub
-    hfss_options_sim_settings = HFSSOptionsSettingsServiceStub
-    hfss_advanced_sim_settings = HFSSAdvancedSettingsServiceStub
-    hfss_advanced_sim_meshing_settings = HFSSAdvancedMeshingSettingsServiceStub
-    hfss_solver_sim_settings = HFSSSolverSettingsServiceStub
-    hfss_dcr_sim_settings = DCRSettingsServiceStub
-    hfss_sim_setup = HfssSimulationSetupServiceStub
-    hfss_pi_general_sim_settings = HFSSPIGeneralSettingsServiceStub
-    hfss_pi_advanced_sim_settings = HFSSPIAdvancedSettingsServiceStub
-    hfss_pi_solver_sim_settings = HFSSPISolverSettingsServiceStub
-    siwave_psi_general_sim_settings = SIWavePSIGeneralSettingsServiceStub
-    siwave_psi_net_processing_sim_settings = SIWavePSINetProcessingSettingsServiceStub
-    siwave_psi_power_ground_sim_settings = SIWavePSIPowerGroundNetsServiceStub
-    siwave_psi_signal_nets_sim_settings = SIWavePSISignalNetsSettingsServiceStub
-    sim_setup = SimulationSetupServiceStub
-    sim_settings = SimulationSettingsServiceStub
-    sim_settings_options = SettingsOptionsServiceStub
-    advanced_sim_settings = AdvancedSettingsServiceStub
-    advanced_mesh_sim_settings = AdvancedMeshingSettingsServiceStub
-    solver_sim_settings = SolverSettingsServiceStub
-    siwave_general_sim_settings = SIWaveGeneralSettingsServiceStub
-    siwave_advanced_sim_settings = SIWaveAdvancedSettingsServiceStub
-    siwave_dc_sim_settings = SIWaveDCSettingsServiceStub
-    siwave_dc_advanced_sim_settings = SIWaveDCAdvancedSettingsServiceStub
-    siwave_s_param_sim_settings = SIWaveSParameterSettingsServiceStub
-    siwave_dcir_sim_settings = SIWaveDCIRSimulationSettingsServiceStub
-    raptor_x_general_sim_settings = RaptorXGeneralSettingsServiceStub
-    raptor_x_adv_sim_settings = RaptorXAdvancedSettingsServiceStub
-    layout_component = LayoutComponentServiceStub
-    io_manager = IOManagerServiceStub
-    primitive_instance_collection = PrimitiveInstanceCollectionServiceStub
-    edb_error_manager = EDBErrorManagerServiceStub
-    q3d_advanced_sim_settings = Q3DAdvancedSettingsServiceStub
-    q3d_advanced_meshing_sim_settings = Q3DAdvancedMeshingSettingsServiceStub
-    q3d_cg_sim_settings = Q3DCGSettingsServiceStub
-    q3d_dcrl_sim_settings = Q3DDCRLSettingsServiceStub
-    q3d_general_sim_settings = Q3DGeneralSettingsServiceStub
-    q3d_sim_settings = Q3DSettingsServiceStub
-    siwave_cpa_sim_settings = SIWaveCPASimulationSettingsServiceStub
-    siwave_cpa_settings = SIWaveCPASettingsServiceStub
-    siwave_cpa_advanced_settings = SIWaveCPAAdvancedSettingsServiceStub
-    siwave_cpa_q3d_settings = SIWaveCPAQ3DSettingsServiceStub
-    siwave_cpa_net_settings = SIWaveCPANetSettingsServiceStub
-    siwave_cpa_external_env_settings = SIWaveCPAExternalEnvSettingsServiceStub
-    siwave_cpa_die_config_settings = SIWaveCPADieConfigSettingsServiceStub
-    siwave_cpa_channel_component_settings = SIWaveCPAChannelComponentSettingsServiceStub
-    siwave_cpa_vrm_settings = SIWaveCPAVRMSettingsServiceStub
-    siwave_cpa_unconnected_die_pin_settings = SIWaveCPAUnconnectedDiePinSettingsServiceStub
-    siwave_cpa_hot_spot_component_settings = SIWaveCPAHotSpotComponentSettingsServiceStub
-
-
-def attach_session(ip_address: str | None = None, port_num: int = 50051, dump_traffic_log: bool = False):
+    """Provides an enum representing available service stub types.
+
+    Each value is the ``<module>.<class>`` path of the service stub class within ``ansys.api.edb.v1``. \
+    The module is only imported when the stub class is first needed.
+    """
+
+    cell = "cell_pb2_grpc.CellServiceStub"
+    database = "database_pb2_grpc.DatabaseServiceStub"
+    layer_collection = "layer_collection_pb2_grpc.LayerCollectionServiceStub"
+    layer = "layer_pb2_grpc.LayerServiceStub"
+    stackup_layer = "stackup_layer_pb2_grpc.StackupLayerServiceStub"
+    via_layer = "via_layer_pb2_grpc.ViaLayerServiceStub"
+    layout = "layout_pb2_grpc.LayoutServiceStub"
+    material = "material_def_pb2_grpc.MaterialDefServiceStub"
+    net = "net_pb2_grpc.NetServiceStub"
+    primitive = "primitive_pb2_grpc.PrimitiveServiceStub"
+    polygon = "polygon_pb2_grpc.PolygonServiceStub"
+    polygon_data = "polygon_data_pb2_grpc.PolygonDataServiceStub"
+    path = "path_pb2_grpc.PathServiceStub"
+    rectangle = "rectangle_pb2_grpc.RectangleServiceStub"
+    via_group = "via_group_pb2_grpc.ViaGroupServiceStub"
+    circle = "circle_pb2_grpc.CircleServiceStub"
+    technology = "technology_def_pb2_grpc.TechnologyDefServiceStub"
+    text = "text_pb2_grpc.TextServiceStub"
+    terminal = "term_pb2_grpc.TerminalServiceStub"
+    terminal_instance = "term_inst_pb2_grpc.TerminalInstanceServiceStub"
+    terminal_instance_terminal = "term_inst_term_pb2_grpc.TerminalInstanceTerminalServiceStub"
+    bundle_terminal = "bundle_term_pb2_grpc.BundleTerminalServiceStub"
+    edge = "edge_term_pb2_grpc.EdgeServiceStub"
+    edge_terminal = "edge_term_pb2_grpc.EdgeTerminalServiceStub"
+    point_terminal = "point_term_pb2_grpc.PointTerminalServiceStub"
+    padstack_instance_terminal = "padstack_inst_term_pb2_grpc.PadstackInstanceTerminalServiceStub"
+    pin_group = "pin_group_pb2_grpc.PinGroupServiceStub"
+    pin_group_terminal = "pin_group_term_pb2_grpc.PinGroupTerminalServiceStub"
+    bondwire = "bondwire_pb2_grpc.BondwireServiceStub"
+    bondwire_def = "bondwire_def_pb2_grpc.BondwireDefServiceStub"
+    apd_bondwire_def = "bondwire_def_pb2_grpc.ApdBondwireDefServiceStub"
+    jedec4_bondwire_def = "bondwire_def_pb2_grpc.Jedec4BondwireDefServiceStub"
+    jedec5_bondwire_def = "bondwire_def_pb2_grpc.Jedec5BondwireDefServiceStub"
+    padstack_def = "padstack_def_pb2_grpc.PadstackDefServiceStub"
+    value = "value_pb2_grpc.ValueServiceStub"
+    variable_server = "variable_server_pb2_grpc.VariableServerServiceStub"
+    cell_instance = "cell_instance_pb2_grpc.CellInstanceServiceStub"
+    inst_array = "inst_array_pb2_grpc.InstArrayServiceStub"
+    hierarchy_obj = "hierarchy_obj_pb2_grpc.HierarchyObjectServiceStub"
+    group = "group_pb2_grpc.GroupServiceStub"
+    netclass = "net_class_pb2_grpc.NetClassServiceStub"
+    layer_map = "layer_map_pb2_grpc.LayerMapServiceStub"
+    point_data = "point_data_pb2_grpc.PointDataServiceStub"
+    arc_data = "arc_data_pb2_grpc.ArcDataServiceStub"
+    padstack_instance = "padstack_instance_pb2_grpc.PadstackInstanceServiceStub"
+    voltage_regulator = "voltage_regulator_pb2_grpc.VoltageRegulatorServiceStub"
+    connectable = "connectable_pb2_grpc.ConnectableServiceStub"
+    component_group = "component_group_pb2_grpc.ComponentGroupServiceStub"
+    layout_obj = "layout_obj_pb2_grpc.LayoutObjServiceStub"
+    structure3d = "structure_3d_pb2_grpc.Structure3DServiceStub"
+    layout_instance = "layout_instance_pb2_grpc.LayoutInstanceServiceStub"
+    layout_instance_context = "layout_instance_context_pb2_grpc.LayoutInstanceContextServiceStub"
+    layout_obj_instance = "layout_obj_instance_pb2_grpc.LayoutObjInstanceServiceStub"
+    layout_obj_instance_geometry = "layout_obj_instance_geometry_pb2_grpc.LayoutObjInstanceGeometryServiceStub"
+    layout_obj_instance_2d_geometry = "layout_obj_instance_2d_geometry_pb2_grpc.LayoutObjInstance2DGeometryServiceStub"
+    layout_obj_instance_3d_geometry = "layout_obj_instance_3d_geometry_pb2_grpc.LayoutObjInstance3DGeometryServiceStub"
+    component_def = "component_def_pb2_grpc.ComponentDefServiceStub"
+    component_pin = "component_pin_pb2_grpc.ComponentPinServiceStub"
+    component_model = "component_model_pb2_grpc.ComponentModelServiceStub"
+    nport_component_model = "component_model_pb2_grpc.NPortComponentModelServiceStub"
+    dyn_link_component_model = "component_model_pb2_grpc.DynamicLinkComponentModelServiceStub"
+    extended_net = "extended_net_pb2_grpc.ExtendedNetServiceStub"
+    padstack_def_data = "padstack_def_data_pb2_grpc.PadstackDefDataServiceStub"
+    differential_pair = "differential_pair_pb2_grpc.DifferentialPairServiceStub"
+    solder_ball_property = "solder_ball_property_pb2_grpc.SolderBallPropertyServiceStub"
+    component_property = "component_property_pb2_grpc.ComponentPropertyServiceStub"
+    ic_component_property = "ic_component_property_pb2_grpc.ICComponentPropertyServiceStub"
+    die_property = "die_property_pb2_grpc.DiePropertyServiceStub"
+    port_property = "port_property_pb2_grpc.PortPropertyServiceStub"
+    dataset_def = "dataset_def_pb2_grpc.DatasetDefServiceStub"
+    package_def = "package_def_pb2_grpc.PackageDefServiceStub"
+    dielectric_material_model = "dielectric_material_model_pb2_grpc.DielectricMaterialModelServiceStub"
+    debye_model = "debye_model_pb2_grpc.DebyeModelServiceStub"
+    multipole_debye_model = "multipole_debye_model_pb2_grpc.MultipoleDebyeModelServiceStub"
+    djordecvic_sarkar_model = "djordjecvic_sarkar_model_pb2_grpc.DjordjecvicSarkarModelServiceStub"
+    mcad_model = "mcad_model_pb2_grpc.McadModelServiceStub"
+    material_property_thermal_modifier = (
+        "material_property_thermal_modifier_pb2_grpc.MaterialPropertyThermalModifierServiceStub"
+    )
+    r_tree = "r_tree_pb2_grpc.RTreeServiceStub"
+    pin_pair_model = "pin_pair_model_pb2_grpc.PinPairModelServiceStub"
+    board_bend_def = "board_bend_def_pb2_grpc.BoardBendDefServiceStub"
+    sparameter_model = "s_parameter_model_pb2_grpc.SParameterModelServiceStub"
+    spice_model = "spice_model_pb2_grpc.SpiceModelServiceStub"
+    netlist_model = "netlist_model_pb2_grpc.NetlistModelServiceStub"
+    model = "model_pb2_grpc.ModelServiceStub"
+    transform = "transform_pb2_grpc.TransformServiceStub"
+    io_component_property = "io_component_property_pb2_grpc.IOComponentPropertyServiceStub"
+    rlc_component_property = "rlc_component_property_pb2_grpc.RLCComponentPropertyServiceStub"
+    transform3d = "transform_3d_pb2_grpc.Transform3DServiceStub"
+    hfss_general_sim_settings = "hfss_simulation_settings_pb2_grpc.HFSSGeneralSettingsServiceStub"
+    hfss_options_sim_settings = "hfss_simulation_settings_pb2_grpc.HFSSOptionsSettingsServiceStub"
+    hfss_advanced_sim_settings = "hfss_simulation_settings_pb2_grpc.HFSSAdvancedSettingsServiceStub"
+    hfss_advanced_sim_meshing_settings = "hfss_simulation_settings_pb2_grpc.HFSSAdvancedMeshingSettingsServiceStub"
+    hfss_solver_sim_settings = "hfss_simulation_settings_pb2_grpc.HFSSSolverSettingsServiceStub"
+    hfss_dcr_sim_settings = "hfss_simulation_settings_pb2_grpc.DCRSettingsServiceStub"
+    hfss_sim_setup = "hfss_simulation_setup_pb2_grpc.HfssSimulationSetupServiceStub"
+    hfss_pi_general_sim_settings = "hfss_pi_simulation_settings_pb2_grpc.HFSSPIGeneralSettingsServiceStub"
+    hfss_pi_advanced_sim_settings = "hfss_pi_simulation_settings_pb2_grpc.HFSSPIAdvancedSettingsServiceStub"
+    hfss_pi_solver_sim_settings = "hfss_pi_simulation_settings_pb2_grpc.HFSSPISolverSettingsServiceStub"
+    siwave_psi_general_sim_settings = "si_wave_psi_simulation_settings_pb2_grpc.SIWavePSIGeneralSettingsServiceStub"
+    siwave_psi_net_processing_sim_settings = (
+        "si_wave_psi_simulation_settings_pb2_grpc.SIWavePSINetProcessingSettingsServiceStub"
+    )
+    siwave_psi_power_ground_sim_settings = (
+        "si_wave_psi_simulation_settings_pb2_grpc.SIWavePSIPowerGroundNetsServiceStub"
+    )
+    siwave_psi_signal_nets_sim_settings = (
+        "si_wave_psi_simulation_settings_pb2_grpc.SIWavePSISignalNetsSettingsServiceStub"
+    )
+    sim_setup = "simulation_setup_pb2_grpc.SimulationSetupServiceStub"
+    sim_settings = "simulation_settings_pb2_grpc.SimulationSettingsServiceStub"
+    sim_settings_options = "simulation_settings_pb2_grpc.SettingsOptionsServiceStub"
+    advanced_sim_settings = "simulation_settings_pb2_grpc.AdvancedSettingsServiceStub"
+    advanced_mesh_sim_settings = "simulation_settings_pb2_grpc.AdvancedMeshingSettingsServiceStub"
+    solver_sim_settings = "simulation_settings_pb2_grpc.SolverSettingsServiceStub"
+    siwave_general_sim_settings = "si_wave_simulation_settings_pb2_grpc.SIWaveGeneralSettingsServiceStub"
+    siwave_advanced_sim_settings = "si_wave_simulation_settings_pb2_grpc.SIWaveAdvancedSettingsServiceStub"
+    siwave_dc_sim_settings = "si_wave_simulation_settings_pb2_grpc.SIWaveDCSettingsServiceStub"
+    siwave_dc_advanced_sim_settings = "si_wave_simulation_settings_pb2_grpc.SIWaveDCAdvancedSettingsServiceStub"
+    siwave_s_param_sim_settings = "si_wave_simulation_settings_pb2_grpc.SIWaveSParameterSettingsServiceStub"
+    siwave_dcir_sim_settings = "si_wave_dcir_simulation_settings_pb2_grpc.SIWaveDCIRSimulationSettingsServiceStub"
+    raptor_x_general_sim_settings = "raptor_x_simulation_settings_pb2_grpc.RaptorXGeneralSettingsServiceStub"
+    raptor_x_adv_sim_settings = "raptor_x_simulation_settings_pb2_grpc.RaptorXAdvancedSettingsServiceStub"
+    layout_component = "layout_component_pb2_grpc.LayoutComponentServiceStub"
+    io_manager = "io_manager_pb2_grpc.IOManagerServiceStub"
+    primitive_instance_collection = "primitive_instance_collection_pb2_grpc.PrimitiveInstanceCollectionServiceStub"
+    edb_error_manager = "edb_error_manager_pb2_grpc.EDBErrorManagerServiceStub"
+    q3d_advanced_sim_settings = "q3d_simulation_settings_pb2_grpc.Q3DAdvancedSettingsServiceStub"
+    q3d_advanced_meshing_sim_settings = "q3d_simulation_settings_pb2_grpc.Q3DAdvancedMeshingSettingsServiceStub"
+    q3d_cg_sim_settings = "q3d_simulation_settings_pb2_grpc.Q3DCGSettingsServiceStub"
+    q3d_dcrl_sim_settings = "q3d_simulation_settings_pb2_grpc.Q3DDCRLSettingsServiceStub"
+    q3d_general_sim_settings = "q3d_simulation_settings_pb2_grpc.Q3DGeneralSettingsServiceStub"
+    q3d_sim_settings = "q3d_simulation_settings_pb2_grpc.Q3DSettingsServiceStub"
+    siwave_cpa_sim_settings = "si_wave_cpa_simulation_settings_pb2_grpc.SIWaveCPASimulationSettingsServiceStub"
+    siwave_cpa_settings = "si_wave_cpa_simulation_settings_pb2_grpc.SIWaveCPASettingsServiceStub"
+    siwave_cpa_advanced_settings = "si_wave_cpa_simulation_settings_pb2_grpc.SIWaveCPAAdvancedSettingsServiceStub"
+    siwave_cpa_q3d_settings = "si_wave_cpa_simulation_settings_pb2_grpc.SIWaveCPAQ3DSettingsServiceStub"
+    siwave_cpa_net_settings = "si_wave_cpa_simulation_settings_pb2_grpc.SIWaveCPANetSettingsServiceStub"
+    siwave_cpa_external_env_settings = (
+        "si_wave_cpa_simulation_settings_pb2_grpc.SIWaveCPAExternalEnvSettingsServiceStub"
+    )
+    siwave_cpa_die_config_settings = "si_wave_cpa_simulation_settings_pb2_grpc.SIWaveCPADieConfigSettingsServiceStub"
+    siwave_cpa_channel_component_settings = (
+        "si_wave_cpa_simulation_settings_pb2_grpc.SIWaveCPAChannelComponentSettingsServiceStub"
+    )
+    siwave_cpa_vrm_settings = "si_wave_cpa_simulation_settings_pb2_grpc.SIWaveCPAVRMSettingsServiceStub"
+    siwave_cpa_unconnected_die_pin_settings = (
+        "si_wave_cpa_simulation_settings_pb2_grpc.SIWaveCPAUnconnectedDiePinSettingsServiceStub"
+    )
+    siwave_cpa_hot_spot_component_settings = (
+        "si_wave_cpa_simulation_settings_pb2_grpc.SIWaveCPAHotSpotComponentSettingsServiceStub"
+    )
+
+    @property
+    def stub_class(self) -> type:
+        """:obj:`type`: Service stub class of the stub type.
+
+        This property is read-only.
+        """
+        return _import_stub_class(self.value)
+
+
+@cache
+def _import_stub_class(stub_path: str) -> type:
+    module_name, class_name = stub_path.rsplit(".", 1)
+    return getattr(import_module(f"ansys.api.edb.v1.{module_name}"), class_name)
+
+
+@cache
+def _import_service_messages(service_name: str):
+    """Import the message module defining a service, given the full name of the service."""
+    for stub_type in StubType:
+        module_name, class_name = stub_type.value.rsplit(".", 1)
+        if service_name == f"ansys.api.edb.v1.{class_name.removesuffix('Stub')}":
+            return import_module(f"ansys.api.edb.v1.{module_name.removesuffix('_grpc')}")
+    raise ValueError(f"Unknown service '{service_name}'.")
+
+
+_STUB_PATHS = {stub_type.value.rsplit(".", 1)[1]: stub_type.value for stub_type in StubType}
+
+
+def __getattr__(name: str):
+    """Import the service stub classes that used to be imported eagerly by this module on first access."""
+    stub_path = _STUB_PATHS.get(name)
+    if stub_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return _import_stub_class(stub_path)
+
+
+def attach_session(
+    ip_address: str | None = None, port_num: int = 50051, dump_traffic_log: bool = False, make_current: bool = True
+):
     """Attach a session to a port running the EDB API server.
 
     Parameters
@@ -638,11 +770,18 @@ def attach_session(ip_address: str | None = None, port_num: int = 50051, dump_tr
     port_num : int, default: 50051
         Port number that the server is listening on.
     dump_traffic_log : bool, default: False
-        Flag indicating if the network traffic log should be dumped when the session is disconnected.
+        Flag indicating if RPC statistics should be collected and the network traffic log should be dumped when \
+        the session is disconnected. The statistics can be queried while the session is in use with ``stats()``.
+    make_current : bool, default: True
+        Flag indicating if the session should become the current session of the process. If ``False``, \
+        the session must be bound with :func:`use_session` before it is used, and any number of such \
+        sessions can be attached at the same time.
     """
-    MOD.current_session = _Session(ip_address, port_num, None, dump_traffic_log)
-    MOD.current_session.connect()
-    return MOD.current_session
+    edb_session = _Session(ip_address, port_num, None, dump_traffic_log, make_current=make_current)
+    if make_current:
+        MOD.current_session = edb_session
+    edb_session.connect()
+    return edb_session
 
 
 def launch_session(
@@ -650,6 +789,7 @@ def launch_session(
     port_num: int | None = None,
     dump_traffic_log: bool = False,
     use_shared_memory_ipc: bool = False,
+    make_current: bool = True,
 ):
     r"""Launch a local session to an EDB API server.
 
@@ -663,13 +803,18 @@ def launch_session(
         Port number to listen on. The default is ``None``, in which case a port in [50051, 60000]
         is selected.
     dump_traffic_log : bool, default: False
-        Flag indicating if the network traffic log should be dumped when the session is disconnected.
+        Flag indicating if RPC statistics should be collected and the network traffic log should be dumped when \
+        the session is disconnected. The statistics can be queried while the session is in use with ``stats()``.
     use_shared_memory_ipc : bool, default: False
         Flag indicating if shared-memory IPC should be used for client/server communication.
         When ``True``, data is transferred via a shared memory region instead of over the network,
         which can significantly boost performance for large data transfers.
         If the installed server does not support shared memory, the session falls back to standard
         gRPC communication automatically.
+    make_current : bool, default: True
+        Flag indicating if the session should become the current session of the process. If ``False``, \
+        the session must be bound with :func:`use_session` before it is used, and any number of such \
+        sessions can be launched at the same time, for example to drive one server per thread.
 
     Examples
     --------
@@ -681,6 +826,17 @@ def launch_session(
     """
     ip_address = None  # remote launch is not supported yet
 
+    if not make_current:
+        edb_session = _Session(
+            ip_address, port_num, ansys_em_root, dump_traffic_log, use_shared_memory_ipc, make_current=False
+        )
+        try:
+            edb_session.connect()
+        except Exception:
+            edb_session.disconnect()
+            raise
+        return edb_session
+
     try:
         _ensure_session(ansys_em_root, port_num, ip_address, dump_traffic_log, use_shared_memory_ipc)
         return MOD.current_session
@@ -715,7 +871,8 @@ def session(
            This parameter is currently not supported. In future releases, this parameter is to
            support remotely running the API on another machine.
     dump_traffic_log : bool, default: False
-        Flag indicating if the network traffic log should be dumped when the session is disconnected.
+        Flag indicating if RPC statistics should be collected and the network traffic log should be dumped when \
+        the session is disconnected. The statistics can be queried while the session is in use with ``stats()``.
     use_shared_memory_ipc : bool, default: False
         Flag indicating if shared-memory IPC should be used for client/server communication.
         When ``True``, data is transferred via a shared memory region instead of over the network,
@@ -789,7 +946,59 @@ def is_in_memory() -> bool:
     bool
         ``True`` if the current session is an in-memory session, ``False`` otherwise.
     """
-    return MOD.current_session is not None and MOD.current_session.shared_memory
+    edb_session = get_current_session()
+    return edb_session is not None and edb_session.shared_memory
+
+
+def get_current_session() -> _Session | None:
+    """Get the session used by the current thread or task.
+
+    Returns
+    -------
+    _Session or None
+        Session bound with :func:`use_session` if there is one, otherwise the current session of the process. \
+        ``None`` is returned if there is no session.
+    """
+    return _BOUND_SESSION.get() or MOD.current_session
+
+
+io_manager._get_current_session = get_current_session
+identity_map._get_current_session = get_current_session
+
+
+@contextmanager
+def use_session(edb_session: _Session):
+    """Use a session for all code called by the current thread or task within the context manager.
+
+    The session is bound through a context variable, so other threads and tasks can use other sessions at the same \
+    time. EDB objects must only be used with the session they were obtained from.
+
+    Parameters
+    ----------
+    edb_session : _Session
+        Session to use, such as one returned by :func:`launch_session` with ``make_current=False``.
+
+    Examples
+    --------
+    Process several databases in parallel with one server per thread.
+
+    >>> def process(path):
+    >>>     edb_session = launch_session(ansys_em_root, make_current=False)
+    >>>     try:
+    >>>         with use_session(edb_session):
+    >>>             db = Database.open(path, True)
+    >>>             # program goes here
+    >>>             db.close()
+    >>>     finally:
+    >>>         edb_session.disconnect()
+    >>> with ThreadPoolExecutor() as executor:
+    >>>     list(executor.map(process, paths))
+    """
+    token = _BOUND_SESSION.set(edb_session)
+    try:
+        yield edb_session
+    finally:
+        _BOUND_SESSION.reset(token)
 
 
 def _ensure_session(
@@ -810,7 +1019,8 @@ def _ensure_session(
     ip_address : str or None
         IP address where the server executable file is running.
     dump_traffic_log : bool
-        Flag indicating if the network traffic log should be dumped when the session is disconnected.
+        Flag indicating if RPC statistics should be collected and the network traffic log should be dumped when \
+        the session is disconnected. The statistics can be queried while the session is in use with ``stats()``.
     use_shared_memory_ipc : bool, default: False
         Flag indicating if shared-memory IPC should be used for client/server communication.
     """
@@ -841,12 +1051,23 @@ def _find_available_port(
     Returns
     -------
     int
-        First available port in the range.
+        First available port in the range. The port is reserved until it is released with :func:`_release_port`, \
+        so it is not returned again in the meantime.
     """
-    for port in range(start_port, end_port):
-        if check_uds and os.path.exists(_Session._get_uds_file_from_port_num(port)):
-            continue
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
-            if sock.connect_ex((interface or DEFAULT_ADDRESS, port)) == errno.ECONNREFUSED:
-                return port
+    with _reserved_ports_lock:
+        for port in range(start_port, end_port):
+            if port in _reserved_ports:
+                continue
+            if check_uds and os.path.exists(_Session._get_uds_file_from_port_num(port)):
+                continue
+            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+                if sock.connect_ex((interface or DEFAULT_ADDRESS, port)) == errno.ECONNREFUSED:
+                    _reserved_ports.add(port)
+                    return port
     raise RuntimeError("No available ports found")
+
+
+def _release_port(port: int):
+    """Make a port returned by :func:`_find_available_port` available to other sessions of the process again."""
+    with _reserved_ports_lock:
+        _reserved_ports.discard(port)
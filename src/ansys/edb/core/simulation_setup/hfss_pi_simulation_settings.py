@@ -49,7 +49,7 @@ class HFSSPIGeneralSettings(SimulationSettingsBase):
     __stub: HFSSPIGeneralSettingsServiceStub = StubAccessor(StubType.hfss_pi_general_sim_settings)
 
     @property
-    def model_type(self):
+    def model_type(self) -> HFSSPIModelType:
         """:class:`.HFSSPIModelType`: Model type."""
         return HFSSPIModelType(self.__stub.GetHFSSPIModelType(self.msg).hfss_pi_model_type)
 
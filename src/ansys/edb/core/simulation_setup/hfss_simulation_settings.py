@@ -14,12 +14,16 @@ from ansys.edb.core.session import HFSSOptionsSettingsServiceStub
 from ansys.edb.core.session import HFSSSolverSettingsServiceStub
 from ansys.edb.core.session import StubAccessor
 from ansys.edb.core.session import StubType
+from ansys.edb.core.simulation_setup.adaptive_solutions import BroadbandAdaptiveSolution
+from ansys.edb.core.simulation_setup.adaptive_solutions import MultiFrequencyAdaptiveSolution
+from ansys.edb.core.simulation_setup.adaptive_solutions import SingleFrequencyAdaptiveSolution
 from ansys.edb.core.simulation_setup.simulation_settings import AdvancedMeshingSettings
 from ansys.edb.core.simulation_setup.simulation_settings import AdvancedSettings
 from ansys.edb.core.simulation_setup.simulation_settings import SettingsOptions
 from ansys.edb.core.simulation_setup.simulation_settings import SimulationSettings
 from ansys.edb.core.simulation_setup.simulation_settings import SimulationSettingsBase
 from ansys.edb.core.simulation_setup.simulation_settings import SolverSettings
+from ansys.edb.core.simulation_setup.simulation_settings import _register_message_conversion
 
 
 class BasisFunctionOrder(Enum):
@@ -89,8 +93,8 @@ class HFSSGeneralSettings(SimulationSettingsBase):
     __stub: HFSSGeneralSettingsServiceStub = StubAccessor(StubType.hfss_general_sim_settings)
 
     @property
-    def single_frequency_adaptive_solution(self):
-        """.SingleFrequencyAdaptiveSolution`: Settings for a single frequency adaptive solution."""
+    def single_frequency_adaptive_solution(self) -> SingleFrequencyAdaptiveSolution:
+        """:class:`.SingleFrequencyAdaptiveSolution`: Settings for a single frequency adaptive solution."""
         return parser.to_single_frequency_adaptive_solution(self.__stub.GetSingleFrequencyAdaptiveSolution(self.msg))
 
     @single_frequency_adaptive_solution.setter
@@ -103,7 +107,7 @@ class HFSSGeneralSettings(SimulationSettingsBase):
         )
 
     @property
-    def multi_frequency_adaptive_solution(self):
+    def multi_frequency_adaptive_solution(self) -> MultiFrequencyAdaptiveSolution:
         """:class:`.MultiFrequencyAdaptiveSolution`: Settings for a multi-frequency adaptive solution."""
         return parser.to_multi_frequency_adaptive_solution(self.__stub.GetMultiFrequencyAdaptiveSolution(self.msg))
 
@@ -117,7 +121,7 @@ class HFSSGeneralSettings(SimulationSettingsBase):
         )
 
     @property
-    def broadband_adaptive_solution(self):
+    def broadband_adaptive_solution(self) -> BroadbandAdaptiveSolution:
         """:class:`.BroadbandAdaptiveSolution`: Settings for a broadband adaptive solution."""
         return parser.to_broadband_adaptive_solution(self.__stub.GetBroadbandFrequencyAdaptiveSolution(self.msg))
 
@@ -131,7 +135,7 @@ class HFSSGeneralSettings(SimulationSettingsBase):
         )
 
     @property
-    def adaptive_solution_type(self):
+    def adaptive_solution_type(self) -> AdaptType:
         """:class:`AdaptType`: Adaptive solution type that is set for the simulation."""
         return AdaptType(self.__stub.GetAdaptType(self.msg).adapt_type)
 
@@ -227,7 +231,7 @@ class HFSSSettingsOptions(SettingsOptions):
         self.__stub.SetMinConvergedPasses(messages.uint64_property_message(self, min_refinement_passes))
 
     @property
-    def order_basis(self):
+    def order_basis(self) -> BasisFunctionOrder:
         """:class:`.BasisFunctionOrder`: Basis function order."""
         return BasisFunctionOrder(self.__stub.GetBasisFunctionOrder(self.msg).basis_function_order)
 
@@ -238,7 +242,7 @@ class HFSSSettingsOptions(SettingsOptions):
         )
 
     @property
-    def solve_inside_metal_basis(self):
+    def solve_inside_metal_basis(self) -> BasisFunctionOrder:
         """:class:`.BasisFunctionOrder`: Basis function order."""
         return BasisFunctionOrder(self.__stub.GetSolveInsideMetalBasis(self.msg).basis_function_order)
 
@@ -249,7 +253,7 @@ class HFSSSettingsOptions(SettingsOptions):
         )
 
     @property
-    def solver_type(self):
+    def solver_type(self) -> SolverType:
         """:class:`.SolverType`: HFSS solver type."""
         return SolverType(self.__stub.GetSolverTypeOrder(self.msg).solver_type)
 
@@ -429,3 +433,23 @@ class HFSSDCRSettings(SimulationSettingsBase):
     @percent_refinement_per_pass.setter
     def percent_refinement_per_pass(self, percent_refinement_per_pass):
         self.__stub.SetPercentRefinementPerPass(messages.double_property_message(self, percent_refinement_per_pass))
+
+
+_register_message_conversion(
+    SingleFrequencyAdaptiveSolution,
+    messages.single_frequency_adaptive_solution_msg,
+    pb.SingleFrequencyAdaptiveSolutionMessage,
+    parser.to_single_frequency_adaptive_solution,
+)
+_register_message_conversion(
+    MultiFrequencyAdaptiveSolution,
+    messages.multi_frequency_adaptive_solution_msg,
+    pb.MultiFrequencyAdaptiveSolutionMessage,
+    parser.to_multi_frequency_adaptive_solution,
+)
+_register_message_conversion(
+    BroadbandAdaptiveSolution,
+    messages.broadband_solution_msg,
+    pb.BroadbandFrequencyAdaptiveSolutionMessage,
+    parser.to_broadband_adaptive_solution,
+)
@@ -9,6 +9,10 @@ from ansys.edb.core.session import HfssSimulationSetupServiceStub
 from ansys.edb.core.session import StubAccessor
 from ansys.edb.core.session import StubType
 from ansys.edb.core.simulation_setup.hfss_simulation_settings import HFSSSimulationSettings
+from ansys.edb.core.simulation_setup.mesh_operation import MeshOperation
+from ansys.edb.core.simulation_setup.simulation_settings import _from_plain
+from ansys.edb.core.simulation_setup.simulation_settings import _register_message_conversion
+from ansys.edb.core.simulation_setup.simulation_settings import _to_plain
 from ansys.edb.core.simulation_setup.simulation_setup import SimulationSetup
 from ansys.edb.core.simulation_setup.simulation_setup import SimulationSetupType
 
@@ -54,3 +58,14 @@ class HfssSimulationSetup(SimulationSetup):
     def settings(self):
         """:class:`.HfssSimulationSettings`: Simulation settings of the HFSS simulation setup."""
         return HFSSSimulationSettings(self)
+
+    def _to_dict(self):
+        return {**super()._to_dict(), "mesh_operations": _to_plain(self.mesh_operations)}
+
+    def _apply_dict(self, data):
+        super()._apply_dict(data)
+        if "mesh_operations" in data:
+            self.mesh_operations = [_from_plain(mesh_op, MeshOperation) for mesh_op in data["mesh_operations"]]
+
+
+_register_message_conversion(MeshOperation, messages.mesh_operation_message, pb.MeshOperationMessage, parser.to_mesh_op)
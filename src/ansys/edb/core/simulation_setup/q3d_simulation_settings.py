@@ -263,7 +263,7 @@ class Q3DCGSettings(Q3DSettings):
         )
 
     @property
-    def solver_type(self):
+    def solver_type(self) -> SolverType:
         """:class:`.SolverType`: Q3D solver type."""
         return SolverType(self.__stub.GetSolverType(self.msg).solver_type)
 
@@ -1,8 +1,12 @@
 """Simulation Settings."""
 
+from collections.abc import Mapping
+from collections.abc import Sequence
 from enum import Enum
+from typing import get_type_hints
 
 import ansys.api.edb.v1.simulation_settings_pb2 as pb
+from google.protobuf import json_format
 
 from ansys.edb.core.inner import messages
 from ansys.edb.core.session import AdvancedMeshingSettingsServiceStub
@@ -31,6 +35,47 @@ class ModelType(Enum):
     IC_MODEL = pb.IC_MODEL
 
 
+# Conversions of the setting values that are not plain data to protobuf messages and back, mapped by value type. The
+# messages are converted to dictionaries of their fields, so that the values can be serialized.
+_MESSAGE_CONVERSIONS = {}
+
+
+def _register_message_conversion(value_type, to_message, message_type, from_message):
+    """Register the functions converting values of a type to a protobuf message and back."""
+    _MESSAGE_CONVERSIONS[value_type] = (to_message, message_type, from_message)
+
+
+def _to_plain(value):
+    """Convert a value to plain data that can be serialized, for example to JSON.
+
+    Enums are converted to their names and values with a registered message conversion to dictionaries of the \
+    message fields.
+    """
+    if isinstance(value, Enum):
+        return value.name
+    for value_type, (to_message, _, _) in _MESSAGE_CONVERSIONS.items():
+        if isinstance(value, value_type):
+            return json_format.MessageToDict(to_message(value), preserving_proto_field_name=True)
+    if isinstance(value, Mapping):
+        return {key: _to_plain(item) for key, item in value.items()}
+    if isinstance(value, Sequence) and not isinstance(value, str):
+        return [_to_plain(item) for item in value]
+    return value
+
+
+def _from_plain(value, value_type):
+    """Convert plain data returned by ``_to_plain`` back to a value of the provided type.
+
+    Values that are not plain data, such as enums, are returned unchanged.
+    """
+    if isinstance(value, str) and isinstance(value_type, type) and issubclass(value_type, Enum):
+        return value_type[value]
+    if isinstance(value, dict) and (conversion := _MESSAGE_CONVERSIONS.get(value_type)) is not None:
+        _, message_type, from_message = conversion
+        return from_message(json_format.ParseDict(value, message_type()))
+    return value
+
+
 class SimulationSettingsBase:
     """Internal base class for simulation settings."""
 
@@ -46,6 +91,35 @@ class SimulationSettingsBase:
         """
         return self._sim_setup.msg
 
+    @classmethod
+    def _settings_properties(cls):
+        """Get the settings properties of the class in definition order, mapped by name."""
+        properties = {}
+        for klass in reversed(cls.__mro__):
+            for name, attr in vars(klass).items():
+                if isinstance(attr, property) and name != "msg":
+                    properties[name] = attr
+        return properties
+
+    def _to_dict(self):
+        """Get the values of all settings as plain data, with nested settings objects as nested dictionaries."""
+        values = {}
+        for name, prop in self._settings_properties().items():
+            value = getattr(self, name)
+            values[name] = value._to_dict() if prop.fset is None else _to_plain(value)
+        return values
+
+    def _from_dict(self, values):
+        """Set the values of the settings in a dictionary returned by ``_to_dict``."""
+        properties = self._settings_properties()
+        for name, value in values.items():
+            if (prop := properties.get(name)) is None:
+                raise AttributeError(f"'{type(self).__name__}' has no setting named '{name}'.")
+            if prop.fset is None:
+                getattr(self, name)._from_dict(value)
+            else:
+                setattr(self, name, _from_plain(value, get_type_hints(prop.fget).get("return")))
+
 
 class SimulationSettings(SimulationSettingsBase):
     """Class representing base simulation settings."""
@@ -101,7 +175,7 @@ class SettingsOptions(SimulationSettingsBase):
 
     @use_default_lambda_value.setter
     def use_default_lambda_value(self, use_default_value):
-        self.__stub.SetDoLamdaRefineFlag(messages.bool_property_message(self, use_default_value))
+        self.__stub.SetUseDefaultLamda(messages.bool_property_message(self, use_default_value))
 
 
 class AdvancedSettings(SimulationSettingsBase):
@@ -182,7 +256,7 @@ class AdvancedSettings(SimulationSettingsBase):
         self.__stub.SetSmallVoidArea(messages.double_property_message(self, small_void_area))
 
     @property
-    def via_model_type(self):
+    def via_model_type(self) -> ViaStyle:
         """:class:`.ViaStyle`: Via model type."""
         return ViaStyle(self.__stub.GetViaModelType(self.msg).via_model_type)
 
@@ -229,7 +303,7 @@ class AdvancedSettings(SimulationSettingsBase):
         self.__stub.SetMeshForViaPlating(messages.bool_property_message(self, mesh_for_via_plating))
 
     @property
-    def model_type(self):
+    def model_type(self) -> ModelType:
         """:class:`.ModelType`: model type."""
         return ModelType(self.__stub.GetModelType(self.msg).defeature_model_type)
 
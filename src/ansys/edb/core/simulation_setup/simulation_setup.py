@@ -12,11 +12,16 @@ from ansys.api.edb.v1.simulation_setup_pb2 import SweepDataMessage
 
 from ansys.edb.core.inner import messages
 from ansys.edb.core.inner.base import ObjBase
+from ansys.edb.core.inner.utils import batch_get
+from ansys.edb.core.inner.utils import buffered_writes
 from ansys.edb.core.inner.utils import map_list
 from ansys.edb.core.session import SimulationSetupServiceStub
 from ansys.edb.core.session import StubAccessor
 from ansys.edb.core.session import StubType
 from ansys.edb.core.simulation_setup.adaptive_solutions import MatrixConvergenceDataEntry
+from ansys.edb.core.simulation_setup.simulation_settings import _from_plain
+from ansys.edb.core.simulation_setup.simulation_settings import _register_message_conversion
+from ansys.edb.core.simulation_setup.simulation_settings import _to_plain
 
 
 class SimulationSetupType(Enum):
@@ -459,20 +464,158 @@ class SimulationSetup(ObjBase):
         -------
         SimulationSetup
         """
-        from ansys.edb.core.simulation_setup.hfss_simulation_setup import HfssSimulationSetup
-        from ansys.edb.core.simulation_setup.raptor_x_simulation_setup import RaptorXSimulationSetup
-        from ansys.edb.core.simulation_setup.siwave_dcir_simulation_setup import SIWaveDCIRSimulationSetup
-        from ansys.edb.core.simulation_setup.siwave_simulation_setup import SIWaveSimulationSetup
-
         if self.is_null:
             return
 
-        sim_type = self.type
-        if sim_type == SimulationSetupType.HFSS:
-            return HfssSimulationSetup(self.msg)
-        elif sim_type == SimulationSetupType.SI_WAVE:
-            return SIWaveSimulationSetup(self.msg)
-        elif sim_type == SimulationSetupType.SI_WAVE_DCIR:
-            return SIWaveDCIRSimulationSetup(self.msg)
-        elif sim_type == SimulationSetupType.RAPTOR_X:
-            return RaptorXSimulationSetup(self.msg)
+        if (sim_setup_cls := _sim_setup_class(self.type)) is not None:
+            return sim_setup_cls(self.msg)
+
+    def to_dict(self):
+        """Get the type, name, sweeps and settings of the simulation setup as a dictionary.
+
+        The values of all settings are fetched from the server in a single cache refresh request. \
+        Nested settings objects are converted to nested dictionaries keyed by property name.
+
+        The dictionary only holds plain data, so it can be serialized, for example to JSON. Enums are converted to \
+        their names, and sweeps, mesh operations, and adaptive solutions to dictionaries of their message fields. \
+        :meth:`from_dict` converts them back.
+
+        Returns
+        -------
+        dict
+            Dictionary with the ``type``, ``name``, ``sweep_data`` and ``settings`` keys. HFSS simulation setups \
+            additionally have the ``mesh_operations`` key.
+        """
+        return batch_get([self], SimulationSetup._get_dict)[0]
+
+    @classmethod
+    def from_dict(cls, cell, data, name=None):
+        """Create a simulation setup from a dictionary returned by :meth:`to_dict`.
+
+        The simulation setup creation and all settings changes are buffered and sent to the server in a single \
+        streamed request. Keys missing from the dictionary are left at their default value.
+
+        Parameters
+        ----------
+        cell : :class:`.Cell`
+            Cell to create the simulation setup in.
+        data : dict
+            Dictionary describing the simulation setup.
+        name : str, default: None
+            Name of the simulation setup. If ``None``, the name in the dictionary is used.
+
+        Returns
+        -------
+        SimulationSetup
+            Simulation setup created.
+        """
+        sim_setup_cls = _sim_setup_class(SimulationSetupType(_from_plain(data["type"], SimulationSetupType)))
+        with buffered_writes():
+            sim_setup = sim_setup_cls.create(cell, data["name"] if name is None else name)
+            sim_setup._apply_dict(data)
+        return sim_setup
+
+    @classmethod
+    def create_many(cls, cells, template, overrides=None):
+        """Create a simulation setup from a template in each of multiple cells.
+
+        The simulation setup creations and all settings changes are buffered and streamed to the server in chunks \
+        rather than sent one at a time.
+
+        Parameters
+        ----------
+        cells : list of :class:`.Cell`
+            Cells to create the simulation setups in.
+        template : SimulationSetup or dict
+            Simulation setup to copy or dictionary in the format returned by :meth:`to_dict`.
+        overrides : list of dict or None, default: None
+            Dictionary of values overriding the template for each cell, or ``None`` for cells using the template \
+            unchanged. Nested dictionaries, such as ``settings``, are merged with the template rather than replaced.
+
+        Returns
+        -------
+        list of SimulationSetup
+            Simulation setups created. If a write buffer is active, the simulation setups are resolved when the \
+            buffer is flushed. Simulation setups that failed to be created are null.
+        """
+        cells = list(cells)
+        overrides = [None] * len(cells) if overrides is None else list(overrides)
+        if len(overrides) != len(cells):
+            raise ValueError(f"Expected {len(cells)} overrides. Received {len(overrides)}.")
+        if isinstance(template, SimulationSetup):
+            template = template.to_dict()
+        with buffered_writes():
+            return [
+                SimulationSetup.from_dict(cell, template if override is None else _merge_dicts(template, override))
+                for cell, override in zip(cells, overrides)
+            ]
+
+    def clone_to(self, cell, name=None):
+        """Copy the simulation setup to a cell.
+
+        Parameters
+        ----------
+        cell : :class:`.Cell`
+            Cell to copy the simulation setup to.
+        name : str, default: None
+            Name of the copied simulation setup. If ``None``, the name of this simulation setup is used.
+
+        Returns
+        -------
+        SimulationSetup
+            Simulation setup created.
+        """
+        return SimulationSetup.from_dict(cell, self.to_dict(), name)
+
+    def _get_dict(self):
+        return self.cast()._to_dict()
+
+    def _to_dict(self):
+        return {
+            "type": _to_plain(self.type),
+            "name": self.name,
+            "sweep_data": _to_plain(self.sweep_data),
+            "settings": self.settings._to_dict(),
+        }
+
+    def _apply_dict(self, data):
+        if "sweep_data" in data:
+            self.sweep_data = [_from_plain(sweep_data, SweepData) for sweep_data in data["sweep_data"]]
+        if "settings" in data:
+            self.settings._from_dict(data["settings"])
+
+
+def _merge_dicts(base, overrides):
+    """Get a copy of a dictionary with values overridden, merging nested dictionaries."""
+    merged = dict(base)
+    for key, value in overrides.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            value = _merge_dicts(merged[key], value)
+        merged[key] = value
+    return merged
+
+
+def _sim_setup_class(sim_setup_type):
+    """Get the simulation setup subclass of a simulation setup type."""
+    from ansys.edb.core.simulation_setup.hfss_pi_simulation_setup import HFSSPISimulationSetup
+    from ansys.edb.core.simulation_setup.hfss_simulation_setup import HfssSimulationSetup
+    from ansys.edb.core.simulation_setup.q3d_simulation_setup import Q3DSimulationSetup
+    from ansys.edb.core.simulation_setup.raptor_x_simulation_setup import RaptorXSimulationSetup
+    from ansys.edb.core.simulation_setup.siwave_cpa_simulation_setup import SIWaveCPASimulationSetup
+    from ansys.edb.core.simulation_setup.siwave_dcir_simulation_setup import SIWaveDCIRSimulationSetup
+    from ansys.edb.core.simulation_setup.siwave_psi_simulation_setup import SIWavePSISimulationSetup
+    from ansys.edb.core.simulation_setup.siwave_simulation_setup import SIWaveSimulationSetup
+
+    return {
+        SimulationSetupType.HFSS: HfssSimulationSetup,
+        SimulationSetupType.HFSS_PI: HFSSPISimulationSetup,
+        SimulationSetupType.SI_WAVE: SIWaveSimulationSetup,
+        SimulationSetupType.SI_WAVE_DCIR: SIWaveDCIRSimulationSetup,
+        SimulationSetupType.SI_WAVE_PSI: SIWavePSISimulationSetup,
+        SimulationSetupType.RAPTOR_X: RaptorXSimulationSetup,
+        SimulationSetupType.Q3D_SIM: Q3DSimulationSetup,
+        SimulationSetupType.SI_WAVE_CPA: SIWaveCPASimulationSetup,
+    }.get(sim_setup_type)
+
+
+_register_message_conversion(SweepData, _sweep_data_msg, SweepDataMessage, _msg_to_sweep_data)
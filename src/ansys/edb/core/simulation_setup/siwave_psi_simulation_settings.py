@@ -243,7 +243,7 @@ class SIWavePSIPowerGroundNetsSettings(SimulationSettingsBase):
     __stub: SIWavePSIPowerGroundNetsServiceStub = StubAccessor(StubType.siwave_psi_power_ground_sim_settings)
 
     @property
-    def improved_loss_model(self):
+    def improved_loss_model(self) -> ImprovedLossModel:
         """:class:`.ImprovedLossModel`: Improved loss model."""
         return ImprovedLossModel(self.__stub.GetImprovedLossModel(self.msg).improved_loss_model)
 
@@ -245,8 +245,8 @@ class SIWaveAdvancedSettings(SimulationSettingsBase):
         self.__stub.SetMeshFrequency(messages.string_property_message(self, mesh_frequency))
 
     @property
-    def ac_dc_merge_mode(self):
-        """:obj:`int`: AC/DC merge mode."""
+    def ac_dc_merge_mode(self) -> ACDCMergeMode:
+        """:class:`.ACDCMergeMode`: AC/DC merge mode."""
         return ACDCMergeMode(self.__stub.GetAcDcMergeMode(self.msg).ac_dc_merge_mode)
 
     @ac_dc_merge_mode.setter
@@ -508,7 +508,7 @@ class SIWaveSParameterSettings(SimulationSettingsBase):
         self.__stub.SetUseStateSpace(messages.bool_property_message(self, use_state_space))
 
     @property
-    def interpolation(self):
+    def interpolation(self) -> SParamInterpolation:
         """:obj:`SParamInterpolation`: Interpolation type."""
         return SParamInterpolation(self.__stub.GetInterpolation(self.msg).interpolation)
 
@@ -519,7 +519,7 @@ class SIWaveSParameterSettings(SimulationSettingsBase):
         )
 
     @property
-    def extrapolation(self):
+    def extrapolation(self) -> SParamExtrapolation:
         """:obj:`SParamExtrapolation`: Extrapolation type."""
         return SParamExtrapolation(self.__stub.GetExtrapolation(self.msg).extrapolation)
 
@@ -530,7 +530,7 @@ class SIWaveSParameterSettings(SimulationSettingsBase):
         )
 
     @property
-    def dc_behavior(self):
+    def dc_behavior(self) -> SParamDCBehavior:
         """:obj:`SParamDCBehavior`: DC behavior type."""
         return SParamDCBehavior(self.__stub.GetDCBehavior(self.msg).dc_behavior)
 
@@ -13,6 +13,7 @@ from ansys.edb.core.inner import parser
 from ansys.edb.core.layer.layer import Layer
 from ansys.edb.core.session import StubAccessor
 from ansys.edb.core.session import StubType
+from ansys.edb.core.utility import identity_map
 from ansys.edb.core.utility.port_post_processing_prop import PortPostProcessingProp
 from ansys.edb.core.utility.value import Value
 
@@ -81,11 +82,11 @@ class Terminal(conn_obj.ConnObj):
         if self.is_null:
             return
 
-        tt = self.type
+        term = identity_map.get_or_create(self, Terminal, lambda: factory.create_terminal(self.msg, self.type))
 
-        if term_type is not None and tt != term_type:
+        if term_type is not None and term.type != term_type:
             return
-        return factory.create_terminal(self.msg, tt)
+        return term
 
     @classmethod
     def find(cls, layout, name):
@@ -0,0 +1,148 @@
+"""Identity map for EDB object wrappers."""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from threading import Lock
+import weakref
+
+
+class _IdentityMap:
+    """Maps a session, EDB object ID, and wrapper class to a single live wrapper of the object.
+
+    Wrappers are held weakly, so an entry disappears once no user code references the wrapper.
+    """
+
+    def __init__(self):
+        self._wrappers = weakref.WeakValueDictionary()
+        self._lock = Lock()
+
+    def get(self, edb_session, edb_obj_id, cls):
+        """Get the wrapper registered for the provided session, EDB object ID, and class, or ``None``."""
+        return self._wrappers.get((edb_session, edb_obj_id, cls))
+
+    def add(self, edb_session, edb_obj_id, cls, wrapper):
+        """Register a wrapper for the provided session, EDB object ID, and class."""
+        with self._lock:
+            self._wrappers[(edb_session, edb_obj_id, cls)] = wrapper
+
+    def invalidate(self, edb_session, edb_obj_id):
+        """Remove all wrappers registered for the provided session and EDB object ID."""
+        self._remove(lambda key: key[0] is edb_session and key[1] == edb_obj_id)
+
+    def clear(self, edb_session):
+        """Remove all wrappers registered for the provided session."""
+        self._remove(lambda key: key[0] is edb_session)
+
+    def _remove(self, predicate):
+        with self._lock:
+            for key in [key for key in self._wrappers.keys() if predicate(key)]:
+                self._wrappers.pop(key, None)
+
+    def __len__(self):
+        """Get the number of live registered wrappers."""
+        return len(self._wrappers)
+
+
+# The identity map is bound to the current context so that threads and tasks driving different sessions never share
+# wrappers of objects that happen to have the same ID.
+_IDENTITY_MAP = ContextVar("identity_map", default=None)
+
+# All live identity maps, so that the wrappers of a disconnected session can be removed from the maps of every context.
+_IDENTITY_MAPS = weakref.WeakSet()
+_IDENTITY_MAPS_LOCK = Lock()
+
+# Set to ansys.edb.core.session.get_current_session when the session module is imported. It can't be imported here
+# because the session module imports this one.
+_get_current_session = None
+
+
+@contextmanager
+def enable_identity_map():
+    """Reuse a single wrapper per EDB object for code called within the context manager.
+
+    While enabled, wrappers returned by ``cast()`` and by properties returning EDB objects (such as \
+    ``Primitive.layer`` or ``ConnObj.net``) are looked up by EDB object ID and class before a new wrapper is \
+    created. This avoids repeating the type resolution RPCs done by ``cast()`` for objects that were already seen.
+
+    .. note::
+        Wrappers are invalidated when their object is deleted through pyedb-core or when their session is \
+        disconnected. Changes made to object types by other means are not reflected until the context manager exits.
+
+    .. note::
+        The identity map is bound to the calling thread or task through a context variable. Threads started within \
+        the context manager don't use it unless they run in a copy of the caller's context, for example through \
+        :func:`contextvars.copy_context`.
+    """
+    if _IDENTITY_MAP.get() is not None:
+        yield
+        return
+    identity_map = _IdentityMap()
+    with _IDENTITY_MAPS_LOCK:
+        _IDENTITY_MAPS.add(identity_map)
+    token = _IDENTITY_MAP.set(identity_map)
+    try:
+        yield
+    finally:
+        _IDENTITY_MAP.reset(token)
+
+
+def get_identity_map():
+    """Get the active identity map."""
+    return _IDENTITY_MAP.get()
+
+
+def get_or_create(edb_obj, cls, creator):
+    """Get the wrapper registered for an EDB object and class, creating and registering it if needed.
+
+    Parameters
+    ----------
+    edb_obj : ansys.edb.core.inner.ObjBase or EDBObjMessage
+        EDB object or message identifying the object.
+    cls : type
+        Class used to key the wrapper. This is typically the class the object is being created or cast from.
+    creator : Callable[[], ansys.edb.core.inner.ObjBase]
+        Callable creating the wrapper when none is registered.
+
+    Returns
+    -------
+    ansys.edb.core.inner.ObjBase
+    """
+    identity_map = _IDENTITY_MAP.get()
+    if identity_map is None or edb_obj.id == 0 or _is_future(edb_obj):
+        return creator()
+    edb_session = _current_session()
+    if (wrapper := identity_map.get(edb_session, edb_obj.id, cls)) is not None:
+        return wrapper
+    wrapper = creator()
+    if wrapper is not None and wrapper.id == edb_obj.id:
+        identity_map.add(edb_session, edb_obj.id, cls, wrapper)
+        identity_map.add(edb_session, wrapper.id, type(wrapper), wrapper)
+    return wrapper
+
+
+def invalidate(edb_obj):
+    """Remove all wrappers of a deleted EDB object from the active identity map."""
+    if (identity_map := _IDENTITY_MAP.get()) is not None:
+        identity_map.invalidate(_current_session(), edb_obj.id)
+
+
+def clear():
+    """Remove all wrappers of the current session from the active identity map."""
+    if (identity_map := _IDENTITY_MAP.get()) is not None:
+        identity_map.clear(_current_session())
+
+
+def clear_session(edb_session):
+    """Remove all wrappers of a session from the identity maps of all threads and tasks."""
+    with _IDENTITY_MAPS_LOCK:
+        identity_maps = list(_IDENTITY_MAPS)
+    for identity_map in identity_maps:
+        identity_map.clear(edb_session)
+
+
+def _current_session():
+    return None if _get_current_session is None else _get_current_session()
+
+
+def _is_future(edb_obj):
+    return getattr(edb_obj, "is_future", False) or getattr(edb_obj, "_is_future", False)
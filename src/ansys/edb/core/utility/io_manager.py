@@ -3,12 +3,16 @@
 import abc
 from collections import defaultdict
 from contextlib import contextmanager
+from contextlib import nullcontext
 from enum import Enum
 from enum import Flag
 from enum import auto
 from importlib import import_module
+from itertools import count
 import re
 from sys import modules
+from threading import RLock
+from threading import local
 from typing import Any as AnyType
 
 from ansys.api.edb.v1.edb_messages_pb2 import EDBObjCollectionMessage
@@ -20,17 +24,34 @@ from google.protobuf.empty_pb2 import Empty
 
 from ansys.edb.core.inner.rpc_info_utils import get_rpc_info
 from ansys.edb.core.inner.utils import client_stream_iterator
+from ansys.edb.core.utility.tracing import get_tracer
 
 # The cache module singleton
 MOD = modules[__name__]
 
-_future_id = 0
+# Future IDs are unique across threads. Advancing an itertools.count is atomic.
+_future_ids = count(1)
+
+# Set to ansys.edb.core.session.get_current_session when the session module is imported. It can't be imported here
+# because the session module imports this one.
+_get_current_session = None
+
+# Max size in bytes of a chunk of edb objs sent when prefetching data for a collection of objects
+_PREFETCH_CHUNK_SIZE = 8000
 
 
 def _get_next_future_id():
-    global _future_id
-    _future_id += 1
-    return _future_id
+    return next(_future_ids)
+
+
+def _reset_future_ids():
+    """Restart the future IDs from 1.
+
+    The future IDs are part of the requests that create objects, so they must restart at the same point for the
+    requests of a script to be the same when it is replayed.
+    """
+    global _future_ids
+    _future_ids = count(1)
 
 
 def _get_io_manager_stub():
@@ -87,15 +108,16 @@ class _HijackedOutcome:
 
 class _IOOptimizer(metaclass=abc.ABCMeta):
     def __init__(self):
-        self._is_blocking = False
+        # Blocking only applies to the requests sent by the thread doing the blocking operation.
+        self._thread_state = local()
 
     @contextmanager
     def block(self):
         try:
-            self._is_blocking = True
+            self._thread_state.is_blocking = True
             yield
         finally:
-            self._is_blocking = False
+            self._thread_state.is_blocking = False
             self._reset_after_block()
 
     def _reset_after_block(self):
@@ -103,7 +125,7 @@ class _IOOptimizer(metaclass=abc.ABCMeta):
 
     @property
     def is_blocking(self):
-        return self._is_blocking
+        return getattr(self._thread_state, "is_blocking", False)
 
     def hijack_request(self, service_name, rpc_name, request):
         hijacked_response = self._hijack_request(service_name, rpc_name, request)
@@ -183,10 +205,34 @@ class _Cache(_IOOptimizer):
         ]
         if not edb_objs_to_refresh:
             return
-        with self.block():
-            response = _get_io_manager_stub().RefreshCache(EDBObjCollectionMessage(items=edb_objs_to_refresh))
-            for msg in response.items:
-                self.add_from_cache_msg(msg)
+        span_attributes = {"edb.objects": len(edb_objs_to_refresh)}
+        with get_tracer().start_as_current_span("edb.io_manager.refresh_cache", attributes=span_attributes):
+            with self.block():
+                response = _get_io_manager_stub().RefreshCache(EDBObjCollectionMessage(items=edb_objs_to_refresh))
+                for msg in response.items:
+                    self.add_from_cache_msg(msg)
+
+    def prefetch(self, edb_objs):
+        edb_obj_msgs = {
+            edb_obj.id: EDBObjMessage(id=edb_obj.id)
+            for edb_obj in edb_objs
+            if edb_obj.id != 0 and not self._cached_edb_objs.get(edb_obj.id, False)
+        }
+        if not edb_obj_msgs:
+            return
+        chunk_entry_creator = lambda msg: msg
+        chunk_entries_getter = lambda chunk: chunk.items
+        span_attributes = {"edb.objects": len(edb_obj_msgs)}
+        with get_tracer().start_as_current_span("edb.io_manager.prefetch", attributes=span_attributes), self.block():
+            for chunk in client_stream_iterator(
+                edb_obj_msgs.values(),
+                EDBObjCollectionMessage,
+                chunk_entry_creator,
+                chunk_entries_getter,
+                _PREFETCH_CHUNK_SIZE,
+            ):
+                for msg in _get_io_manager_stub().RefreshCache(chunk).items:
+                    self.add_from_cache_msg(msg)
 
     @property
     def allow_invalidation(self):
@@ -218,6 +264,7 @@ class _Buffer(_IOOptimizer):
 
     def __init__(self):
         super().__init__()
+        self._lock = RLock()
         self._reset()
 
     def _reset(self):
@@ -232,12 +279,19 @@ class _Buffer(_IOOptimizer):
             return
         if not rpc_info.can_buffer:
             return
-        if rpc_info.invalidates_cache:
-            self._invalidate_cache = True
         future_id = _get_next_future_id() if rpc_info.returns_future else None
-        self._buffer.append(self._BufferEntry(service_name, rpc_name, request, future_id))
+        with self._lock:
+            if rpc_info.invalidates_cache:
+                self._invalidate_cache = True
+            self._buffer.append(self._BufferEntry(service_name, rpc_name, request, future_id))
         return Empty if future_id is None else EDBObjMessage(id=future_id, is_future=True)
 
+    def add_entries(self, buffer_entries, invalidates_cache):
+        with self._lock:
+            if invalidates_cache:
+                self._invalidate_cache = True
+            self._buffer.extend(buffer_entries)
+
     @staticmethod
     def _buffer_request_iterator(buffer):
         chunk_entry_creator = lambda buffer_entry: buffer_entry.msg()
@@ -247,7 +301,8 @@ class _Buffer(_IOOptimizer):
     def flush(self):
         if not self._buffer or not self.allow_flushing:
             return
-        with self.block():
+        # Entries added by other threads wait for the flush so that none are dropped when the buffer is reset.
+        with self._lock, self._start_flush_span(), self.block():
             if (cache := get_cache()) is not None and self._invalidate_cache:
                 cache.invalidate()
             get_io_manager().add_notification_for_server(ServerNotification.FLUSH_BUFFER)
@@ -257,8 +312,13 @@ class _Buffer(_IOOptimizer):
                         for future_edb_obj in future_edb_objs:
                             future_edb_obj.msg = updated_edb_obj.edb_obj
 
+    def _start_flush_span(self):
+        span_attributes = {"edb.entries": len(self._buffer), "edb.invalidates_cache": self._invalidate_cache}
+        return get_tracer().start_as_current_span("edb.io_manager.flush_buffer", attributes=span_attributes)
+
     def add_future_ref(self, future):
-        self._futures[future.id].append(future)
+        with self._lock:
+            self._futures[future.id].append(future)
 
     def _reset_after_block(self):
         self._reset()
@@ -320,13 +380,16 @@ class _ActiveRequestEdbObjMsgMgr:
 
 class _IOManager:
     def __init__(self):
+        self._lock = RLock()
         self._reset()
         self._server_notifications = set()
 
     def _reset(self):
         self._cache = None
         self._buffer = None
-        self._active_request_edb_obj_msg_mgr = _ActiveRequestEdbObjMsgMgr()
+        self._temp_cache_users = 0
+        # The objects of the request being built are tracked per thread.
+        self._thread_state = local()
 
     @staticmethod
     def _enable_caching(enable):
@@ -377,13 +440,15 @@ class _IOManager:
         return self.cache is not None and self.cache.is_blocking or self.buffer is not None and self.buffer.is_blocking
 
     def add_notification_for_server(self, notification):
-        self._server_notifications.add(notification)
+        with self._lock:
+            self._server_notifications.add(notification)
 
     def get_notifications_for_server(self, pop=False):
         if not pop:
             return self._server_notifications
-        server_notifications = self._server_notifications
-        self._server_notifications = set()
+        with self._lock:
+            server_notifications = self._server_notifications
+            self._server_notifications = set()
         return server_notifications
 
     @property
@@ -392,7 +457,113 @@ class _IOManager:
 
     @property
     def active_request_edb_obj_msg_mgr(self):
-        return self._active_request_edb_obj_msg_mgr
+        if (mgr := getattr(self._thread_state, "active_request_edb_obj_msg_mgr", None)) is None:
+            mgr = self._thread_state.active_request_edb_obj_msg_mgr = _ActiveRequestEdbObjMsgMgr()
+        return mgr
+
+    @contextmanager
+    def prefetch(self, edb_objs):
+        """Populate the cache with the data of the provided objects for code called within the context manager.
+
+        The data is fetched from the server in chunks. If caching is not already enabled, a cache is enabled for the \
+        duration of the context manager. The temporary cache is shared by threads prefetching at the same time and is \
+        disabled when the last of them exits.
+        """
+        from ansys.edb.core.session import is_in_memory
+
+        if is_in_memory():
+            yield
+            return
+        with self._lock:
+            uses_temp_cache = self._cache is None or self._temp_cache_users > 0
+            if self._cache is None:
+                self._cache = _Cache()
+                self._enable_caching(True)
+            if uses_temp_cache:
+                self._temp_cache_users += 1
+            cache = self._cache
+        try:
+            if self._buffer is not None:
+                self._buffer.flush()
+            cache.prefetch(edb_objs)
+            yield
+        finally:
+            if uses_temp_cache:
+                with self._lock:
+                    self._temp_cache_users -= 1
+                    if self._temp_cache_users == 0:
+                        self._enable_caching(False)
+                        self._cache = None
+
+    def stream_write_requests(self, service_name, rpc_name, requests):
+        """Stream the provided write requests to the server in chunks without resolving futures.
+
+        Any buffered requests are flushed first so that the requests are executed in order. If the buffer cannot be \
+        flushed, the requests are added to it instead.
+        """
+        buffer_entries = [_Buffer._BufferEntry(service_name, rpc_name, request, None) for request in requests]
+        if self._buffer is not None:
+            if not self._buffer.allow_flushing:
+                self._buffer.add_entries(buffer_entries, self._invalidates_cache(service_name, rpc_name))
+                return
+            self._buffer.flush()
+        if self._cache is not None and (rpc_info := get_rpc_info(service_name, rpc_name)) is not None:
+            if rpc_info.invalidates_cache:
+                self._cache.invalidate()
+        if not buffer_entries:
+            return
+        self.add_notification_for_server(ServerNotification.FLUSH_BUFFER)
+        _get_io_manager_stub().FlushBufferNoFutureResolutionStream(_Buffer._buffer_request_iterator(buffer_entries))
+
+    def stream_create_requests(self, service_name, rpc_name, requests, follow_up=None):
+        """Stream the provided creation requests to the server in chunks and return the created objects.
+
+        If a buffer is active, the requests are added to it and the returned messages are futures that are \
+        resolved when the buffer is flushed. Otherwise, the requests are sent immediately and objects that failed \
+        to be created are returned as null objects.
+
+        Parameters
+        ----------
+        service_name : str
+        rpc_name : str
+        requests : list
+        follow_up : tuple of (str, str, callable), optional
+            Service name, RPC name, and request creator of a write request sent right after the creation request of \
+            each object. The request creator is called with the future message of the object and its index.
+        """
+        future_msgs = []
+        buffer_entries = []
+        invalidates_cache = self._invalidates_cache(service_name, rpc_name)
+        if follow_up is not None:
+            follow_up_service_name, follow_up_rpc_name, follow_up_request_creator = follow_up
+            invalidates_cache |= self._invalidates_cache(follow_up_service_name, follow_up_rpc_name)
+        for idx, request in enumerate(requests):
+            future_id = _get_next_future_id()
+            future_msgs.append(EDBObjMessage(id=future_id, is_future=True))
+            buffer_entries.append(_Buffer._BufferEntry(service_name, rpc_name, request, future_id))
+            if follow_up is not None:
+                follow_up_request = follow_up_request_creator(EDBObjMessage(id=future_id, is_future=True), idx)
+                buffer_entries.append(
+                    _Buffer._BufferEntry(follow_up_service_name, follow_up_rpc_name, follow_up_request, None)
+                )
+        if self._buffer is not None:
+            self._buffer.add_entries(buffer_entries, invalidates_cache)
+            return future_msgs
+        if not buffer_entries:
+            return []
+        resolved_edb_objs = {}
+        with self._cache.block() if self._cache is not None else nullcontext():
+            if self._cache is not None and invalidates_cache:
+                self._cache.invalidate()
+            self.add_notification_for_server(ServerNotification.FLUSH_BUFFER)
+            for response in _get_io_manager_stub().FlushBufferStream(_Buffer._buffer_request_iterator(buffer_entries)):
+                for resolved_future in response.resolved_futures:
+                    resolved_edb_objs[resolved_future.future_id] = resolved_future.edb_obj
+        return [resolved_edb_objs.get(future_msg.id, EDBObjMessage()) for future_msg in future_msgs]
+
+    @staticmethod
+    def _invalidates_cache(service_name, rpc_name):
+        return (rpc_info := get_rpc_info(service_name, rpc_name)) is None or rpc_info.invalidates_cache
 
     @contextmanager
     def manage_io(self):
@@ -414,26 +585,31 @@ def enable_io_manager(io_type=IOMangementType.READ_AND_WRITE):
         This is intended for use with read-only operations. If modifications are made to the EDB in this code block, \
         the changes will not be reflected when querying the server until after the context manager is exited.
     """
+    io_manager = get_io_manager()
     try:
-        MOD.io_manager.start_managing(io_type)
+        io_manager.start_managing(io_type)
         yield
     finally:
-        MOD.io_manager.end_managing()
+        io_manager.end_managing()
 
 
 def get_io_manager():
-    """Get the active IO manager."""
-    return MOD.io_manager
+    """Get the active IO manager.
+
+    Each session has its own IO manager. If no session is active, a process-wide IO manager is returned.
+    """
+    edb_session = None if _get_current_session is None else _get_current_session()
+    return MOD.io_manager if edb_session is None else edb_session.io_manager
 
 
 def get_cache():
     """Get the active cache."""
-    return MOD.io_manager.cache
+    return get_io_manager().cache
 
 
 def get_buffer():
     """Get the active buffer."""
-    return MOD.io_manager.buffer
+    return get_io_manager().buffer
 
 
 def start_managing(io_type):
@@ -444,9 +620,9 @@ def start_managing(io_type):
     io_type : IOMangementMode
 
     """
-    MOD.io_manager.start_managing(io_type)
+    get_io_manager().start_managing(io_type)
 
 
 def end_managing():
     """End management of IO operations."""
-    MOD.io_manager.end_managing()
+    get_io_manager().end_managing()
@@ -0,0 +1,210 @@
+"""Parallel processing of databases with a pool of worker processes."""
+
+from __future__ import annotations
+
+from collections import deque
+import multiprocessing
+from multiprocessing.connection import wait
+import os
+import traceback
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import NamedTuple
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Iterable
+    from collections.abc import Iterator
+
+    from ansys.edb.core.database import Database
+
+
+class DatabaseResult(NamedTuple):
+    """Represents the outcome of processing a database with :func:`process_databases`."""
+
+    db_path: str
+    """:obj:`str`: Path of the database."""
+    value: Any
+    """Value returned by the function, or ``None`` if processing failed."""
+    error: str | None
+    """:obj:`str` or :obj:`None`: Description of the last failure, or ``None`` if processing succeeded."""
+    attempts: int
+    """:obj:`int`: Number of times processing the database was attempted."""
+
+
+# Ports of the servers of different workers are searched from different starting points to avoid races.
+_PORT_RANGE_START = 50051
+_PORTS_PER_WORKER = 16
+_PORT_SLOTS = 500
+
+
+def _launch_worker_session(ansys_em_root, use_shared_memory_ipc):
+    from ansys.edb.core.session import _find_available_port
+    from ansys.edb.core.session import _Session
+    from ansys.edb.core.session import launch_session
+
+    start_port = _PORT_RANGE_START + (os.getpid() % _PORT_SLOTS) * _PORTS_PER_WORKER
+    port_num = _find_available_port(start_port=start_port, check_uds=not _Session._is_windows())
+    # The worker session is not made current, because forked workers inherit the current session of the parent.
+    return launch_session(ansys_em_root, port_num, use_shared_memory_ipc=use_shared_memory_ipc, make_current=False)
+
+
+def _process_database(edb_session, db_path, func, read_only):
+    from ansys.edb.core.database import Database
+    from ansys.edb.core.session import use_session
+
+    with use_session(edb_session):
+        db = Database.open(db_path, read_only)
+        try:
+            return func(db)
+        finally:
+            db.close()
+
+
+def _worker_main(conn, func, ansys_em_root, read_only, use_shared_memory_ipc):
+    edb_session = None
+    try:
+        while (db_path := conn.recv()) is not None:
+            try:
+                if edb_session is None:
+                    edb_session = _launch_worker_session(ansys_em_root, use_shared_memory_ipc)
+                conn.send((_process_database(edb_session, db_path, func, read_only), None))
+            except Exception:
+                conn.send((None, traceback.format_exc()))
+                # Relaunch the server for the next database if it went down with this one.
+                if edb_session is not None and edb_session.local_server_proc.poll() is not None:
+                    edb_session.disconnect()
+                    edb_session = None
+    finally:
+        if edb_session is not None:
+            edb_session.disconnect()
+
+
+class _Worker:
+    def __init__(self, context, func, ansys_em_root, read_only, use_shared_memory_ipc):
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(
+            target=_worker_main,
+            args=(child_conn, func, ansys_em_root, read_only, use_shared_memory_ipc),
+            daemon=True,
+        )
+        self.process.start()
+        child_conn.close()
+        self.task = None
+
+    def crash_error(self):
+        self.process.join()
+        return f"Worker process exited with code {self.process.exitcode}."
+
+    def stop(self, timeout):
+        try:
+            self.conn.send(None)
+        except OSError:
+            pass
+        self.process.join(timeout)
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join()
+        self.conn.close()
+
+
+def process_databases(
+    db_paths: Iterable[str],
+    func: Callable[[Database], Any],
+    ansys_em_root: str,
+    max_workers: int | None = None,
+    max_attempts: int = 2,
+    read_only: bool = True,
+    use_shared_memory_ipc: bool = False,
+) -> Iterator[DatabaseResult]:
+    """Process databases in parallel with a pool of worker processes that each launch their own server.
+
+    Each worker launches a session on its own port the first time it is given a database, and reuses it for the \
+    following databases. A database is opened, passed to ``func``, and closed. If ``func`` raises an exception or \
+    the worker process crashes, the database is retried up to ``max_attempts`` times in total. Crashed workers are \
+    replaced, and workers whose server went down launch a new one.
+
+    Parameters
+    ----------
+    db_paths : Iterable[str]
+        Paths of the databases to process.
+    func : Callable[[.Database], Any]
+        Function to call with each opened database. Its return value must be picklable, and so must the function \
+        itself if the multiprocessing start method is not ``"fork"``.
+    ansys_em_root : str
+        Directory where the ``EDB_RPC_Server.exe`` file is installed.
+    max_workers : int, default: None
+        Maximum number of worker processes. The default is ``None``, in which case the number of CPUs is used.
+    max_attempts : int, default: 2
+        Maximum number of times processing a database is attempted.
+    read_only : bool, default: True
+        Whether to open the databases in read-only mode.
+    use_shared_memory_ipc : bool, default: False
+        Flag indicating if the sessions of the workers should use shared-memory IPC.
+
+    Yields
+    ------
+    DatabaseResult
+        Result of each database, in the order that processing completes.
+
+    Examples
+    --------
+    >>> def count_cells(db):
+    >>>     return len(db.circuit_cells)
+    >>> for result in process_databases(paths, count_cells, "C:\\Program Files\\AnsysEM\\v251\\Win64"):
+    >>>     print(result.db_path, result.value if result.error is None else result.error)
+    """
+    db_paths = list(db_paths)
+    max_workers = max(1, min(max_workers or os.cpu_count() or 1, len(db_paths)))
+    context = multiprocessing.get_context()
+    tasks = deque(range(len(db_paths)))
+    attempts = [0] * len(db_paths)
+    remaining = len(db_paths)
+    workers = {}
+
+    def on_failure(task, error):
+        attempts[task] += 1
+        if attempts[task] < max_attempts:
+            tasks.append(task)
+            return None
+        return DatabaseResult(db_paths[task], None, error, attempts[task])
+
+    try:
+        while remaining:
+            for worker in [worker for worker in workers.values() if not worker.process.is_alive()]:
+                del workers[worker.conn]
+                worker.conn.close()
+            while tasks and len(workers) < max_workers:
+                worker = _Worker(context, func, ansys_em_root, read_only, use_shared_memory_ipc)
+                workers[worker.conn] = worker
+            for worker in workers.values():
+                if worker.task is None and tasks:
+                    worker.task = tasks.popleft()
+                    try:
+                        worker.conn.send(db_paths[worker.task])
+                    except OSError:
+                        pass  # The worker crashed, which is picked up by waiting on its sentinel.
+            busy = [worker for worker in workers.values() if worker.task is not None]
+            ready = set(wait([worker.conn for worker in busy] + [worker.process.sentinel for worker in busy]))
+            for worker in busy:
+                if worker.conn not in ready and worker.process.sentinel not in ready:
+                    continue
+                task, worker.task = worker.task, None
+                try:
+                    value, error = worker.conn.recv()
+                except (EOFError, OSError):
+                    del workers[worker.conn]
+                    worker.conn.close()
+                    result = on_failure(task, worker.crash_error())
+                else:
+                    if error is None:
+                        attempts[task] += 1
+                        result = DatabaseResult(db_paths[task], value, None, attempts[task])
+                    else:
+                        result = on_failure(task, error)
+                if result is not None:
+                    remaining -= 1
+                    yield result
+    finally:
+        for worker in workers.values():
+            worker.stop(timeout=10)
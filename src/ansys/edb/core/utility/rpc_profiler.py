@@ -0,0 +1,221 @@
+"""Attribution of RPC traffic to the Python code that triggered it."""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+import os
+import sys
+from threading import Lock
+from typing import TYPE_CHECKING
+from typing import NamedTuple
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from ansys.edb.core.session import _Session
+
+# Frames of these packages are not call sites. gRPC frames sit between the interceptors and the EDB API.
+_INTERNAL_PACKAGES = ("ansys.edb.core", "grpc")
+# Frames of these modules are neither call sites nor part of the recorded stacks.
+_HIDDEN_MODULES = ("ansys.edb.core.inner.interceptors", "ansys.edb.core.utility.rpc_profiler")
+
+
+class CallSiteStats(NamedTuple):
+    """Represents the RPC traffic triggered by a line of code outside of the EDB API."""
+
+    call_site: str
+    """:obj:`str`: File and line number of the call site, such as ``"script.py:12"``."""
+    function: str
+    """:obj:`str`: Name of the function containing the call site."""
+    method: str
+    """:obj:`str`: Full name of the RPC method."""
+    calls: int
+    """:obj:`int`: Number of RPC calls."""
+    total_time: float
+    """:obj:`float`: Total latency of the RPC calls in seconds."""
+
+
+def _is_internal(frame):
+    module = frame.f_globals.get("__name__", "")
+    return any(module == package or module.startswith(package + ".") for package in _INTERNAL_PACKAGES)
+
+
+def _api_frame_label(frame):
+    return f"{frame.f_globals['__name__']}.{frame.f_code.co_name}"
+
+
+class RpcProfiler:
+    """Aggregates RPC count and latency by the Python call stack that triggered them.
+
+    The call site of an RPC is the first frame outside of the EDB API. The stack of a call is made of the frames \
+    that lead to the call site, followed by the EDB API functions and properties between the call site and the \
+    RPC. Requests answered by the IO manager are included with their, usually negligible, latency.
+    """
+
+    def __init__(self, max_depth: int = 32):
+        """Initialize an empty profiler.
+
+        Parameters
+        ----------
+        max_depth : int, default: 32
+            Maximum number of frames recorded outside of the EDB API for each call, starting from the call site.
+        """
+        self._max_depth = max_depth
+        self._lock = Lock()
+        self._stacks = {}
+
+    def capture(self, method: str) -> tuple:
+        """Capture the call stack of an RPC call being made by the current thread.
+
+        Parameters
+        ----------
+        method : str
+            Full name of the RPC method.
+
+        Returns
+        -------
+        tuple
+            Key of the call stack to pass to :meth:`record`.
+        """
+        frame = sys._getframe(1)
+        api_frames = []
+        while frame is not None and _is_internal(frame):
+            module = frame.f_globals.get("__name__", "")
+            if not module.startswith("grpc") and module not in _HIDDEN_MODULES:
+                api_frames.append(_api_frame_label(frame))
+            frame = frame.f_back
+        user_frames = []
+        while frame is not None and len(user_frames) < self._max_depth:
+            if not _is_internal(frame):
+                user_frames.append((frame.f_code.co_filename, frame.f_lineno, frame.f_code.co_name))
+            frame = frame.f_back
+        return tuple(reversed(user_frames)), tuple(reversed(api_frames)), method
+
+    def record(self, stack: tuple, latency: float):
+        """Record an RPC call.
+
+        Parameters
+        ----------
+        stack : tuple
+            Key of the call stack returned by :meth:`capture`.
+        latency : float
+            Latency of the call in seconds.
+        """
+        with self._lock:
+            entry = self._stacks.get(stack)
+            if entry is None:
+                self._stacks[stack] = [1, latency]
+            else:
+                entry[0] += 1
+                entry[1] += latency
+
+    def reset(self):
+        """Discard the calls recorded so far."""
+        with self._lock:
+            self._stacks = {}
+
+    def call_sites(self) -> list[CallSiteStats]:
+        """Get the RPC traffic of each call site and RPC method.
+
+        Returns
+        -------
+        list[CallSiteStats]
+            RPC traffic sorted by decreasing total latency.
+        """
+        call_sites = {}
+        with self._lock:
+            for (user_frames, _, method), (calls, total_time) in self._stacks.items():
+                file_name, line_number, function = user_frames[-1] if user_frames else ("<unknown>", 0, "<unknown>")
+                key = f"{file_name}:{line_number}", function, method
+                entry = call_sites.setdefault(key, [0, 0.0])
+                entry[0] += calls
+                entry[1] += total_time
+        return sorted(
+            (CallSiteStats(*key, *entry) for key, entry in call_sites.items()),
+            key=lambda stats: stats.total_time,
+            reverse=True,
+        )
+
+    def collapsed_stacks(self, weight: str = "time") -> str:
+        """Get the recorded calls in the collapsed stack format of flame graph tools.
+
+        Each line contains the frames of a call stack from the outermost frame, separated by semicolons, followed \
+        by the RPC method and the weight of the stack.
+
+        Parameters
+        ----------
+        weight : str, default: "time"
+            Weight of each stack. Options are ``"time"`` for the total latency in microseconds and ``"calls"`` \
+            for the number of calls.
+
+        Returns
+        -------
+        str
+        """
+        if weight not in ("time", "calls"):
+            raise ValueError(f'Unknown weight "{weight}". Options are "time" and "calls".')
+        lines = {}
+        with self._lock:
+            for (user_frames, api_frames, method), (calls, total_time) in self._stacks.items():
+                frames = [
+                    f"{function} ({os.path.basename(file_name)}:{line_number})"
+                    for file_name, line_number, function in user_frames
+                ]
+                frames.extend(api_frames)
+                frames.append(method.strip("/"))
+                line = ";".join(frame.replace(";", ":") for frame in frames)
+                lines[line] = lines.get(line, 0) + (calls if weight == "calls" else total_time)
+        if weight == "time":
+            lines = {line: round(total_time * 1e6) for line, total_time in lines.items()}
+        return "".join(f"{line} {value}\n" for line, value in lines.items())
+
+    def export_collapsed_stacks(self, file_path: str, weight: str = "time"):
+        """Write the recorded calls to a file in the collapsed stack format of flame graph tools.
+
+        Parameters
+        ----------
+        file_path : str
+            Path of the file to write.
+        weight : str, default: "time"
+            Weight of each stack. Options are ``"time"`` and ``"calls"``.
+        """
+        with open(file_path, "w") as file:
+            file.write(self.collapsed_stacks(weight))
+
+
+@contextmanager
+def profile_rpcs(edb_session: _Session | None = None, max_depth: int = 32) -> Iterator[RpcProfiler]:
+    """Attribute the RPC calls of a session to the Python code that triggered them within the context manager.
+
+    Parameters
+    ----------
+    edb_session : .Session, default: None
+        Session to profile. The default is ``None``, in which case the current session is used.
+    max_depth : int, default: 32
+        Maximum number of frames recorded outside of the EDB API for each call.
+
+    Yields
+    ------
+    RpcProfiler
+        Profiler that the calls are recorded in.
+
+    Examples
+    --------
+    >>> with profile_rpcs() as profiler:
+    >>>     for primitive in layout.primitives:
+    >>>         primitive.layer
+    >>> print(profiler.call_sites()[0])
+    >>> profiler.export_collapsed_stacks("rpcs.folded")
+    """
+    from ansys.edb.core.inner.exceptions import EDBSessionException
+    from ansys.edb.core.inner.exceptions import ErrorCode
+    from ansys.edb.core.session import get_current_session
+
+    if edb_session is None and (edb_session := get_current_session()) is None:
+        raise EDBSessionException(ErrorCode.NO_SESSIONS)
+    profiler = RpcProfiler(max_depth)
+    previous_profiler, edb_session.rpc_profiler = edb_session.rpc_profiler, profiler
+    try:
+        yield profiler
+    finally:
+        edb_session.rpc_profiler = previous_profiler
@@ -0,0 +1,443 @@
+"""Recording and offline replay of the RPC traffic of a session.
+
+A recording holds the serialized requests and responses of each RPC sent to the server. Replaying it serves the
+recorded responses without a server, so that the client-side cost of a script, such as building messages, parsing
+responses, and creating objects, can be measured on machines without an Ansys installation.
+
+The responses are looked up by RPC method and serialized request, so a replayed script must send the same requests as
+the recorded one. Requests are serialized deterministically for the lookup.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from collections import deque
+from contextlib import contextmanager
+from struct import Struct
+from threading import Lock
+from time import sleep
+from typing import TYPE_CHECKING
+from typing import NamedTuple
+
+import grpc
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from ansys.edb.core.session import _Session
+
+_MAGIC = b"EDBRPC\x01\n"
+# Method length, status code, details length, request count, response count, latency
+_RECORD_HEADER = Struct("<HBIIId")
+_MESSAGE_LENGTH = Struct("<I")
+
+
+class RecordedRpc(NamedTuple):
+    """Represents an RPC call in a recording."""
+
+    method: str
+    """:obj:`str`: Full name of the RPC method, such as ``"/ansys.api.edb.v1.CellService/CutOut"``."""
+    requests: tuple[bytes, ...]
+    """:obj:`tuple` of :obj:`bytes`: Serialized requests. Only streaming requests have more than one."""
+    responses: tuple[bytes, ...]
+    """:obj:`tuple` of :obj:`bytes`: Serialized responses. Only streaming responses have more than one."""
+    code: int
+    """:obj:`int`: Value of the status code of the call, which is ``0`` for successful calls."""
+    details: str
+    """:obj:`str`: Details of the status of failed calls."""
+    latency: float
+    """:obj:`float`: Latency of the call in seconds."""
+
+
+def _serialize(message):
+    return message.SerializeToString(deterministic=True)
+
+
+class RpcRecorder:
+    """Writes the RPC calls of a session to a recording file."""
+
+    def __init__(self, file_path: str):
+        """Open a recording file for writing.
+
+        Parameters
+        ----------
+        file_path : str
+            Path of the recording file. An existing file is overwritten.
+        """
+        self._file = open(file_path, "wb")
+        self._file.write(_MAGIC)
+        self._lock = Lock()
+
+    def record(self, recorded_rpc: RecordedRpc):
+        """Write an RPC call to the recording.
+
+        Parameters
+        ----------
+        recorded_rpc : RecordedRpc
+            RPC call to write.
+        """
+        method = recorded_rpc.method.encode()
+        details = recorded_rpc.details.encode()
+        chunks = [
+            _RECORD_HEADER.pack(
+                len(method),
+                recorded_rpc.code,
+                len(details),
+                len(recorded_rpc.requests),
+                len(recorded_rpc.responses),
+                recorded_rpc.latency,
+            ),
+            method,
+            details,
+        ]
+        for message in recorded_rpc.requests + recorded_rpc.responses:
+            chunks.append(_MESSAGE_LENGTH.pack(len(message)))
+            chunks.append(message)
+        with self._lock:
+            self._file.write(b"".join(chunks))
+
+    def close(self):
+        """Close the recording file."""
+        with self._lock:
+            self._file.close()
+
+
+def read_recording(file_path: str) -> Iterator[RecordedRpc]:
+    """Read the RPC calls of a recording file.
+
+    Parameters
+    ----------
+    file_path : str
+        Path of the recording file.
+
+    Yields
+    ------
+    RecordedRpc
+        RPC calls in the order in which they completed.
+    """
+    with open(file_path, "rb") as file:
+        if file.read(len(_MAGIC)) != _MAGIC:
+            raise ValueError(f"{file_path} is not an RPC recording.")
+
+        def read_message():
+            (length,) = _MESSAGE_LENGTH.unpack(file.read(_MESSAGE_LENGTH.size))
+            return file.read(length)
+
+        while header := file.read(_RECORD_HEADER.size):
+            method_length, code, details_length, request_count, response_count, latency = _RECORD_HEADER.unpack(header)
+            method = file.read(method_length).decode()
+            details = file.read(details_length).decode()
+            requests = tuple(read_message() for _ in range(request_count))
+            responses = tuple(read_message() for _ in range(response_count))
+            yield RecordedRpc(method, requests, responses, code, details, latency)
+
+
+class _ReplayedRpcError(grpc.RpcError, grpc.Call, grpc.Future):
+    """Error of a replayed failed call, which behaves like the errors raised by gRPC channels."""
+
+    def __init__(self, code, details):
+        super().__init__()
+        self._code = code
+        self._details = details
+
+    def code(self):
+        return self._code
+
+    def details(self):
+        return self._details
+
+    def initial_metadata(self):
+        return None
+
+    def trailing_metadata(self):
+        return None
+
+    def is_active(self):
+        return False
+
+    def time_remaining(self):
+        return None
+
+    def cancel(self):
+        return False
+
+    def cancelled(self):
+        return False
+
+    def running(self):
+        return False
+
+    def done(self):
+        return True
+
+    def result(self, timeout=None):
+        raise self
+
+    def exception(self, timeout=None):
+        return self
+
+    def traceback(self, timeout=None):
+        return None
+
+    def add_callback(self, callback):
+        return False
+
+    def add_done_callback(self, fn):
+        fn(self)
+
+
+class _ReplayedCall(grpc.Call, grpc.Future):
+    def __init__(self, response):
+        self._response = response
+
+    def code(self):
+        return grpc.StatusCode.OK
+
+    def details(self):
+        return ""
+
+    def initial_metadata(self):
+        return None
+
+    def trailing_metadata(self):
+        return None
+
+    def is_active(self):
+        return False
+
+    def time_remaining(self):
+        return None
+
+    def cancel(self):
+        return False
+
+    def cancelled(self):
+        return False
+
+    def running(self):
+        return False
+
+    def done(self):
+        return True
+
+    def result(self, timeout=None):
+        return self._response
+
+    def exception(self, timeout=None):
+        return None
+
+    def traceback(self, timeout=None):
+        return None
+
+    def add_callback(self, callback):
+        return False
+
+    def add_done_callback(self, fn):
+        fn(self)
+
+
+_STATUS_CODES = {status_code.value[0]: status_code for status_code in grpc.StatusCode}
+
+
+class ReplayChannel(grpc.Channel):
+    """Channel that serves the responses of a recording instead of sending requests to a server."""
+
+    def __init__(self, file_path: str, simulate_latency: bool = False):
+        """Load a recording.
+
+        Parameters
+        ----------
+        file_path : str
+            Path of the recording file.
+        simulate_latency : bool, default: False
+            Whether to wait for the recorded latency of each call before responding.
+        """
+        self._simulate_latency = simulate_latency
+        self._lock = Lock()
+        self._recorded_rpcs = defaultdict(deque)
+        for recorded_rpc in read_recording(file_path):
+            self._recorded_rpcs[recorded_rpc.method, recorded_rpc.requests].append(recorded_rpc)
+
+    def _replay(self, method, requests):
+        key = method, tuple(_serialize(request) for request in requests)
+        with self._lock:
+            recorded_rpcs = self._recorded_rpcs.get(key)
+            if not recorded_rpcs:
+                raise _ReplayedRpcError(grpc.StatusCode.NOT_FOUND, f"No recorded response for {method}.")
+            # The last response to a request is reused once the recorded ones are used up.
+            recorded_rpc = recorded_rpcs.popleft() if len(recorded_rpcs) > 1 else recorded_rpcs[0]
+        if self._simulate_latency:
+            sleep(recorded_rpc.latency)
+        return recorded_rpc
+
+    @staticmethod
+    def _raise_for_status(recorded_rpc):
+        if recorded_rpc.code != 0:
+            raise _ReplayedRpcError(_STATUS_CODES[recorded_rpc.code], recorded_rpc.details)
+
+    def _unary_response(self, method, requests, response_deserializer):
+        recorded_rpc = self._replay(method, requests)
+        self._raise_for_status(recorded_rpc)
+        return response_deserializer(recorded_rpc.responses[0])
+
+    def _stream_responses(self, method, requests, response_deserializer):
+        recorded_rpc = self._replay(method, requests)
+        for response in recorded_rpc.responses:
+            yield response_deserializer(response)
+        self._raise_for_status(recorded_rpc)
+
+    def unary_unary(self, method, request_serializer=None, response_deserializer=None, *args, **kwargs):
+        """Create a callable for a unary-unary RPC method."""
+        return _ReplayedUnaryUnaryMultiCallable(
+            lambda request: self._unary_response(method, (request,), response_deserializer)
+        )
+
+    def unary_stream(self, method, request_serializer=None, response_deserializer=None, *args, **kwargs):
+        """Create a callable for a unary-stream RPC method."""
+        return _ReplayedStreamMultiCallable(
+            lambda request: self._stream_responses(method, (request,), response_deserializer)
+        )
+
+    def stream_unary(self, method, request_serializer=None, response_deserializer=None, *args, **kwargs):
+        """Create a callable for a stream-unary RPC method."""
+        return _ReplayedUnaryUnaryMultiCallable(
+            lambda request_iterator: self._unary_response(method, tuple(request_iterator), response_deserializer)
+        )
+
+    def stream_stream(self, method, request_serializer=None, response_deserializer=None, *args, **kwargs):
+        """Create a callable for a stream-stream RPC method."""
+        return _ReplayedStreamMultiCallable(
+            lambda request_iterator: self._stream_responses(method, tuple(request_iterator), response_deserializer)
+        )
+
+    def subscribe(self, callback, try_to_connect=False):
+        """Ignore subscriptions to the connectivity of the channel."""
+
+    def unsubscribe(self, callback):
+        """Ignore subscriptions to the connectivity of the channel."""
+
+    def close(self):
+        """Close the channel."""
+
+    def __enter__(self):
+        """Enter the channel."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Close the channel on exit."""
+        self.close()
+
+
+class _ReplayedUnaryUnaryMultiCallable(grpc.UnaryUnaryMultiCallable, grpc.StreamUnaryMultiCallable):
+    def __init__(self, get_response):
+        self._get_response = get_response
+
+    def __call__(self, request, *args, **kwargs):
+        return self._get_response(request)
+
+    def with_call(self, request, *args, **kwargs):
+        response = self._get_response(request)
+        return response, _ReplayedCall(response)
+
+    def future(self, request, *args, **kwargs):
+        try:
+            return _ReplayedCall(self._get_response(request))
+        except _ReplayedRpcError as error:
+            return error
+
+
+class _ReplayedStreamMultiCallable(grpc.UnaryStreamMultiCallable, grpc.StreamStreamMultiCallable):
+    def __init__(self, get_responses):
+        self._get_responses = get_responses
+
+    def __call__(self, request, *args, **kwargs):
+        return self._get_responses(request)
+
+
+@contextmanager
+def record_rpcs(file_path: str, edb_session: _Session | None = None) -> Iterator[RpcRecorder]:
+    """Record the RPC calls of a session sent to the server within the context manager.
+
+    Requests answered by the IO manager are not sent to the server and are not recorded. The buffer of the IO \
+    manager is flushed and the IDs of the objects that it creates are restarted when the recording starts, so that \
+    replaying the recording with :func:`replay_session` in the same process or in another one sends the same requests.
+
+    Parameters
+    ----------
+    file_path : str
+        Path of the recording file. An existing file is overwritten.
+    edb_session : .Session, default: None
+        Session to record. The default is ``None``, in which case the current session is used.
+
+    Yields
+    ------
+    RpcRecorder
+        Recorder that the calls are written with.
+
+    Examples
+    --------
+    >>> with session(ansys_em_root), record_rpcs("query_prims.edbrpc"):
+    >>>     query_prims()
+    >>> with replay_session("query_prims.edbrpc"):
+    >>>     query_prims()
+    """
+    from ansys.edb.core.inner.exceptions import EDBSessionException
+    from ansys.edb.core.inner.exceptions import ErrorCode
+    from ansys.edb.core.session import get_current_session
+    from ansys.edb.core.session import use_session
+    from ansys.edb.core.utility.io_manager import _reset_future_ids
+
+    if edb_session is None and (edb_session := get_current_session()) is None:
+        raise EDBSessionException(ErrorCode.NO_SESSIONS)
+    if (buffer := edb_session.io_manager.buffer) is not None:
+        with use_session(edb_session):
+            buffer.flush()
+    _reset_future_ids()
+    recorder = RpcRecorder(file_path)
+    previous_recorder, edb_session.rpc_recorder = edb_session.rpc_recorder, recorder
+    try:
+        yield recorder
+    finally:
+        edb_session.rpc_recorder = previous_recorder
+        recorder.close()
+
+
+def replay_session(
+    file_path: str, simulate_latency: bool = False, dump_traffic_log: bool = False, make_current: bool = True
+) -> _Session:
+    """Create a session that replays a recording instead of connecting to a server.
+
+    The session must be disconnected after use. A current session can also be used as a context manager. The IDs of \
+    the objects created by the IO manager are restarted, as they are when the recording starts.
+
+    Parameters
+    ----------
+    file_path : str
+        Path of the recording file.
+    simulate_latency : bool, default: False
+        Whether to wait for the recorded latency of each call before responding. By default, responses are \
+        served immediately so that only the client-side cost is measured.
+    dump_traffic_log : bool, default: False
+        Flag indicating if RPC statistics should be collected and the network traffic log should be dumped when \
+        the session is disconnected.
+    make_current : bool, default: True
+        Flag indicating if the session should become the current session of the process.
+
+    Returns
+    -------
+    .Session
+    """
+    from ansys.edb.core.session import MOD
+    from ansys.edb.core.session import _Session
+    from ansys.edb.core.utility.io_manager import _reset_future_ids
+
+    channel = ReplayChannel(file_path, simulate_latency)
+    _reset_future_ids()
+    # No server is launched or attached to, so the port number only keeps the session from looking one up.
+    edb_session = _Session(None, 50051, None, dump_traffic_log, make_current=make_current)
+    edb_session._setup_interceptors()
+    edb_session.channel = grpc.intercept_channel(channel, *edb_session.interceptors)
+    edb_session._initialize_stubs()
+    if make_current:
+        MOD.current_session = edb_session
+    return edb_session
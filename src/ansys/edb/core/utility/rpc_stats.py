@@ -0,0 +1,159 @@
+"""RPC statistics of a session."""
+
+from __future__ import annotations
+
+from array import array
+import json
+from math import ceil
+from threading import Lock
+from typing import NamedTuple
+
+
+class RpcMethodStats(NamedTuple):
+    """Represents the statistics of an RPC method.
+
+    Latencies are measured on the client from sending the request to receiving the whole response.
+    """
+
+    calls: int
+    """:obj:`int`: Number of requests sent to the server."""
+    cache_hits: int
+    """:obj:`int`: Number of requests answered by the cache of the IO manager without being sent to the server."""
+    buffered: int
+    """:obj:`int`: Number of requests added to the buffer of the IO manager to be sent in a later flush."""
+    request_bytes: int
+    """:obj:`int`: Total size of the serialized requests sent to the server."""
+    response_bytes: int
+    """:obj:`int`: Total size of the serialized responses received from the server."""
+    total_time: float
+    """:obj:`float`: Total latency of the requests sent to the server in seconds."""
+    p50: float
+    """:obj:`float`: Median latency in seconds."""
+    p95: float
+    """:obj:`float`: 95th percentile latency in seconds."""
+    p99: float
+    """:obj:`float`: 99th percentile latency in seconds."""
+
+
+class _MethodRecord:
+    def __init__(self):
+        self.cache_hits = 0
+        self.buffered = 0
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.latencies = array("d")
+
+    def stats(self):
+        latencies = sorted(self.latencies)
+
+        def percentile(rank):
+            return latencies[max(ceil(rank * len(latencies)) - 1, 0)] if latencies else 0.0
+
+        return RpcMethodStats(
+            len(latencies),
+            self.cache_hits,
+            self.buffered,
+            self.request_bytes,
+            self.response_bytes,
+            sum(latencies),
+            percentile(0.5),
+            percentile(0.95),
+            percentile(0.99),
+        )
+
+
+class RpcStats:
+    """Collects the statistics of the RPC methods called by a session.
+
+    Statistics are collected by sessions created with ``dump_traffic_log=True`` and can be queried while the \
+    session is in use with :meth:`.Session.stats`.
+    """
+
+    def __init__(self):
+        """Initialize empty RPC statistics."""
+        self._lock = Lock()
+        self._records = {}
+
+    def _record(self, method):
+        if (record := self._records.get(method)) is None:
+            record = self._records[method] = _MethodRecord()
+        return record
+
+    def record_call(self, method: str, latency: float, request_bytes: int, response_bytes: int):
+        """Record a request sent to the server.
+
+        Parameters
+        ----------
+        method : str
+            Full name of the RPC method, such as ``"/ansys.api.edb.v1.CellService/CutOut"``.
+        latency : float
+            Latency of the request in seconds.
+        request_bytes : int
+            Size of the serialized request.
+        response_bytes : int
+            Size of the serialized response.
+        """
+        with self._lock:
+            record = self._record(method)
+            record.latencies.append(latency)
+            record.request_bytes += request_bytes
+            record.response_bytes += response_bytes
+
+    def record_cache_hit(self, method: str):
+        """Record a request answered by the cache of the IO manager.
+
+        Parameters
+        ----------
+        method : str
+            Full name of the RPC method.
+        """
+        with self._lock:
+            self._record(method).cache_hits += 1
+
+    def record_buffered(self, method: str):
+        """Record a request added to the buffer of the IO manager.
+
+        Parameters
+        ----------
+        method : str
+            Full name of the RPC method.
+        """
+        with self._lock:
+            self._record(method).buffered += 1
+
+    def snapshot(self) -> dict[str, RpcMethodStats]:
+        """Get the statistics of each RPC method called so far.
+
+        Returns
+        -------
+        dict of str to RpcMethodStats
+            Statistics mapped by full name of the RPC method, sorted by decreasing total latency.
+        """
+        with self._lock:
+            stats = {method: record.stats() for method, record in self._records.items()}
+        return dict(sorted(stats.items(), key=lambda item: item[1].total_time, reverse=True))
+
+    def reset(self):
+        """Discard the statistics collected so far."""
+        with self._lock:
+            self._records = {}
+
+    def to_json(self) -> str:
+        """Get the statistics of each RPC method called so far as a JSON string.
+
+        Returns
+        -------
+        str
+        """
+        return json.dumps({method: stats._asdict() for method, stats in self.snapshot().items()}, indent=4)
+
+    def export(self, file_path: str):
+        """Write the statistics of each RPC method called so far to a JSON file.
+
+        Parameters
+        ----------
+        file_path : str
+            Path of the file to write.
+        """
+        with open(file_path, "w") as file:
+            file.write(self.to_json())
@@ -0,0 +1,85 @@
+"""Stand-in for the EDB API server.
+
+The stand-in server implements just enough of the EDB API to open and close databases. It lets tools built on top of
+sessions, such as :func:`.process_databases`, be tested on machines without an Ansys installation. It listens on the
+same Unix domain socket as the EDB API server, so it is only supported on Linux and macOS.
+
+Run it with ``python -m ansys.edb.core.utility.stand_in_server -p <port>``, or create a directory that can be passed
+as ``ansys_em_root`` to :func:`.launch_session` with :func:`create_stand_in_root`.
+"""
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from itertools import count
+import os
+from pathlib import Path
+import stat
+import sys
+from threading import Lock
+
+from ansys.api.edb.v1 import database_pb2_grpc
+from ansys.api.edb.v1.edb_messages_pb2 import EDBObjMessage
+from google.protobuf.empty_pb2 import Empty
+import grpc
+
+
+class _DatabaseService(database_pb2_grpc.DatabaseServiceServicer):
+    """Opens and closes databases that exist on disk without reading them."""
+
+    def __init__(self):
+        self._ids = count(1)
+        self._lock = Lock()
+
+    def Open(self, request, context):
+        if not os.path.exists(request.edb_path):
+            context.abort(grpc.StatusCode.INVALID_ARGUMENT, f"Database {request.edb_path} does not exist.")
+        with self._lock:
+            return EDBObjMessage(id=next(self._ids))
+
+    def Close(self, request, context):
+        return Empty()
+
+
+def serve(port_num: int):
+    """Serve the stand-in server until the process is terminated.
+
+    Parameters
+    ----------
+    port_num : int
+        Port number to listen on. The server listens on the Unix domain socket that sessions use for this port.
+    """
+    from ansys.edb.core.session import _Session
+
+    uds_file = _Session._get_uds_file_from_port_num(port_num)
+    Path(uds_file).parent.mkdir(parents=True, exist_ok=True)
+    server = grpc.server(ThreadPoolExecutor(max_workers=4))
+    database_pb2_grpc.add_DatabaseServiceServicer_to_server(_DatabaseService(), server)
+    server.add_insecure_port(f"unix:{uds_file}")
+    server.start()
+    print(f"Server listening on unix:{uds_file}", flush=True)
+    server.wait_for_termination()
+
+
+def create_stand_in_root(directory: str) -> str:
+    """Create an ``EDB_RPC_Server`` executable in a directory that starts the stand-in server.
+
+    Parameters
+    ----------
+    directory : str
+        Directory to create the executable in.
+
+    Returns
+    -------
+    str
+        Directory that can be passed as ``ansys_em_root`` to :func:`.launch_session`.
+    """
+    executable = Path(directory) / "EDB_RPC_Server"
+    executable.write_text(f'#!/bin/sh\nexec "{sys.executable}" -m {__name__} "$@"\n')
+    executable.chmod(executable.stat().st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+    return str(directory)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-p", dest="port_num", type=int, required=True)
+    serve(parser.parse_known_args()[0].port_num)
@@ -0,0 +1,103 @@
+"""Tracing of RPCs and IO manager operations.
+
+Spans are created around each RPC, each flush of the buffer and each refresh of the cache of the IO manager, and
+each streamed collection. Any tracer with a ``start_as_current_span`` method compatible with OpenTelemetry can be
+used, for example ``set_tracer(opentelemetry.trace.get_tracer("ansys.edb.core"))``. No spans are created by default.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Protocol
+
+if TYPE_CHECKING:
+    from contextlib import AbstractContextManager
+
+
+class Span(Protocol):
+    """Provides the interface of the spans created by a :class:`Tracer`."""
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Set an attribute of the span."""
+
+    def end(self) -> None:
+        """End a span created with :meth:`Tracer.start_span`."""
+
+
+class Tracer(Protocol):
+    """Provides the interface of the tracers accepted by :func:`set_tracer`."""
+
+    def start_as_current_span(
+        self, name: str, attributes: dict[str, Any] | None = None
+    ) -> AbstractContextManager[Span]:
+        """Create a span that is the current span within the returned context manager."""
+
+    def start_span(self, name: str, attributes: dict[str, Any] | None = None) -> Span:
+        """Create a span that must be ended explicitly.
+
+        It is used for spans that last across the iterations of a generator, which cannot be the current span.
+        """
+
+
+class _NoOpSpan:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+    def set_attribute(self, key, value):
+        pass
+
+    def end(self):
+        pass
+
+
+class _NoOpTracer:
+    _SPAN = _NoOpSpan()
+
+    def start_as_current_span(self, name, attributes=None):
+        return self._SPAN
+
+    def start_span(self, name, attributes=None):
+        return self._SPAN
+
+
+_NO_OP_TRACER = _NoOpTracer()
+_tracer = _NO_OP_TRACER
+
+
+def set_tracer(tracer: Tracer | None):
+    """Set the tracer that creates the spans of all sessions.
+
+    Parameters
+    ----------
+    tracer : Tracer or None
+        Tracer to use. If ``None``, no spans are created.
+    """
+    global _tracer
+    _tracer = _NO_OP_TRACER if tracer is None else tracer
+
+
+def get_tracer() -> Tracer:
+    """Get the tracer that creates the spans of all sessions.
+
+    Returns
+    -------
+    Tracer
+        Tracer set with :func:`set_tracer`, or a tracer that creates no spans.
+    """
+    return _tracer
+
+
+def is_tracing() -> bool:
+    """Check if spans are created.
+
+    Span attributes that are costly to compute are only computed when spans are created.
+
+    Returns
+    -------
+    bool
+    """
+    return _tracer is not _NO_OP_TRACER
@@ -54,6 +54,19 @@ def create_prims():
     return num_prims
 
 
+def create_prims_many():
+    num_prims = 1000
+    Rectangle.create_many(
+        lyt,
+        lyr_name,
+        net_name,
+        [(0, 0)] * num_prims,
+        1e-3,
+        1e-3,
+    )
+    return num_prims
+
+
 def read_test():
     read_test_start = time()
     with enable_io_manager(IOMangementType.READ):
@@ -77,6 +90,17 @@ def write_test():
     return num_write_test_created_prims
 
 
+def bulk_write_test():
+    bulk_write_test_start = time()
+    num_bulk_write_test_created_prims = create_prims_many()
+    bulk_write_test_end = time()
+    print(
+        f"bulk_write_test time: {bulk_write_test_end - bulk_write_test_start} seconds "
+        f"(created {num_bulk_write_test_created_prims} primitives)"
+    )
+    return num_bulk_write_test_created_prims
+
+
 def read_and_write_test():
     read_write_test_start = time()
     with enable_io_manager(IOMangementType.READ_AND_WRITE):
@@ -132,7 +156,7 @@ def caching_flushing_blocking_test():
 
 def read_write_test():
     rw_start = time()
-    num_created_prims = write_test()
+    num_created_prims = write_test() + bulk_write_test()
     num_queried_prims = read_test()
     prim_io_op_counts = read_and_write_test()
     rw_end = time()
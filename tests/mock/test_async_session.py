@@ -0,0 +1,159 @@
+import asyncio
+from threading import Barrier
+
+from ansys.api.edb.v1 import cell_pb2_grpc
+from ansys.api.edb.v1 import layout_instance_pb2_grpc
+from ansys.api.edb.v1 import layout_obj_instance_2d_geometry_pb2_grpc
+from ansys.api.edb.v1 import layout_obj_instance_pb2_grpc
+from ansys.api.edb.v1 import layout_pb2_grpc
+from ansys.api.edb.v1.edb_messages_pb2 import EDBObjCollectionMessage
+from ansys.api.edb.v1.edb_messages_pb2 import EDBObjMessage
+from ansys.api.edb.v1.layout_obj_instance_pb2 import FetchedLayoutObjInstanceGeometriesMessage
+from google.protobuf.empty_pb2 import Empty
+import grpc
+import pytest
+from utils.fixtures import *  # noqa
+
+from ansys.edb.core.async_session import AsyncSession
+from ansys.edb.core.edb_defs import LayoutObjType
+from ansys.edb.core.geometry.point_data import PointData
+from ansys.edb.core.geometry.polygon_data import PolygonData
+from ansys.edb.core.inner.exceptions import InvalidArgumentException
+from ansys.edb.core.inner.messages import polygon_data_message
+from ansys.edb.core.layer.layer import Layer
+from ansys.edb.core.layout.cell import Cell
+from ansys.edb.core.layout.layout import Layout
+from ansys.edb.core.layout_instance.layout_instance import LayoutInstance
+from ansys.edb.core.layout_instance.layout_obj_instance import LayoutObjInstance
+from ansys.edb.core.net.net import Net
+from ansys.edb.core.session import _Session
+
+
+class _LayoutService(layout_pb2_grpc.LayoutServiceServicer):
+    def __init__(self, concurrent_calls):
+        self._arrivals = Barrier(concurrent_calls, timeout=5)
+
+    def GetItems(self, request, context):
+        if request.type != LayoutObjType.NET.value:
+            context.abort(grpc.StatusCode.INVALID_ARGUMENT, "Unsupported type.")
+        # Respond only once all concurrent calls have arrived, which requires them to be in flight together.
+        self._arrivals.wait()
+        return EDBObjCollectionMessage(items=[EDBObjMessage(id=request.target.id * 10 + i) for i in range(3)])
+
+    def StreamItems(self, request, context):
+        for i in range(3):
+            yield EDBObjCollectionMessage(items=[EDBObjMessage(id=i * 2), EDBObjMessage(id=i * 2 + 1)])
+
+
+class _LayoutObjInstanceService(layout_obj_instance_pb2_grpc.LayoutObjInstanceServiceServicer):
+    def GetGeometries(self, request, context):
+        geometry_id = request.edb_obj.id * 100 + request.layer_ref.id.id
+        return FetchedLayoutObjInstanceGeometriesMessage(
+            geometries=[
+                {"type": 0, "geometry": {"geometry": {"id": geometry_id}}},
+                {"type": 1, "geometry": {"geometry": {"id": geometry_id + 1}}},
+            ]
+        )
+
+
+class _LayoutObjInstance2DGeometryService(
+    layout_obj_instance_2d_geometry_pb2_grpc.LayoutObjInstance2DGeometryServiceServicer
+):
+    def GetPolygonData(self, request, context):
+        size = request.layout_obj_inst_geom.geometry.id + (1 if request.apply_neg else 0)
+        return polygon_data_message(PolygonData([PointData(0, 0), PointData(size, 0), PointData(size, size)]))
+
+
+class _CellService(cell_pb2_grpc.CellServiceServicer):
+    def CutOut(self, request, context):
+        return EDBObjMessage(id=request.cell.id + len(request.included_nets.items))
+
+
+class _LayoutInstanceService(layout_instance_pb2_grpc.LayoutInstanceServiceServicer):
+    refreshed = []
+
+    def Refresh(self, request, context):
+        self.refreshed.append(request.id)
+        return Empty()
+
+
+def _run_with_server(server_session, test, concurrent_calls=1):
+    edb_session = server_session(
+        (layout_pb2_grpc.add_LayoutServiceServicer_to_server, _LayoutService(concurrent_calls)),
+        (layout_obj_instance_pb2_grpc.add_LayoutObjInstanceServiceServicer_to_server, _LayoutObjInstanceService()),
+        (
+            layout_obj_instance_2d_geometry_pb2_grpc.add_LayoutObjInstance2DGeometryServiceServicer_to_server,
+            _LayoutObjInstance2DGeometryService(),
+        ),
+        (cell_pb2_grpc.add_CellServiceServicer_to_server, _CellService()),
+        (layout_instance_pb2_grpc.add_LayoutInstanceServiceServicer_to_server, _LayoutInstanceService()),
+    )
+
+    async def run():
+        async with AsyncSession(edb_session) as async_session:
+            return await test(async_session)
+
+    return asyncio.run(run())
+
+
+def test_concurrent_collection_queries_are_pipelined(server_session):
+    async def test(async_session):
+        return await asyncio.gather(
+            *(async_session.get_items(Layout(EDBObjMessage(id=i)), LayoutObjType.NET) for i in (1, 2))
+        )
+
+    results = _run_with_server(server_session, test, concurrent_calls=2)
+
+    assert [[type(item) for item in items] for items in results] == [[Net] * 3] * 2
+    assert [[item.id for item in items] for items in results] == [[10, 11, 12], [20, 21, 22]]
+
+
+def test_iter_items(server_session):
+    async def test(async_session):
+        return [item.id async for item in async_session.iter_items(Layout(EDBObjMessage(id=1)), LayoutObjType.NET)]
+
+    assert _run_with_server(server_session, test) == list(range(6))
+
+
+def test_fetch_polygon_data(server_session):
+    async def test(async_session):
+        instances = [LayoutObjInstance(EDBObjMessage(id=i)) for i in (1, 2)]
+        return await async_session.fetch_polygon_data(instances, Layer(EDBObjMessage(id=10)), apply_negatives=True)
+
+    polygons = _run_with_server(server_session, test)
+
+    assert [[polygon.points[1].x.double for polygon in inst_polygons] for inst_polygons in polygons] == [[111], [211]]
+
+
+def test_heavy_operations(mocker, server_session):
+    cache = mocker.Mock()
+
+    async def test(async_session):
+        async_session.session.io_manager._cache = cache
+        await async_session.get_items(Layout(EDBObjMessage(id=1)), LayoutObjType.NET)
+        assert cache.invalidate.call_count == 0
+        cell = await async_session.cutout(Cell(EDBObjMessage(id=5)), [Net(EDBObjMessage(id=1))], [], PolygonData([]))
+        await async_session.refresh(LayoutInstance(EDBObjMessage(id=7)))
+        return cell
+
+    cell = _run_with_server(server_session, test)
+
+    assert isinstance(cell, Cell) and cell.id == 6
+    assert _LayoutInstanceService.refreshed[-1] == 7
+    assert cache.invalidate.call_count == 2
+
+
+def test_unsupported_transport_mode():
+    edb_session = _Session("localhost", 50051, None, False, make_current=False)
+    edb_session.transport_mode = "mtls"
+
+    with pytest.raises(ValueError):
+        edb_session._create_aio_channel([])
+
+
+def test_errors_are_raised_as_edb_exceptions(server_session):
+    async def test(async_session):
+        await async_session.get_items(Layout(EDBObjMessage(id=1)), LayoutObjType.PRIMITIVE)
+
+    with pytest.raises(InvalidArgumentException):
+        _run_with_server(server_session, test)
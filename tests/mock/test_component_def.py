@@ -0,0 +1,45 @@
+from ansys.api.edb.v1.component_model_pb2 import N_PORT
+from ansys.api.edb.v1.component_model_pb2 import ComponentModelTypeMessage
+from ansys.api.edb.v1.edb_messages_pb2 import EDBObjCollectionMessage
+from ansys.api.edb.v1.edb_messages_pb2 import EDBObjMessage
+from google.protobuf.wrappers_pb2 import StringValue
+from google.protobuf.wrappers_pb2 import UInt64Value
+from utils.fixtures import *  # noqa
+
+from ansys.edb.core import database
+from ansys.edb.core.database import Database
+from ansys.edb.core.definition import component_def
+from ansys.edb.core.definition import component_model
+from ansys.edb.core.definition import component_pin
+from ansys.edb.core.definition.component_def import ComponentDef
+from ansys.edb.core.definition.component_model import ComponentModel
+from ansys.edb.core.definition.component_model import NPortComponentModel
+from ansys.edb.core.definition.component_pin import ComponentPin
+
+
+def _collection(ids):
+    return EDBObjCollectionMessage(items=[EDBObjMessage(id=i) for i in ids])
+
+
+def test_component_catalog(mocker, mocked_stub):
+    mocker.patch("ansys.edb.core.session.is_in_memory", return_value=True)
+    mocked_stub(database, Database).GetDefinitionObjs.return_value = _collection([1, 2])
+    def_stub = mocked_stub(component_def, ComponentDef)
+    def_stub.GetName.side_effect = lambda request: StringValue(value=f"def_{request.id}")
+    def_stub.GetFootprintCell.side_effect = lambda request: EDBObjMessage(id=100 + request.id if request.id == 1 else 0)
+    def_stub.GetComponentPins.side_effect = lambda request: _collection([11, 12] if request.id == 1 else [21])
+    def_stub.GetComponentModels.side_effect = lambda request: _collection([31] if request.id == 1 else [])
+    pin_stub = mocked_stub(component_pin, ComponentPin)
+    pin_stub.GetName.side_effect = lambda request: StringValue(value=str(request.id))
+    pin_stub.GetNumber.side_effect = lambda request: UInt64Value(value=request.id % 10)
+    mocked_stub(component_model, ComponentModel).GetType.return_value = ComponentModelTypeMessage(type=N_PORT)
+
+    catalog = Database(EDBObjMessage(id=10)).component_catalog()
+
+    assert [(entry.name, entry.footprint_id) for entry in catalog] == [("def_1", 101), ("def_2", 0)]
+    assert [[(pin.pin.id, pin.name, pin.number) for pin in entry.pins] for entry in catalog] == [
+        [(11, "11", 1), (12, "12", 2)],
+        [(21, "21", 1)],
+    ]
+    assert [type(model) for model in catalog[0].models] == [NPortComponentModel]
+    assert catalog[1].models == ()
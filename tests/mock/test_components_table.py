@@ -0,0 +1,119 @@
+from ansys.api.edb.v1.component_property_pb2 import ComponentPropModelMessage
+from ansys.api.edb.v1.connectable_pb2 import LayoutObjTypeMessage
+from ansys.api.edb.v1.edb_defs_pb2 import CAPACITOR
+from ansys.api.edb.v1.edb_defs_pb2 import IC
+from ansys.api.edb.v1.edb_messages_pb2 import ComponentTypeMessage
+from ansys.api.edb.v1.edb_messages_pb2 import EDBObjCollectionMessage
+from ansys.api.edb.v1.edb_messages_pb2 import EDBObjMessage
+from ansys.api.edb.v1.edb_messages_pb2 import StringPairsMessage
+from ansys.api.edb.v1.group_pb2 import GroupTypeMessage
+from ansys.api.edb.v1.layer_pb2 import SIGNAL_LAYER
+from ansys.api.edb.v1.layer_pb2 import LayerTypeMessage
+from ansys.api.edb.v1.model_pb2 import PIN_PAIR_RLC_MODEL_TYPE
+from ansys.api.edb.v1.padstack_instance_pb2 import PadstackInstPositionAndRotationMessage
+from ansys.api.edb.v1.pin_pair_model_pb2 import PinPairRlcMessage
+from google.protobuf.wrappers_pb2 import BoolValue
+from google.protobuf.wrappers_pb2 import StringValue
+from utils.fixtures import *  # noqa
+
+from ansys.edb.core.definition import component_def
+from ansys.edb.core.definition import component_property
+from ansys.edb.core.definition.component_def import ComponentDef
+from ansys.edb.core.definition.component_property import ComponentProperty
+from ansys.edb.core.edb_defs import LayoutObjType
+from ansys.edb.core.hierarchy import component_group
+from ansys.edb.core.hierarchy import group
+from ansys.edb.core.hierarchy import hierarchy_obj
+from ansys.edb.core.hierarchy import pin_pair_model
+from ansys.edb.core.hierarchy.component_group import ComponentGroup
+from ansys.edb.core.hierarchy.component_group import ComponentType
+from ansys.edb.core.hierarchy.group import Group
+from ansys.edb.core.hierarchy.hierarchy_obj import HierarchyObj
+from ansys.edb.core.hierarchy.pin_pair_model import PinPairModel
+from ansys.edb.core.inner import conn_obj
+from ansys.edb.core.inner.conn_obj import ConnObj
+from ansys.edb.core.layer import layer
+from ansys.edb.core.layer.layer import Layer
+from ansys.edb.core.layout import layout as layout_mod
+from ansys.edb.core.layout.layout import Layout
+from ansys.edb.core.net import net
+from ansys.edb.core.net.net import Net
+from ansys.edb.core.primitive import padstack_instance
+from ansys.edb.core.primitive.padstack_instance import PadstackInstance
+
+_NAMES = {
+    1: "U1",
+    2: "C1",
+    10: "ic_def",
+    20: "cap_def",
+    30: "top",
+    40: "gnd",
+    41: "vdd",
+    101: "A1",
+    102: "A2",
+    201: "1",
+    202: "2",
+}
+_MEMBERS = {1: [101, 102], 2: [201, 202]}
+_NETS = {101: 40, 102: 41, 201: 41, 202: 0}
+
+
+def _collection(ids):
+    return EDBObjCollectionMessage(items=[EDBObjMessage(id=i) for i in ids])
+
+
+def _position(request):
+    position = {"x": {"constant": {"real": request.id * 1e-3}}, "y": {"constant": {"real": 0.0}}}
+    return PadstackInstPositionAndRotationMessage(position=position, rotation={"constant": {"real": 0.0}})
+
+
+def test_components_table(mocker, mocked_stub, layout):
+    mocker.patch("ansys.edb.core.session.is_in_memory", return_value=True)
+    get_name = lambda request: StringValue(value=_NAMES[request.id])
+    mocked_stub(layout_mod, Layout).GetItems.return_value = _collection([1, 2])
+    group_stub = mocked_stub(group, Group)
+    group_stub.GetGroupType.return_value = GroupTypeMessage(group_type=GroupTypeMessage.GroupType.COMPONENT)
+    group_stub.GetMembers.side_effect = lambda request: _collection(_MEMBERS[request.id])
+    component_stub = mocked_stub(component_group, ComponentGroup)
+    component_stub.GetComponentType.side_effect = lambda request: ComponentTypeMessage(
+        comp_type=IC if request.id == 1 else CAPACITOR
+    )
+    component_stub.GetComponentProperty.return_value = EDBObjMessage(id=50)
+    hierarchy_stub = mocked_stub(hierarchy_obj, HierarchyObj)
+    hierarchy_stub.GetName.side_effect = get_name
+    hierarchy_stub.GetComponent.side_effect = lambda request: EDBObjMessage(id=request.id * 10)
+    hierarchy_stub.GetPlacementLayer.return_value = EDBObjMessage(id=30)
+    layer_stub = mocked_stub(layer, Layer)
+    layer_stub.GetLayerType.return_value = LayerTypeMessage(type=SIGNAL_LAYER)
+    layer_stub.IsViaLayer.return_value = BoolValue(value=False)
+    layer_stub.GetName.side_effect = get_name
+    conn_obj_stub = mocked_stub(conn_obj, ConnObj)
+    conn_obj_stub.GetObjType.return_value = LayoutObjTypeMessage(type=LayoutObjType.PADSTACK_INSTANCE.value)
+    conn_obj_stub.GetNet.side_effect = lambda request: EDBObjMessage(id=_NETS[request.id])
+    pin_stub = mocked_stub(padstack_instance, PadstackInstance)
+    pin_stub.GetName.side_effect = get_name
+    pin_stub.GetPositionAndRotation.side_effect = _position
+    mocked_stub(net, Net).GetName.side_effect = get_name
+    mocked_stub(component_def, ComponentDef).GetName.side_effect = get_name
+    mocked_stub(component_property, ComponentProperty).GetModel.return_value = ComponentPropModelMessage(
+        model=EDBObjMessage(id=60), model_type=PIN_PAIR_RLC_MODEL_TYPE
+    )
+    model_stub = mocked_stub(pin_pair_model, PinPairModel)
+    model_stub.GetPinPairs.return_value = StringPairsMessage(pairs=[{"first": "1", "second": "2"}])
+    model_stub.GetRlc.return_value = PinPairRlcMessage(
+        found=True, rlc={"c": {"text": "1uF"}, "c_enabled": {"value": True}}
+    )
+
+    table = layout.components_table()
+
+    assert table.names == ("U1", "C1")
+    assert table.definitions == ("ic_def", "cap_def")
+    assert table.types == (ComponentType.IC, ComponentType.CAPACITOR)
+    assert table.placement_layers == ("top", "top")
+    assert table.rlcs[0] is None
+    assert list(table.rlcs[1]) == [("1", "2")]
+    assert table.rlcs[1][("1", "2")].c_enabled
+    assert table.pin_names == (("A1", "A2"), ("1", "2"))
+    assert table.pin_positions[1] == ((0.201, 0.0), (0.202, 0.0))
+    assert table.pin_nets == (("gnd", "vdd"), ("vdd", ""))
+    assert layer_stub.GetLayerType.call_count == 1
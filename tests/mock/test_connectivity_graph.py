@@ -0,0 +1,76 @@
+from ansys.api.edb.v1.connectable_pb2 import LayoutObjTypeMessage
+from ansys.api.edb.v1.edb_messages_pb2 import EDBObjCollectionMessage
+from ansys.api.edb.v1.edb_messages_pb2 import EDBObjMessage
+from ansys.api.edb.v1.group_pb2 import GroupTypeMessage
+from google.protobuf.wrappers_pb2 import StringValue
+import pytest
+from utils.fixtures import *  # noqa
+
+from ansys.edb.core.edb_defs import LayoutObjType
+from ansys.edb.core.hierarchy import group
+from ansys.edb.core.hierarchy import hierarchy_obj
+from ansys.edb.core.hierarchy.group import Group
+from ansys.edb.core.hierarchy.hierarchy_obj import HierarchyObj
+from ansys.edb.core.inner import conn_obj
+from ansys.edb.core.inner.conn_obj import ConnObj
+from ansys.edb.core.layout import layout as layout_mod
+from ansys.edb.core.layout.connectivity_graph import GraphNodeType
+from ansys.edb.core.layout.layout import Layout
+from ansys.edb.core.net import net
+from ansys.edb.core.net.net import Net
+from ansys.edb.core.primitive.padstack_instance import PadstackInstance
+
+_ITEMS = {
+    LayoutObjType.NET: [1, 2],
+    LayoutObjType.GROUP: [10],
+    LayoutObjType.PADSTACK_INSTANCE: [100, 101, 102],
+    LayoutObjType.PRIMITIVE: [],
+}
+_NAMES = {1: "gnd", 2: "vdd", 10: "U1"}
+_NETS = {100: 1, 101: 2, 102: 1}
+
+
+@pytest.fixture
+def graph(mocker, mocked_stub, layout):
+    mocker.patch("ansys.edb.core.session.is_in_memory", return_value=True)
+    get_name = lambda request: StringValue(value=_NAMES[request.id])
+    mocked_stub(layout_mod, Layout).GetItems.side_effect = lambda request: EDBObjCollectionMessage(
+        items=[EDBObjMessage(id=i) for i in _ITEMS[LayoutObjType(request.type)]]
+    )
+    group_stub = mocked_stub(group, Group)
+    group_stub.GetGroupType.return_value = GroupTypeMessage(group_type=GroupTypeMessage.GroupType.COMPONENT)
+    group_stub.GetMembers.return_value = EDBObjCollectionMessage(items=[EDBObjMessage(id=i) for i in (100, 101)])
+    mocked_stub(hierarchy_obj, HierarchyObj).GetName.side_effect = get_name
+    conn_obj_stub = mocked_stub(conn_obj, ConnObj)
+    conn_obj_stub.GetObjType.return_value = LayoutObjTypeMessage(type=LayoutObjType.PADSTACK_INSTANCE.value)
+    conn_obj_stub.GetNet.side_effect = lambda request: EDBObjMessage(id=_NETS[request.id])
+    mocked_stub(net, Net).GetName.side_effect = get_name
+    return layout.connectivity_graph()
+
+
+def test_connectivity_graph_csr(graph):
+    assert len(graph) == 6
+    assert graph.net_index == {"gnd": 0, "vdd": 1}
+    assert graph.component_index == {"U1": 2}
+    assert list(graph.indptr) == [0, 2, 3, 5, 7, 9, 10]
+    assert list(graph.neighbors(0)) == [3, 5]
+    assert list(graph.neighbors(2)) == [3, 4]
+    assert list(graph.neighbors(5)) == [0]
+
+
+def test_connectivity_graph_nodes(graph):
+    assert graph.node_range(GraphNodeType.PADSTACK_INSTANCE) == range(3, 6)
+    assert graph.node_range(GraphNodeType.PRIMITIVE) == range(6, 6)
+    assert graph.node_type(2) == GraphNodeType.COMPONENT
+    assert isinstance(graph.node(4), PadstackInstance) and graph.node(4).id == 101
+    with pytest.raises(IndexError):
+        graph.node_type(6)
+
+
+def test_connected_nodes(graph):
+    vdd, gnd = graph.net_index["vdd"], graph.net_index["gnd"]
+    assert graph.connected_nodes(vdd) == {vdd, 2, 4}
+    assert graph.connected_nodes(gnd) == {gnd, 2, 3, 5}
+    assert graph.connected_nodes(graph.component_index["U1"]) == {0, 1, 2, 3, 4, 5}
+    assert graph.connected_nodes(vdd, cross_node_types=list(GraphNodeType)) == {0, 1, 2, 3, 4, 5}
+    assert graph.connected_nodes(vdd, cross_node_types=()) == {vdd, 4}
@@ -1,3 +1,5 @@
+from ansys.api.edb.v1.edb_messages_pb2 import EDBObjCollectionMessage
+from ansys.api.edb.v1.edb_messages_pb2 import EDBObjMessage
 from utils.fixtures import *  # noqa
 from utils.test_utils import create_edb_obj_collection_msg
 from utils.test_utils import equals
@@ -249,3 +251,33 @@ def test_find_by_id(random_int, edb_obj_msg, mocked_stub):
 
     assert isinstance(found_db, database.Database)
     assert equals(found_db.msg, edb_obj_msg)
+
+
+@pytest.mark.parametrize(
+    "method_name, unary_rpc_name, streaming_rpc_name",
+    [
+        ("iter_top_circuit_cells", "GetTopCircuits", "StreamTopCircuits"),
+        ("iter_circuit_cells", "GetCircuits", "StreamCircuits"),
+        ("iter_footprint_cells", "GetFootprints", "StreamFootprints"),
+    ],
+)
+def test_iter_cells(db_obj, mocked_stub, method_name, unary_rpc_name, streaming_rpc_name):
+    """Test for the Database.iter_*_cells() methods"""
+    streamed_chunks = []
+
+    def stream_cells(request):
+        for chunk_ids in ((1, 2), (3,)):
+            streamed_chunks.append(chunk_ids)
+            yield EDBObjCollectionMessage(items=[EDBObjMessage(id=i) for i in chunk_ids])
+
+    mock = mocked_stub(database, database.Database)
+    getattr(mock, streaming_rpc_name).side_effect = stream_cells
+
+    cells = getattr(db_obj, method_name)()
+
+    first = next(cells)
+    assert isinstance(first, Cell) and first.id == 1
+    assert streamed_chunks == [(1, 2)]
+    assert [cell.id for cell in cells] == [2, 3]
+    getattr(mock, streaming_rpc_name).assert_called_once_with(db_obj.msg)
+    getattr(mock, unary_rpc_name).assert_not_called()
@@ -0,0 +1,94 @@
+from ansys.api.edb.v1.edb_messages_pb2 import EDBObjMessage
+from ansys.api.edb.v1.layer_pb2 import SIGNAL_LAYER
+from ansys.api.edb.v1.layer_pb2 import LayerTypeMessage
+from ansys.api.edb.v1.primitive_pb2 import RECTANGLE
+from ansys.api.edb.v1.primitive_pb2 import PrimitiveTypeMessage
+from google.protobuf.wrappers_pb2 import BoolValue
+import pytest
+from utils.fixtures import *  # noqa
+
+from ansys.edb.core.inner import layout_obj
+from ansys.edb.core.layer import layer
+from ansys.edb.core.layer.stackup_layer import StackupLayer
+from ansys.edb.core.primitive import primitive
+from ansys.edb.core.primitive.primitive import Primitive
+from ansys.edb.core.primitive.rectangle import Rectangle
+from ansys.edb.core.session import _Session
+from ansys.edb.core.session import use_session
+from ansys.edb.core.utility.identity_map import enable_identity_map
+from ansys.edb.core.utility.identity_map import get_identity_map
+
+
+@pytest.fixture
+def primitive_stub(mocked_stub):
+    stub = mocked_stub(primitive, Primitive)
+    stub.GetPrimitiveType.return_value = PrimitiveTypeMessage(type=RECTANGLE)
+    return stub
+
+
+def test_cast_without_identity_map_creates_new_wrappers(primitive_stub):
+    first = Primitive(EDBObjMessage(id=1)).cast()
+    second = Primitive(EDBObjMessage(id=1)).cast()
+
+    assert isinstance(first, Rectangle)
+    assert first is not second
+    assert primitive_stub.GetPrimitiveType.call_count == 2
+
+
+def test_cast_reuses_wrapper_and_resolved_type(primitive_stub):
+    with enable_identity_map():
+        first = Primitive(EDBObjMessage(id=1)).cast()
+        second = Primitive(EDBObjMessage(id=1)).cast()
+        other = Primitive(EDBObjMessage(id=2)).cast()
+
+        assert isinstance(first, Rectangle)
+        assert first is second
+        assert first is not other
+        assert primitive_stub.GetPrimitiveType.call_count == 2
+    assert get_identity_map() is None
+
+
+def test_layer_cast_is_memoized(mocked_stub):
+    stub = mocked_stub(layer, layer.Layer)
+    stub.GetLayerType.return_value = LayerTypeMessage(type=SIGNAL_LAYER)
+    stub.IsViaLayer.return_value = BoolValue(value=False)
+
+    with enable_identity_map():
+        layers = [layer.Layer(EDBObjMessage(id=5)).cast() for _ in range(3)]
+
+    assert all(isinstance(lyr, StackupLayer) for lyr in layers)
+    assert layers[0] is layers[1] is layers[2]
+    assert stub.GetLayerType.call_count == 1
+
+
+def test_wrappers_are_weakly_referenced(primitive_stub):
+    with enable_identity_map():
+        Primitive(EDBObjMessage(id=1)).cast()
+
+        assert len(get_identity_map()) == 0
+
+
+def test_delete_invalidates_wrapper(mocked_stub, primitive_stub):
+    mocked_stub(layout_obj, layout_obj.LayoutObj)
+    with enable_identity_map():
+        rect = Primitive(EDBObjMessage(id=1)).cast()
+        rect.delete()
+
+        assert Primitive(EDBObjMessage(id=1)).cast() is not rect
+        assert primitive_stub.GetPrimitiveType.call_count == 2
+
+
+def test_disconnect_only_invalidates_wrappers_of_its_session(primitive_stub):
+    edb_session, other_session = (_Session("localhost", port, None, False, make_current=False) for port in (1, 2))
+    with enable_identity_map():
+        wrappers = {}
+        for session in (edb_session, other_session):
+            with use_session(session):
+                wrappers[session] = Primitive(EDBObjMessage(id=1)).cast()
+        assert wrappers[edb_session] is not wrappers[other_session]
+
+        with use_session(edb_session):
+            other_session.disconnect()
+            assert Primitive(EDBObjMessage(id=1)).cast() is wrappers[edb_session]
+        with use_session(other_session):
+            assert Primitive(EDBObjMessage(id=1)).cast() is not wrappers[other_session]
@@ -0,0 +1,308 @@
+from concurrent.futures import ThreadPoolExecutor
+import logging
+from threading import Barrier
+
+from ansys.api.edb.v1.edb_messages_pb2 import AnyModuleMessage
+from ansys.api.edb.v1.edb_messages_pb2 import EdbObjCacheEntryMessage
+from ansys.api.edb.v1.edb_messages_pb2 import EDBObjCollectionMessage
+from ansys.api.edb.v1.edb_messages_pb2 import EDBObjMessage
+from ansys.api.edb.v1.io_manager_pb2 import ResolvedFutureMessage
+from ansys.api.edb.v1.io_manager_pb2 import ResolvedFuturesMessage
+from ansys.api.edb.v1.padstack_instance_pb2 import PadstackInstCreateMessage
+from ansys.api.edb.v1.padstack_instance_pb2 import PadstackInstSetPositionAndRotationMessage
+from ansys.api.edb.v1.primitive_pb2 import SetLayerMessage
+from google.protobuf.any_pb2 import Any
+from google.protobuf.wrappers_pb2 import BoolValue
+import pytest
+from utils.fixtures import *  # noqa
+
+from ansys.edb.core.definition.padstack_def import PadstackDef
+from ansys.edb.core.inner import ObjBase
+from ansys.edb.core.inner.interceptors import IOInterceptor
+from ansys.edb.core.inner.utils import batch_get
+from ansys.edb.core.layout import layout as layout_mod
+from ansys.edb.core.layout.layout import Layout
+from ansys.edb.core.net.net import Net
+from ansys.edb.core.primitive.circle import Circle
+from ansys.edb.core.primitive.padstack_instance import PadstackInstance
+from ansys.edb.core.primitive.primitive import Primitive
+from ansys.edb.core.primitive.rectangle import Rectangle
+import ansys.edb.core.utility.io_manager as io_manager
+from ansys.edb.core.utility.rpc_stats import RpcStats
+
+_PRIMITIVE_SERVICE = "ansys.api.edb.v1.PrimitiveService"
+
+
+def _any_module_msg(msg, module):
+    any_msg = Any()
+    any_msg.Pack(msg)
+    return AnyModuleMessage(any=any_msg, module=module)
+
+
+def _cached_is_void_msg(edb_obj_id):
+    msg = EDBObjMessage(id=edb_obj_id)
+    msg.cache.cache.append(
+        EdbObjCacheEntryMessage(
+            request=_any_module_msg(EDBObjMessage(id=edb_obj_id), "edb_messages"),
+            response=_any_module_msg(BoolValue(value=edb_obj_id % 2 == 0), "wrappers"),
+            service_name=_PRIMITIVE_SERVICE,
+            rpc_method_name="IsVoid",
+        )
+    )
+    return msg
+
+
+@pytest.fixture
+def io_manager_stub(mocker):
+    """Fixture for patching the io manager stub with a mock server that responds to cache refresh requests.
+
+    Returns
+    -------
+    unittest.mock.Mock
+    """
+    mocker.patch("ansys.edb.core.session.is_in_memory", return_value=False)
+    mocker.patch.object(io_manager._IOManager, "_enable_caching")
+    stub = mocker.Mock()
+    stub.RefreshCache.side_effect = lambda request: EDBObjCollectionMessage(
+        items=[_cached_is_void_msg(item.id) for item in request.items]
+    )
+    mocker.patch("ansys.edb.core.utility.io_manager._get_io_manager_stub", return_value=stub)
+    return stub
+
+
+def _is_void_from_cache(edb_obj):
+    outcome = io_manager.get_cache().hijack_request(_PRIMITIVE_SERVICE, "IsVoid", EDBObjMessage(id=edb_obj.id))
+    return None if outcome is None else outcome.result().value
+
+
+def test_batch_get_uses_temporary_cache(io_manager_stub):
+    edb_objs = [ObjBase(EDBObjMessage(id=i)) for i in range(1, 11)]
+
+    results = batch_get(edb_objs, _is_void_from_cache)
+
+    io_manager_stub.RefreshCache.assert_called_once()
+    assert results == [i % 2 == 0 for i in range(1, 11)]
+    assert io_manager.get_cache() is None
+
+
+def test_prefetch_skips_null_duplicate_and_cached_objs(io_manager_stub):
+    with io_manager.enable_io_manager(io_manager.IOMangementType.READ):
+        io_manager.get_cache().add_from_cache_msg(_cached_is_void_msg(3))
+        edb_objs = [ObjBase(EDBObjMessage(id=i)) for i in (0, 1, 1, 2, 3)]
+
+        results = batch_get(edb_objs, _is_void_from_cache)
+
+        assert results == [None, False, False, True, False]
+        requested_ids = [item.id for item in io_manager_stub.RefreshCache.call_args.args[0].items]
+        assert requested_ids == [1, 2]
+        assert io_manager.get_cache() is not None
+
+
+def test_prefetch_is_chunked(mocker, io_manager_stub):
+    mocker.patch.object(io_manager, "_PREFETCH_CHUNK_SIZE", 20)
+    edb_objs = [ObjBase(EDBObjMessage(id=i)) for i in range(1, 21)]
+
+    results = batch_get(edb_objs, _is_void_from_cache)
+
+    assert io_manager_stub.RefreshCache.call_count > 1
+    requested_ids = [
+        item.id for call_args in io_manager_stub.RefreshCache.call_args_list for item in call_args.args[0].items
+    ]
+    assert requested_ids == list(range(1, 21))
+    assert results == [i % 2 == 0 for i in range(1, 21)]
+
+
+def test_batch_set_streams_requests_in_chunks(io_manager_stub):
+    streamed_chunks = []
+    io_manager_stub.FlushBufferNoFutureResolutionStream.side_effect = lambda chunks: streamed_chunks.extend(chunks)
+    primitives = [Primitive(EDBObjMessage(id=i)) for i in range(1, 5001)]
+
+    Primitive.set_layers(primitives, "signal_1")
+
+    io_manager_stub.FlushBufferNoFutureResolutionStream.assert_called_once()
+    assert len(streamed_chunks) > 1
+    entries = [entry for chunk in streamed_chunks for entry in chunk.buffer]
+    assert len(entries) == len(primitives)
+    for primitive, entry in zip(primitives, entries):
+        assert entry.service_name == _PRIMITIVE_SERVICE
+        assert entry.rpc_name == "SetLayer"
+        request = SetLayerMessage()
+        entry.request.Unpack(request)
+        assert request.target.id == primitive.id
+        assert request.layer.name.value == "signal_1"
+
+
+def test_batch_set_is_buffered_when_flushing_is_disabled(layout, io_manager_stub):
+    flushed_entries = []
+
+    def flush_buffer_stream(chunks):
+        chunks = list(chunks)
+        flushed_entries.extend((entry.rpc_name, entry.future_id) for chunk in chunks for entry in chunk.buffer)
+        return [_resolved_futures_response(chunk) for chunk in chunks]
+
+    io_manager_stub.FlushBufferStream.side_effect = flush_buffer_stream
+    mode = io_manager.IOMangementType.WRITE | io_manager.IOMangementType.NO_BUFFER_FLUSHING
+    with io_manager.enable_io_manager(mode):
+        circles = Circle.create_many(layout, "signal_1", None, [(0, 0), (1e-3, 0)], 1e-4)
+        Primitive.set_layers(circles, "signal_2")
+
+        io_manager_stub.FlushBufferNoFutureResolutionStream.assert_not_called()
+        io_manager_stub.FlushBufferStream.assert_not_called()
+    assert [rpc_name for rpc_name, _ in flushed_entries] == ["Create", "Create", "SetLayer", "SetLayer"]
+    assert all(circle.id > 1000 for circle in circles)
+
+
+def test_batch_set_requires_matching_lengths(io_manager_stub):
+    padstack_instances = [PadstackInstance(EDBObjMessage(id=i)) for i in range(1, 4)]
+
+    with pytest.raises(ValueError):
+        PadstackInstance.set_positions(padstack_instances, [0, 1, 2], [0, 1], [0, 0, 0])
+
+    io_manager_stub.FlushBufferNoFutureResolutionStream.assert_not_called()
+
+
+def _resolved_futures_response(chunk, failed_future_ids=()):
+    return ResolvedFuturesMessage(
+        resolved_futures=[
+            ResolvedFutureMessage(
+                future_id=entry.future_id,
+                edb_obj=EDBObjMessage(id=0 if entry.future_id in failed_future_ids else entry.future_id + 1000),
+            )
+            for entry in chunk.buffer
+        ]
+    )
+
+
+def test_create_many_resolves_created_objs(layout, io_manager_stub):
+    failed_future_ids = set()
+
+    def flush_buffer_stream(chunks):
+        chunks = list(chunks)
+        failed_future_ids.add(chunks[0].buffer[1].future_id)
+        return [_resolved_futures_response(chunk, failed_future_ids) for chunk in chunks]
+
+    io_manager_stub.FlushBufferStream.side_effect = flush_buffer_stream
+
+    rects = Rectangle.create_many(layout, "signal_1", "net_1", [(0, 0), (1e-3, 0), (2e-3, 0)], 1e-3, [1e-3, 2e-3, 3e-3])
+
+    io_manager_stub.FlushBufferStream.assert_called_once()
+    assert [isinstance(rect, Rectangle) for rect in rects] == [True] * 3
+    assert [rect.id == 0 for rect in rects] == [False, True, False]
+
+
+def test_create_many_adds_to_active_buffer(layout, io_manager_stub):
+    with io_manager.enable_io_manager(io_manager.IOMangementType.WRITE):
+        circles = Circle.create_many(layout, "signal_1", None, [(0, 0), (1e-3, 0)], 1e-4)
+
+        io_manager_stub.FlushBufferStream.assert_not_called()
+        assert all(circle._is_future for circle in circles)
+        io_manager_stub.FlushBufferStream.side_effect = lambda chunks: [
+            _resolved_futures_response(chunk) for chunk in chunks
+        ]
+    io_manager_stub.FlushBufferStream.assert_called_once()
+    assert [circle._is_future for circle in circles] == [False, False]
+    assert all(circle.id > 1000 for circle in circles)
+
+
+def test_padstack_instance_create_many_reports_failures(layout, io_manager_stub):
+    streamed_entries = []
+
+    def flush_buffer_stream(chunks):
+        chunks = list(chunks)
+        streamed_entries.extend(entry for chunk in chunks for entry in chunk.buffer)
+        failed_future_ids = {streamed_entries[0].future_id}
+        return [_resolved_futures_response(chunk, failed_future_ids) for chunk in chunks]
+
+    io_manager_stub.FlushBufferStream.side_effect = flush_buffer_stream
+    padstack_def = PadstackDef(EDBObjMessage(id=1))
+
+    padstack_instances = PadstackInstance.create_many(
+        layout, padstack_def, "top", "bottom", [(0, 0), (1e-3, 0), (2e-3, 0)], ["v0", "v1", "v2"], "gnd"
+    )
+
+    assert [entry.rpc_name for entry in streamed_entries] == ["Create", "SetPositionAndRotation"] * 3
+    for create_entry, set_position_entry in zip(streamed_entries[::2], streamed_entries[1::2]):
+        request = PadstackInstSetPositionAndRotationMessage()
+        set_position_entry.request.Unpack(request)
+        assert request.target.is_future
+        assert request.target.id == create_entry.future_id
+    assert [padstack_instance.is_null for padstack_instance in padstack_instances] == [True, False, False]
+
+
+def test_padstack_instance_create_many_broadcasts_single_name(layout, io_manager_stub):
+    streamed_entries = []
+
+    def flush_buffer_stream(chunks):
+        chunks = list(chunks)
+        streamed_entries.extend(entry for chunk in chunks for entry in chunk.buffer)
+        return [_resolved_futures_response(chunk) for chunk in chunks]
+
+    io_manager_stub.FlushBufferStream.side_effect = flush_buffer_stream
+
+    PadstackInstance.create_many(layout, PadstackDef(EDBObjMessage(id=1)), "top", "bottom", [(0, 0), (1e-3, 0)], "via")
+
+    create_requests = [PadstackInstCreateMessage() for _ in range(2)]
+    for request, entry in zip(create_requests, streamed_entries[::2]):
+        entry.request.Unpack(request)
+    assert [request.name for request in create_requests] == ["via", "via"]
+
+
+def test_iter_nets_is_lazy(mocked_stub, layout, io_manager_stub):
+    streamed_chunks = []
+
+    def stream_items(request):
+        for chunk_ids in ((1, 2), (3, 4)):
+            streamed_chunks.append(chunk_ids)
+            yield EDBObjCollectionMessage(items=[EDBObjMessage(id=i) for i in chunk_ids])
+
+    mock = mocked_stub(layout_mod, Layout)
+    mock.StreamItems.side_effect = stream_items
+
+    nets = layout.iter_nets()
+
+    assert streamed_chunks == []
+    first = next(nets)
+    assert isinstance(first, Net) and first.id == 1
+    assert streamed_chunks == [(1, 2)]
+    assert [net.id for net in nets] == [2, 3, 4]
+    assert streamed_chunks == [(1, 2), (3, 4)]
+    mock.GetItems.assert_not_called()
+
+
+def test_concurrent_reads_through_one_cache(io_manager_stub):
+    interceptor = IOInterceptor(logging.getLogger(), RpcStats())
+    barrier = Barrier(8)
+
+    def continuation(client_call_details, request):
+        barrier.wait(timeout=5)
+        return io_manager._HijackedOutcome(BoolValue(value=request.id % 2 == 0))
+
+    def is_void(edb_obj_id):
+        call_details = IOInterceptor._ClientCallDetails(f"/{_PRIMITIVE_SERVICE}/IsVoid", None, None, None)
+        return interceptor.intercept_unary_unary(continuation, call_details, EDBObjMessage(id=edb_obj_id))
+
+    with io_manager.enable_io_manager(io_manager.IOMangementType.READ):
+        with ThreadPoolExecutor(8) as executor:
+            results = list(executor.map(lambda i: is_void(i).result().value, range(8)))
+        cached_results = [_is_void_from_cache(ObjBase(EDBObjMessage(id=i))) for i in range(8)]
+
+    assert results == cached_results == [i % 2 == 0 for i in range(8)]
+    stats = interceptor._rpc_stats.snapshot()[f"/{_PRIMITIVE_SERVICE}/IsVoid"]
+    assert (stats.calls, stats.cache_hits) == (8, 0)
+
+
+def test_concurrent_batch_gets_share_temporary_cache(io_manager_stub):
+    edb_objs = [ObjBase(EDBObjMessage(id=i)) for i in range(1, 401)]
+
+    with ThreadPoolExecutor(4) as executor:
+        results = list(executor.map(lambda i: batch_get(edb_objs[i::4], _is_void_from_cache), range(4)))
+
+    assert results == [[edb_obj.id % 2 == 0 for edb_obj in edb_objs[i::4]] for i in range(4)]
+    assert io_manager.get_cache() is None
+
+
+def test_future_ids_are_unique_across_threads():
+    with ThreadPoolExecutor(4) as executor:
+        future_ids = list(executor.map(lambda _: io_manager._get_next_future_id(), range(1000)))
+
+    assert len(set(future_ids)) == len(future_ids)
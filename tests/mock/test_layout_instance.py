@@ -1,13 +1,26 @@
 from types import SimpleNamespace
 
+from ansys.api.edb.v1.edb_messages_pb2 import EDBObjCollectionMessage
 from ansys.api.edb.v1.edb_messages_pb2 import EDBObjMessage
+from ansys.api.edb.v1.layer_pb2 import SIGNAL_LAYER
+from ansys.api.edb.v1.layer_pb2 import LayerTypeMessage
+from ansys.api.edb.v1.layout_obj_instance_3d_geometry_pb2 import TesselationDataMessage
+from ansys.api.edb.v1.layout_obj_instance_pb2 import FetchedLayoutObjInstanceGeometriesMessage
+from google.protobuf.wrappers_pb2 import StringValue
 import pytest
 from utils.fixtures import *  # noqa
 
 from ansys.edb.core.geometry.point_data import PointData
 from ansys.edb.core.geometry.polygon_data import PolygonData
+from ansys.edb.core.layer import layer
+from ansys.edb.core.layer.layer import Layer
+from ansys.edb.core.layout_instance import layout_obj_instance
+from ansys.edb.core.layout_instance import layout_obj_instance_3d_geometry
 import ansys.edb.core.layout_instance.layout_instance as layout_instance_mod
 from ansys.edb.core.layout_instance.layout_obj_instance import LayoutObjInstance
+from ansys.edb.core.layout_instance.layout_obj_instance_2d_geometry import LayoutObjInstance2DGeometry
+from ansys.edb.core.layout_instance.layout_obj_instance_3d_geometry import LayoutObjInstance3DGeometry
+from ansys.edb.core.net.net import Net
 
 
 @pytest.fixture
@@ -125,3 +138,99 @@ def assert_loi_list(loi_list: list[LayoutObjInstance | list[LayoutObjInstance]],
             assert isinstance(loi_result, list)
             assert len(loi_result) == expected_length
             assert all(isinstance(loi, LayoutObjInstance) for loi in loi_result)
+
+
+_INSTANCE_LAYERS = {1: [10, 11], 2: [11]}
+
+
+def _geometries(request):
+    geometry_id = request.edb_obj.id * 100 + request.layer_ref.id.id
+    geometries = [{"type": 0, "geometry": {"geometry": {"id": geometry_id}}}]
+    if request.edb_obj.id == 2:
+        geometries.append({"type": 1, "geometry": {"geometry": {"id": geometry_id + 1}}})
+    return FetchedLayoutObjInstanceGeometriesMessage(geometries=geometries)
+
+
+@pytest.fixture
+def geometry_stubs(mocker, mocked_stub):
+    mocker.patch("ansys.edb.core.session.is_in_memory", return_value=True)
+    layer_stub = mocked_stub(layer, Layer)
+    layer_stub.GetLayerType.return_value = LayerTypeMessage(type=SIGNAL_LAYER)
+    layer_stub.GetName.side_effect = lambda request: StringValue(value=f"signal_{request.id - 9}")
+    stub = mocked_stub(layout_obj_instance, LayoutObjInstance)
+    stub.GetLayoutObj.side_effect = lambda request: EDBObjMessage(id=request.id + 1000)
+    stub.GetLayers.side_effect = lambda request: EDBObjCollectionMessage(
+        items=[EDBObjMessage(id=i) for i in _INSTANCE_LAYERS[request.id]]
+    )
+    stub.GetGeometries.side_effect = _geometries
+    mocker.patch.object(
+        LayoutObjInstance2DGeometry, "get_polygon_data", lambda self, apply_negatives=False: f"polygon_{self.id}"
+    )
+    mocker.patch.object(LayoutObjInstance3DGeometry, "tesselation_data", property(lambda self: f"mesh_{self.id}"))
+    return [LayoutObjInstance(EDBObjMessage(id=i)) for i in _INSTANCE_LAYERS]
+
+
+def test_fetch_geometries(geometry_stubs):
+    fetched = layout_instance_mod.LayoutInstance.fetch_geometries(geometry_stubs, chunk_size=1)
+
+    assert [(entry.instance.id, entry.layout_obj_id, entry.layer.id, entry.data) for entry in fetched] == [
+        (1, 1001, 10, "polygon_110"),
+        (1, 1001, 11, "polygon_111"),
+        (2, 1002, 11, "polygon_211"),
+        (2, 1002, 11, "mesh_212"),
+    ]
+
+
+def test_fetch_geometries_layer_filter(geometry_stubs):
+    fetched = layout_instance_mod.LayoutInstance.fetch_geometries(geometry_stubs, "signal_1", include_3d=False)
+
+    assert [(entry.layer.id, entry.data) for entry in fetched] == [(10, "polygon_110")]
+
+
+def test_net_stream_geometry(mocker, geometry_stubs, layout_instance):
+    query = mocker.patch.object(layout_instance_mod.LayoutInstance, "query_layout_obj_instances")
+    query.return_value = geometry_stubs
+    layout = mocker.Mock(layout_instance=layout_instance)
+    mocker.patch.object(Net, "layout", property(lambda self: layout))
+
+    geometries = Net(EDBObjMessage(id=5)).stream_geometry(layers="signal_2")
+
+    assert [(layer.id, obj_id, polygon) for layer, obj_id, polygon in geometries] == [
+        (11, 1001, "polygon_111"),
+        (11, 1002, "polygon_211"),
+    ]
+    assert query.call_args.kwargs["layer_filter"] == "signal_2"
+
+
+def _point(x, y, z):
+    return {"x": {"constant": {"real": x}}, "y": {"constant": {"real": y}}, "z": {"constant": {"real": z}}}
+
+
+@pytest.fixture
+def geometry_3d(mocked_stub):
+    points = [_point(0.0, 0.0, 0.0), _point(1.0, 0.0, 0.0), _point(0.0, 1.0, 0.0), _point(1.0, 1.0, 0.5)]
+    triangles = [
+        {"point_1": points[0], "point_2": points[1], "point_3": points[2]},
+        {"point_1": points[1], "point_2": points[3], "point_3": points[2]},
+    ]
+    stub = mocked_stub(layout_obj_instance_3d_geometry, LayoutObjInstance3DGeometry)
+    stub.GetTesselationData.return_value = TesselationDataMessage(tesselation_data=triangles)
+    return LayoutObjInstance3DGeometry(EDBObjMessage(id=1), EDBObjMessage(id=2), EDBObjMessage(id=3))
+
+
+def test_tesselation_buffers(geometry_3d):
+    assert list(geometry_3d._tesselation_buffers()) == [0, 0, 0, 1, 0, 0, 0, 1, 0, 1, 0, 0, 1, 1, 0.5, 0, 1, 0]
+    vertices, indices = geometry_3d._tesselation_buffers(indexed=True)
+    assert list(vertices) == [0, 0, 0, 1, 0, 0, 0, 1, 0, 1, 1, 0.5]
+    assert list(indices) == [0, 1, 2, 1, 3, 2]
+
+
+def test_tesselation_arrays(geometry_3d):
+    np = pytest.importorskip("numpy")
+
+    triangles = geometry_3d.tesselation_arrays()
+    vertices, indices = geometry_3d.tesselation_arrays(indexed=True)
+
+    assert triangles.shape == (2, 3, 3) and triangles.dtype == np.float64
+    assert vertices.shape == (4, 3) and indices.tolist() == [[0, 1, 2], [1, 3, 2]]
+    assert (vertices[indices] == triangles).all()
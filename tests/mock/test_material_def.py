@@ -0,0 +1,127 @@
+from ansys.api.edb.v1.edb_messages_pb2 import EDBObjCollectionMessage
+from ansys.api.edb.v1.edb_messages_pb2 import EDBObjMessage
+from ansys.api.edb.v1.edb_messages_pb2 import ValueMessage
+import ansys.api.edb.v1.material_def_pb2 as pb
+from ansys.api.edb.v1.material_property_thermal_modifier_pb2 import MaterialPropertyThermalModifierParamsMessage
+from google.protobuf.wrappers_pb2 import StringValue
+import pytest
+from utils.fixtures import *  # noqa
+
+from ansys.edb.core import database
+from ansys.edb.core.database import Database
+from ansys.edb.core.definition import material_def
+from ansys.edb.core.definition import material_property_thermal_modifier
+from ansys.edb.core.definition.material_def import MaterialDef
+from ansys.edb.core.definition.material_def import MaterialProperty
+from ansys.edb.core.definition.material_property_thermal_modifier import MaterialPropertyThermalModifier
+
+_THERMAL_MODIFIER_PARAMS = {
+    "temp_ref": "22cel",
+    "c1": "0.0039",
+    "c2": "0",
+    "temp_lower_limit": "-273.15cel",
+    "temp_upper_limit": "1000cel",
+    "lower_const_therm_mod": "1",
+    "upper_const_therm_mod": "1",
+    "auto_calc_constant_thermal_modifier": True,
+}
+
+_RECORDS = [
+    {
+        "name": "copper",
+        "properties": {"conductivity": "58000000"},
+        "thermal_modifiers": {"conductivity": _THERMAL_MODIFIER_PARAMS},
+    },
+    {
+        "name": "laminate",
+        "properties": {"permittivity": ["4.4", "4.4", "3.8"]},
+        "thermal_modifiers": {"permittivity": [_THERMAL_MODIFIER_PARAMS, None, None]},
+    },
+]
+
+
+@pytest.fixture
+def in_memory(mocker):
+    mocker.patch("ansys.edb.core.session.is_in_memory", return_value=True)
+
+
+@pytest.fixture
+def material_stub(mocked_stub):
+    """Mock a server holding the materials described by ``_RECORDS``."""
+    stub = mocked_stub(material_def, MaterialDef)
+    materials = {1: _RECORDS[0], 2: _RECORDS[1]}
+
+    def property_values(request):
+        return materials[request.materialDef.id]["properties"][MaterialProperty(request.propertyId).name.lower()]
+
+    def get_property(request):
+        values = property_values(request)
+        return ValueMessage(text=values if isinstance(values, str) else values[request.component.id])
+
+    def get_dimensions(request):
+        return pb.MaterialDefGetDimensionMessage(
+            tensor=pb.TensorPositionMessage(col=1, row=1 if isinstance(property_values(request), str) else 3)
+        )
+
+    stub.GetName.side_effect = lambda request: StringValue(value=materials[request.id]["name"])
+    stub.GetAllProperties.side_effect = lambda request: pb.MaterialDefGetAllPropertiesMessage(
+        properties=[MaterialProperty[key.upper()].value for key in materials[request.id]["properties"]]
+    )
+    stub.GetProperty.side_effect = get_property
+    stub.GetDimensions.side_effect = get_dimensions
+    stub.GetThermalModifier.return_value = EDBObjMessage(id=50)
+    stub.GetAnisotropicThermalModifier.side_effect = lambda request: EDBObjMessage(
+        id=51 if request.component == 0 else 0
+    )
+    return stub
+
+
+@pytest.fixture
+def thermal_modifier_stub(mocked_stub):
+    stub = mocked_stub(material_property_thermal_modifier, MaterialPropertyThermalModifier)
+    params = {
+        field: ValueMessage(text=value) if isinstance(value, str) else value
+        for field, value in _THERMAL_MODIFIER_PARAMS.items()
+    }
+    stub.GetQuadraticModelParams.return_value = MaterialPropertyThermalModifierParamsMessage(**params)
+    stub.Create.side_effect = lambda request: EDBObjMessage(id=60)
+    return stub
+
+
+def test_export_materials(mocked_stub, in_memory, material_stub, thermal_modifier_stub):
+    mocked_stub(database, Database).GetDefinitionObjs.return_value = EDBObjCollectionMessage(
+        items=[EDBObjMessage(id=1), EDBObjMessage(id=2)]
+    )
+
+    records = Database(EDBObjMessage(id=10)).export_materials()
+
+    assert records == _RECORDS
+    assert thermal_modifier_stub.GetQuadraticModelParams.call_count == 2
+
+
+def test_apply_materials_creates_missing_and_updates_existing(
+    mocked_stub, in_memory, material_stub, thermal_modifier_stub
+):
+    mocked_stub(database, Database).GetDefinitionObjs.return_value = EDBObjCollectionMessage(
+        items=[EDBObjMessage(id=1)]
+    )
+    material_stub.Create.return_value = EDBObjMessage(id=3)
+
+    material_defs = Database(EDBObjMessage(id=10)).apply_materials(_RECORDS)
+
+    assert [material_def.id for material_def in material_defs] == [1, 3]
+    material_stub.Create.assert_called_once()
+    assert material_stub.Create.call_args.args[0].name == "laminate"
+    set_requests = [call.args[0] for call in material_stub.SetProperty.call_args_list]
+    assert [(request.materialDef.id, request.value.text) for request in set_requests] == [
+        (1, "58000000"),
+        (3, "4.4"),
+        (3, "4.4"),
+        (3, "3.8"),
+    ]
+    assert [request.component.id for request in set_requests[1:]] == [0, 1, 2]
+    create_request = thermal_modifier_stub.Create.call_args.args[0]
+    assert create_request.c1.text == "0.0039"
+    assert create_request.auto_calc_constant_thermal_modifier
+    material_stub.SetThermalModifier.assert_called_once()
+    assert material_stub.SetAnisotropicThermalModifier.call_args.args[0].component == 0
@@ -0,0 +1,70 @@
+import os
+from pathlib import Path
+import sys
+
+import pytest
+
+from ansys.edb.core.session import launch_session
+from ansys.edb.core.utility.parallel_runner import process_databases
+from ansys.edb.core.utility.stand_in_server import create_stand_in_root
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="The stand-in server requires Unix domain sockets.")
+
+
+def _worker_pid(db):
+    return os.getpid()
+
+
+def _crash_once(db):
+    marker = Path("crashed")
+    if not marker.exists():
+        marker.touch()
+        os._exit(3)
+    return "recovered"
+
+
+def _fail(db):
+    raise ValueError("bad board")
+
+
+@pytest.fixture
+def stand_in_root(tmp_path, monkeypatch):
+    monkeypatch.setenv("AnsysEM_UDS", str(tmp_path / "uds"))
+    monkeypatch.chdir(tmp_path)
+    for name in ("board_1", "board_2", "board_3"):
+        (tmp_path / name).mkdir()
+    return create_stand_in_root(str(tmp_path))
+
+
+def test_process_databases(stand_in_root):
+    results = list(process_databases(["board_1", "board_2", "board_3"], _worker_pid, stand_in_root, max_workers=2))
+
+    assert sorted(result.db_path for result in results) == ["board_1", "board_2", "board_3"]
+    assert all(result.error is None and result.attempts == 1 for result in results)
+    assert len({result.value for result in results}) <= 2
+
+
+def test_process_databases_retries_after_crash(stand_in_root):
+    (result,) = process_databases(["board_1"], _crash_once, stand_in_root)
+
+    assert (result.value, result.error, result.attempts) == ("recovered", None, 2)
+
+
+def test_process_databases_reports_failures(stand_in_root):
+    results = list(process_databases(["board_1", "missing"], _fail, stand_in_root, max_attempts=3))
+
+    assert sorted((result.db_path, result.attempts) for result in results) == [("board_1", 3), ("missing", 3)]
+    errors = {result.db_path: result.error for result in results}
+    assert "bad board" in errors["board_1"] and "does not exist" in errors["missing"]
+
+
+def test_process_databases_while_parent_has_session(stand_in_root):
+    edb_session = launch_session(stand_in_root)
+    try:
+        (result,) = process_databases(["board_1"], _worker_pid, stand_in_root, max_attempts=1)
+        assert edb_session.local_server_proc.poll() is None
+    finally:
+        edb_session.disconnect()
+
+    assert (result.error, result.attempts) == (None, 1)
+    assert result.value != os.getpid()
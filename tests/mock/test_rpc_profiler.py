@@ -0,0 +1,87 @@
+import logging
+import sys
+
+from ansys.api.edb.v1 import net_pb2_grpc
+from ansys.api.edb.v1.edb_messages_pb2 import EDBObjMessage
+from google.protobuf.wrappers_pb2 import StringValue
+import pytest
+from utils.fixtures import *  # noqa
+
+from ansys.edb.core.inner.interceptors import IOInterceptor
+from ansys.edb.core.inner.interceptors import ProfilingInterceptor
+from ansys.edb.core.net.net import Net
+from ansys.edb.core.session import use_session
+from ansys.edb.core.utility.rpc_profiler import profile_rpcs
+
+_GET_NAME = "/ansys.api.edb.v1.NetService/GetName"
+
+
+class _NetService(net_pb2_grpc.NetServiceServicer):
+    def GetName(self, request, context):
+        return StringValue(value=f"net_{request.id}")
+
+
+@pytest.fixture
+def edb_session(server_session):
+    edb_session = server_session((net_pb2_grpc.add_NetServiceServicer_to_server, _NetService()))
+    with use_session(edb_session):
+        yield edb_session
+
+
+def _net_names(nets):
+    for net in nets:
+        yield net.name
+
+
+def test_rpcs_are_attributed_to_call_sites(edb_session):
+    nets = [Net(EDBObjMessage(id=i)) for i in range(1, 4)]
+
+    with profile_rpcs() as profiler:
+        line_number = sys._getframe().f_lineno + 1
+        names = [net.name for net in nets]
+        list(_net_names(nets[:1]))
+
+    assert names == ["net_1", "net_2", "net_3"]
+    call_sites = {(call_site.call_site, call_site.method): call_site.calls for call_site in profiler.call_sites()}
+    assert call_sites[(f"{__file__}:{line_number}", _GET_NAME)] == 3
+    helper_line_number = _net_names.__code__.co_firstlineno + 2
+    assert call_sites[(f"{__file__}:{helper_line_number}", _GET_NAME)] == 1
+    assert edb_session.rpc_profiler is None
+
+
+def test_collapsed_stacks(edb_session, tmp_path):
+    with profile_rpcs(edb_session) as profiler:
+        list(_net_names([Net(EDBObjMessage(id=1))] * 2))
+
+    lines = profiler.collapsed_stacks(weight="calls").splitlines()
+    assert len(lines) == 1
+    stack, calls = lines[0].rsplit(" ", 1)
+    frames = stack.split(";")
+    assert calls == "2"
+    assert frames[-3:] == [
+        f"_net_names (test_rpc_profiler.py:{_net_names.__code__.co_firstlineno + 2})",
+        "ansys.edb.core.net.net.name",
+        _GET_NAME.strip("/"),
+    ]
+    assert frames[-4].startswith("test_collapsed_stacks (test_rpc_profiler.py:")
+    profiler.export_collapsed_stacks(tmp_path / "rpcs.folded")
+    assert (tmp_path / "rpcs.folded").read_text().startswith(stack)
+    with pytest.raises(ValueError):
+        profiler.collapsed_stacks(weight="bytes")
+
+
+def test_stream_latency_excludes_caller_time(mocker):
+    clock = mocker.patch("ansys.edb.core.inner.interceptors.perf_counter", return_value=0.0)
+    profiler = mocker.Mock()
+    interceptor = ProfilingInterceptor(logging.getLogger(), lambda: profiler)
+
+    def responses(client_call_details, request):
+        for i in range(3):
+            clock.return_value += 1.0
+            yield EDBObjMessage(id=i)
+
+    call_details = IOInterceptor._ClientCallDetails("/ansys.api.edb.v1.LayoutService/StreamItems", None, None, None)
+    for _ in interceptor.intercept_unary_stream(responses, call_details, EDBObjMessage()):
+        clock.return_value += 10.0
+
+    profiler.record.assert_called_once_with(profiler.capture.return_value, 3.0)
@@ -0,0 +1,125 @@
+from ansys.api.edb.v1 import io_manager_pb2_grpc
+from ansys.api.edb.v1 import layout_pb2_grpc
+from ansys.api.edb.v1 import net_pb2_grpc
+from ansys.api.edb.v1.edb_messages_pb2 import EDBObjCollectionMessage
+from ansys.api.edb.v1.edb_messages_pb2 import EDBObjMessage
+from ansys.api.edb.v1.io_manager_pb2 import ResolvedFutureMessage
+from ansys.api.edb.v1.io_manager_pb2 import ResolvedFuturesMessage
+from ansys.api.edb.v1.layout_obj_pb2 import LayoutObjTargetMessage
+from google.protobuf.wrappers_pb2 import StringValue
+import grpc
+import pytest
+from utils.fixtures import *  # noqa
+
+from ansys.edb.core.inner.exceptions import InvalidArgumentException
+from ansys.edb.core.layout.layout import Layout
+from ansys.edb.core.net.net import Net
+from ansys.edb.core.session import MOD
+from ansys.edb.core.session import use_session
+from ansys.edb.core.utility.io_manager import IOMangementType
+from ansys.edb.core.utility.io_manager import enable_io_manager
+from ansys.edb.core.utility.rpc_recording import read_recording
+from ansys.edb.core.utility.rpc_recording import record_rpcs
+from ansys.edb.core.utility.rpc_recording import replay_session
+
+
+class _NetService(net_pb2_grpc.NetServiceServicer):
+    def GetName(self, request, context):
+        if request.id == 99:
+            context.abort(grpc.StatusCode.INVALID_ARGUMENT, "Invalid net.")
+        return StringValue(value=f"net_{request.id}")
+
+
+class _LayoutService(layout_pb2_grpc.LayoutServiceServicer):
+    def StreamItems(self, request, context):
+        for i in (1, 2):
+            yield EDBObjCollectionMessage(items=[EDBObjMessage(id=request.target.id + i)])
+
+
+class _IOManagerService(io_manager_pb2_grpc.IOManagerServiceServicer):
+    def FlushBufferStream(self, request_iterator, context):
+        for chunk in request_iterator:
+            yield ResolvedFuturesMessage(
+                resolved_futures=[
+                    ResolvedFutureMessage(future_id=entry.future_id, edb_obj=EDBObjMessage(id=entry.future_id + 100))
+                    for entry in chunk.buffer
+                ]
+            )
+
+
+@pytest.fixture
+def recording(server_session, tmp_path):
+    edb_session = server_session(
+        (net_pb2_grpc.add_NetServiceServicer_to_server, _NetService()),
+        (layout_pb2_grpc.add_LayoutServiceServicer_to_server, _LayoutService()),
+        (io_manager_pb2_grpc.add_IOManagerServiceServicer_to_server, _IOManagerService()),
+    )
+    with use_session(edb_session):
+        yield edb_session, tmp_path / "session.edbrpc"
+
+
+def _run_script(edb_session):
+    names = [Net(EDBObjMessage(id=i)).name for i in (1, 2, 1)]
+    with pytest.raises(InvalidArgumentException) as error:
+        Net(EDBObjMessage(id=99)).name
+    request = LayoutObjTargetMessage(target=EDBObjMessage(id=10))
+    items = [msg.items[0].id for msg in edb_session.stub("layout").StreamItems(request)]
+    return names, str(error.value), items
+
+
+def test_record_and_replay(recording):
+    edb_session, file_path = recording
+    with record_rpcs(file_path):
+        recorded_results = _run_script(edb_session)
+    assert edb_session.rpc_recorder is None
+    _run_script(edb_session)
+
+    recorded_rpcs = list(read_recording(file_path))
+    assert [recorded_rpc.method for recorded_rpc in recorded_rpcs] == ["/ansys.api.edb.v1.NetService/GetName"] * 4 + [
+        "/ansys.api.edb.v1.LayoutService/StreamItems"
+    ]
+    assert (recorded_rpcs[3].code, recorded_rpcs[3].details) == (
+        grpc.StatusCode.INVALID_ARGUMENT.value[0],
+        "Invalid net.",
+    )
+    assert len(recorded_rpcs[4].responses) == 2
+
+    replayed_session = replay_session(file_path, make_current=False)
+    try:
+        with use_session(replayed_session):
+            assert _run_script(replayed_session) == recorded_results
+            with pytest.raises(grpc.RpcError) as error:
+                Net(EDBObjMessage(id=3)).name
+    finally:
+        replayed_session.disconnect()
+    assert recorded_results == (["net_1", "net_2", "net_1"], "Invalid net.", [11, 12])
+    assert error.value.code() == grpc.StatusCode.NOT_FOUND
+
+
+def test_replay_session_is_current(recording):
+    edb_session, file_path = recording
+    with record_rpcs(file_path, edb_session):
+        Net(EDBObjMessage(id=1)).name
+
+    with replay_session(file_path, simulate_latency=True) as replayed_session:
+        assert MOD.current_session is replayed_session
+        with use_session(replayed_session):
+            assert Net(EDBObjMessage(id=1)).name == "net_1"
+    assert MOD.current_session is None
+
+
+def _create_nets():
+    with enable_io_manager(IOMangementType.WRITE):
+        nets = [Net.create(Layout(EDBObjMessage(id=1)), f"net_{i}") for i in range(2)]
+    return [(net.id, net.name) for net in nets]
+
+
+def test_replay_buffered_creations(recording):
+    edb_session, file_path = recording
+    _create_nets()
+    with record_rpcs(file_path):
+        recorded_nets = _create_nets()
+
+    with replay_session(file_path) as replayed_session, use_session(replayed_session):
+        assert _create_nets() == recorded_nets
+    assert recorded_nets == [(101, "net_101"), (102, "net_102")]
@@ -0,0 +1,127 @@
+import json
+import logging
+
+from ansys.api.edb.v1.edb_messages_pb2 import EDBObjCollectionMessage
+from ansys.api.edb.v1.edb_messages_pb2 import EDBObjMessage
+from ansys.api.edb.v1.primitive_pb2 import SetLayerMessage
+from google.protobuf.wrappers_pb2 import BoolValue
+import pytest
+
+from ansys.edb.core.inner.interceptors import IOInterceptor
+from ansys.edb.core.inner.interceptors import SharedMemoryInterceptor
+from ansys.edb.core.session import _Session
+import ansys.edb.core.utility.io_manager as io_manager
+from ansys.edb.core.utility.rpc_stats import RpcStats
+
+_IS_VOID = "/ansys.api.edb.v1.PrimitiveService/IsVoid"
+_SET_LAYER = "/ansys.api.edb.v1.PrimitiveService/SetLayer"
+_STREAM_ITEMS = "/ansys.api.edb.v1.LayoutService/StreamItems"
+
+
+class _Future:
+    def __init__(self, response):
+        self._response = response
+
+    def result(self):
+        return self._response
+
+
+def _call_details(method):
+    return IOInterceptor._ClientCallDetails(method, None, None, None)
+
+
+@pytest.fixture
+def interceptor(mocker):
+    mocker.patch("ansys.edb.core.session.is_in_memory", return_value=False)
+    mocker.patch.object(io_manager._IOManager, "_enable_caching")
+    mocker.patch("ansys.edb.core.utility.io_manager._get_io_manager_stub")
+    return IOInterceptor(logging.getLogger(), RpcStats())
+
+
+def test_rpc_stats_percentiles_and_export(tmp_path):
+    rpc_stats = RpcStats()
+    for i in range(1, 101):
+        rpc_stats.record_call("/Service/Slow", i / 1000, 10, 20)
+    rpc_stats.record_call("/Service/Fast", 0.5, 1, 2)
+    rpc_stats.record_cache_hit("/Service/Fast")
+
+    stats = rpc_stats.snapshot()
+
+    assert list(stats) == ["/Service/Slow", "/Service/Fast"]
+    slow = stats["/Service/Slow"]
+    assert (slow.calls, slow.request_bytes, slow.response_bytes) == (100, 1000, 2000)
+    assert (slow.p50, slow.p95, slow.p99) == (0.05, 0.095, 0.099)
+    assert stats["/Service/Fast"].cache_hits == 1
+    rpc_stats.export(tmp_path / "stats.json")
+    assert json.loads((tmp_path / "stats.json").read_text())["/Service/Fast"]["p99"] == 0.5
+    rpc_stats.reset()
+    assert rpc_stats.snapshot() == {}
+
+
+def test_io_interceptor_records_calls_and_cache_hits(interceptor):
+    request = EDBObjMessage(id=1)
+    continuation = lambda client_call_details, request: _Future(BoolValue(value=True))
+
+    with io_manager.enable_io_manager(io_manager.IOMangementType.READ):
+        for _ in range(3):
+            interceptor.intercept_unary_unary(continuation, _call_details(_IS_VOID), request)
+
+    stats = interceptor._rpc_stats.snapshot()[_IS_VOID]
+    assert (stats.calls, stats.cache_hits, stats.buffered) == (1, 2, 0)
+    assert (stats.request_bytes, stats.response_bytes) == (request.ByteSize(), BoolValue(value=True).ByteSize())
+
+
+def test_io_interceptor_records_buffered_requests(mocker, interceptor):
+    continuation = mocker.Mock()
+
+    with io_manager.enable_io_manager(io_manager.IOMangementType.WRITE):
+        interceptor.intercept_unary_unary(continuation, _call_details(_SET_LAYER), SetLayerMessage())
+
+    continuation.assert_not_called()
+    assert interceptor._rpc_stats.snapshot()[_SET_LAYER].buffered == 1
+
+
+def test_io_interceptor_records_streams(interceptor):
+    responses = [EDBObjCollectionMessage(items=[EDBObjMessage(id=i)]) for i in range(3)]
+    continuation = lambda client_call_details, request: iter(responses)
+
+    assert list(interceptor.intercept_unary_stream(continuation, _call_details(_STREAM_ITEMS), EDBObjMessage())) == (
+        responses
+    )
+
+    stats = interceptor._rpc_stats.snapshot()[_STREAM_ITEMS]
+    assert (stats.calls, stats.response_bytes) == (1, sum(response.ByteSize() for response in responses))
+
+
+def test_io_interceptor_stream_latency_excludes_caller_time(mocker, interceptor):
+    clock = mocker.patch("ansys.edb.core.inner.interceptors.perf_counter", return_value=0.0)
+
+    def responses():
+        for i in range(3):
+            clock.return_value += 1.0
+            yield EDBObjCollectionMessage(items=[EDBObjMessage(id=i)])
+
+    continuation = lambda client_call_details, request: responses()
+    for _ in interceptor.intercept_unary_stream(continuation, _call_details(_STREAM_ITEMS), EDBObjMessage()):
+        clock.return_value += 10.0
+
+    assert interceptor._rpc_stats.snapshot()[_STREAM_ITEMS].total_time == 3.0
+
+
+def test_shared_memory_interceptor_records_calls(mocker):
+    transport = mocker.Mock()
+    transport.execute_rpc.return_value = (True, BoolValue(value=True).SerializeToString(), "")
+    interceptor = SharedMemoryInterceptor(logging.getLogger(), transport, RpcStats())
+
+    response = interceptor.intercept_unary_unary(None, _call_details(_IS_VOID), EDBObjMessage(id=1))
+
+    assert response.result().value
+    stats = interceptor._rpc_stats.snapshot()[_IS_VOID]
+    assert (stats.calls, stats.request_bytes, stats.response_bytes) == (1, 2, 2)
+
+
+def test_session_stats():
+    assert _Session("localhost", 50051, None, False, make_current=False).stats() == {}
+    edb_session = _Session("localhost", 50051, None, True, make_current=False)
+    edb_session.rpc_stats.record_call(_IS_VOID, 0.1, 2, 2)
+    assert edb_session.stats()[_IS_VOID].calls == 1
@@ -0,0 +1,104 @@
+from concurrent.futures import ThreadPoolExecutor
+import subprocess
+import sys
+
+from ansys.edb.core import session
+from ansys.edb.core.session import StubAccessor
+from ansys.edb.core.session import StubType
+from ansys.edb.core.session import _Session
+from ansys.edb.core.session import get_current_session
+from ansys.edb.core.session import use_session
+from ansys.edb.core.utility.identity_map import enable_identity_map
+from ansys.edb.core.utility.identity_map import get_identity_map
+from ansys.edb.core.utility.io_manager import get_io_manager
+
+
+def test_import_does_not_load_service_modules():
+    code = "import sys, ansys.edb.core.session; print(sum(m.endswith('_pb2_grpc') for m in sys.modules))"
+
+    loaded = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+
+    assert int(loaded) == 0
+
+
+def test_shared_memory_call_only_loads_messages_of_its_service():
+    code = """
+import logging, sys
+import grpc
+from ansys.api.edb.v1.edb_messages_pb2 import EDBObjMessage
+from ansys.edb.core.inner.interceptors import SharedMemoryInterceptor
+from ansys.edb.core.session import StubType
+
+class Transport:
+    def execute_rpc(self, service_name, rpc_name, request):
+        return True, b"", ""
+
+interceptor = SharedMemoryInterceptor(logging.getLogger(), Transport())
+stub = StubType.net.stub_class(grpc.intercept_channel(grpc.insecure_channel("localhost:0"), interceptor))
+loaded = set(sys.modules)
+stub.GetName(EDBObjMessage(id=1))
+print(" ".join(sorted(m for m in set(sys.modules) - loaded if m.endswith("_pb2"))))
+"""
+
+    loaded = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+
+    assert loaded.split() == ["ansys.api.edb.v1.net_pb2"]
+
+
+def _connected_session(mocker, port_num=50051, make_current=True):
+    edb_session = _Session("localhost", port_num, None, False, make_current=make_current)
+    edb_session.channel = mocker.Mock()
+    edb_session._initialize_stubs()
+    return edb_session
+
+
+def test_stubs_are_created_on_first_use(mocker):
+    edb_session = _connected_session(mocker)
+
+    cell_stub = edb_session.stub(StubType.cell.name)
+
+    assert isinstance(cell_stub, StubType.cell.stub_class)
+    assert edb_session.stub(StubType.cell.name) is cell_stub
+    assert list(edb_session.stubs) == [StubType.cell.name]
+
+
+def test_stub_classes_are_importable_from_session():
+    assert session.LayoutServiceStub is StubType.layout.stub_class
+
+
+def test_sessions_are_bound_per_thread(mocker):
+    mocker.patch.object(session.MOD, "current_session", _connected_session(mocker))
+    edb_sessions = [_connected_session(mocker, 50052 + i, make_current=False) for i in range(4)]
+
+    def run(edb_session):
+        with use_session(edb_session), enable_identity_map():
+            return get_current_session(), StubAccessor(StubType.cell).__get__(), get_io_manager(), get_identity_map()
+
+    with ThreadPoolExecutor(len(edb_sessions)) as executor:
+        results = list(executor.map(run, edb_sessions))
+
+    for edb_session, (current_session, cell_stub, io_manager, identity_map) in zip(edb_sessions, results):
+        assert current_session is edb_session and cell_stub is edb_session.stub(StubType.cell.name)
+        assert io_manager is edb_session.io_manager
+    assert len({id(result[3]) for result in results}) == len(edb_sessions)
+    assert get_current_session() is session.MOD.current_session and get_identity_map() is None
+
+
+def test_concurrent_sessions_get_distinct_ports():
+    with ThreadPoolExecutor(8) as executor:
+        ports = list(executor.map(lambda _: session._find_available_port(), range(8)))
+    try:
+        assert len(set(ports)) == len(ports)
+    finally:
+        for port in ports:
+            session._release_port(port)
+    assert not set(ports) & session._reserved_ports
+
+
+def test_shared_memory_names_are_unique_per_session():
+    edb_sessions = [
+        _Session("localhost", port, "ansys_em_root", False, use_shared_memory_ipc=True, make_current=False)
+        for port in (50051, 50052)
+    ]
+
+    assert edb_sessions[0]._shm_name != edb_sessions[1]._shm_name
@@ -0,0 +1,203 @@
+from enum import Enum
+import importlib
+import inspect
+import json
+import pkgutil
+import re
+from typing import get_type_hints
+
+from ansys.api.edb.v1.edb_messages_pb2 import EDBObjMessage
+from ansys.api.edb.v1.simulation_setup_pb2 import SimulationSetupTypeMessage
+from ansys.api.edb.v1.simulation_setup_pb2 import SweepDataListMessage
+from google.protobuf.wrappers_pb2 import StringValue
+import pytest
+from utils.fixtures import *  # noqa
+
+from ansys.edb.core import simulation_setup as simulation_setup_pkg
+from ansys.edb.core.layout.cell import Cell
+from ansys.edb.core.simulation_setup import simulation_settings
+from ansys.edb.core.simulation_setup import simulation_setup
+from ansys.edb.core.simulation_setup.adaptive_solutions import BroadbandAdaptiveSolution
+from ansys.edb.core.simulation_setup.hfss_simulation_settings import SolverType
+from ansys.edb.core.simulation_setup.raptor_x_simulation_setup import RaptorXSimulationSetup
+from ansys.edb.core.simulation_setup.simulation_settings import SettingsOptions
+from ansys.edb.core.simulation_setup.simulation_settings import SimulationSettingsBase
+from ansys.edb.core.simulation_setup.simulation_setup import Distribution
+from ansys.edb.core.simulation_setup.simulation_setup import FreqSweepType
+from ansys.edb.core.simulation_setup.simulation_setup import FrequencyData
+from ansys.edb.core.simulation_setup.simulation_setup import SimulationSetup
+from ansys.edb.core.simulation_setup.simulation_setup import SimulationSetupType
+from ansys.edb.core.simulation_setup.simulation_setup import SweepData
+
+_SETTINGS = {}
+
+
+class _LeafSettings(SimulationSettingsBase):
+    @property
+    def max_frequency(self):
+        return _SETTINGS[self.msg.id]["max_frequency"]
+
+    @max_frequency.setter
+    def max_frequency(self, max_frequency):
+        _SETTINGS.setdefault(self.msg.id, {})["max_frequency"] = max_frequency
+
+
+class _TreeSettings(SimulationSettingsBase):
+    @property
+    def enabled(self):
+        return _SETTINGS[self.msg.id]["enabled"]
+
+    @enabled.setter
+    def enabled(self, enabled):
+        _SETTINGS.setdefault(self.msg.id, {})["enabled"] = enabled
+
+    @property
+    def general(self):
+        return _LeafSettings(self)
+
+
+class _TypedSettings(SimulationSettingsBase):
+    @property
+    def solver_type(self) -> SolverType:
+        return _SETTINGS[self.msg.id]["solver_type"]
+
+    @solver_type.setter
+    def solver_type(self, solver_type):
+        _SETTINGS.setdefault(self.msg.id, {})["solver_type"] = solver_type
+
+    @property
+    def broadband_adaptive_solution(self) -> BroadbandAdaptiveSolution:
+        return _SETTINGS[self.msg.id]["broadband_adaptive_solution"]
+
+    @broadband_adaptive_solution.setter
+    def broadband_adaptive_solution(self, broadband_adaptive_solution):
+        _SETTINGS.setdefault(self.msg.id, {})["broadband_adaptive_solution"] = broadband_adaptive_solution
+
+
+@pytest.fixture
+def sim_setup_stub(mocker, mocked_stub):
+    mocker.patch("ansys.edb.core.session.is_in_memory", return_value=True)
+    mocker.patch.object(RaptorXSimulationSetup, "settings", property(_TreeSettings))
+    _SETTINGS.clear()
+    _SETTINGS[1] = {"enabled": False, "max_frequency": "10GHz"}
+    stub = mocked_stub(simulation_setup, SimulationSetup)
+    stub.GetType.return_value = SimulationSetupTypeMessage(type=SimulationSetupType.RAPTOR_X.value)
+    stub.GetName.return_value = StringValue(value="raptor_x")
+    stub.GetSweepData.return_value = SweepDataListMessage()
+    stub.Create.return_value = EDBObjMessage(id=2)
+    return stub
+
+
+def test_simulation_setup_to_dict(sim_setup_stub):
+    data = SimulationSetup(EDBObjMessage(id=1)).to_dict()
+
+    assert data == {
+        "type": "RAPTOR_X",
+        "name": "raptor_x",
+        "sweep_data": [],
+        "settings": {"enabled": False, "general": {"max_frequency": "10GHz"}},
+    }
+
+
+def test_simulation_setup_clone_to(sim_setup_stub):
+    cell = Cell(EDBObjMessage(id=10))
+
+    clone = SimulationSetup(EDBObjMessage(id=1)).clone_to(cell, "raptor_x_copy")
+
+    assert isinstance(clone, RaptorXSimulationSetup) and clone.id == 2
+    request = sim_setup_stub.Create.call_args.args[0]
+    assert (request.cell.id, request.name, request.type) == (10, "raptor_x_copy", SimulationSetupType.RAPTOR_X.value)
+    sim_setup_stub.SetSweepData.assert_called_once()
+    assert _SETTINGS[2] == _SETTINGS[1]
+
+
+def test_simulation_setup_from_dict_rejects_unknown_settings(sim_setup_stub):
+    data = {"type": SimulationSetupType.RAPTOR_X, "name": "raptor_x", "settings": {"general": {"max_freq": "1GHz"}}}
+
+    with pytest.raises(AttributeError):
+        SimulationSetup.from_dict(Cell(EDBObjMessage(id=10)), data)
+
+
+def test_simulation_setup_create_many_applies_overrides(sim_setup_stub):
+    sim_setup_stub.Create.side_effect = [EDBObjMessage(id=i) for i in (2, 3, 4)]
+    cells = [Cell(EDBObjMessage(id=i)) for i in (10, 11, 12)]
+    template = SimulationSetup(EDBObjMessage(id=1))
+
+    sim_setups = SimulationSetup.create_many(
+        cells, template, [None, {"settings": {"general": {"max_frequency": "5GHz"}}}, {"name": "renamed"}]
+    )
+
+    assert [sim_setup.id for sim_setup in sim_setups] == [2, 3, 4]
+    requests = [call_args.args[0] for call_args in sim_setup_stub.Create.call_args_list]
+    assert [(request.cell.id, request.name) for request in requests] == [
+        (10, "raptor_x"),
+        (11, "raptor_x"),
+        (12, "renamed"),
+    ]
+    assert _SETTINGS[2] == _SETTINGS[4] == {"enabled": False, "max_frequency": "10GHz"}
+    assert _SETTINGS[3] == {"enabled": False, "max_frequency": "5GHz"}
+
+
+def test_simulation_setup_create_many_requires_matching_lengths(sim_setup_stub):
+    with pytest.raises(ValueError):
+        SimulationSetup.create_many([Cell(EDBObjMessage(id=10))], SimulationSetup(EDBObjMessage(id=1)), [None, None])
+
+    sim_setup_stub.Create.assert_not_called()
+
+
+def test_use_default_lambda_value_setter(mocked_stub):
+    stub = mocked_stub(simulation_settings, SettingsOptions)
+
+    SettingsOptions(SimulationSetup(EDBObjMessage(id=1))).use_default_lambda_value = True
+
+    stub.SetUseDefaultLamda.assert_called_once()
+    assert stub.SetUseDefaultLamda.call_args.args[0].value
+    stub.SetDoLamdaRefineFlag.assert_not_called()
+
+
+def test_simulation_setup_dict_round_trips_through_json(mocker, sim_setup_stub):
+    mocker.patch.object(RaptorXSimulationSetup, "settings", property(_TypedSettings))
+    _SETTINGS[1] = {
+        "solver_type": SolverType.ITERATIVE_SOLVER,
+        "broadband_adaptive_solution": BroadbandAdaptiveSolution("1GHz", "5GHz", 7, "0.01"),
+    }
+    sweep_data = SweepData("sweep", FrequencyData(Distribution.LINC, "1GHz", "10GHz", "10"))
+    sweep_data.type = FreqSweepType.DISCRETE_SWEEP
+    sweep_data_msg = simulation_setup._sweep_data_msg(sweep_data)
+    sim_setup_stub.GetSweepData.return_value = SweepDataListMessage(sweep_data=[sweep_data_msg])
+
+    data = json.loads(json.dumps(SimulationSetup(EDBObjMessage(id=1)).to_dict()))
+    SimulationSetup.from_dict(Cell(EDBObjMessage(id=10)), data)
+
+    assert data["type"] == "RAPTOR_X" and data["settings"]["solver_type"] == "ITERATIVE_SOLVER"
+    assert data["sweep_data"][0]["type"] == "DISCRETE_SWEEP"
+    assert sim_setup_stub.SetSweepData.call_args.args[0].sweeps.sweep_data == [sweep_data_msg]
+    assert _SETTINGS[2]["solver_type"] == SolverType.ITERATIVE_SOLVER
+    broadband_adaptive_solution = _SETTINGS[2]["broadband_adaptive_solution"]
+    assert isinstance(broadband_adaptive_solution, BroadbandAdaptiveSolution)
+    assert (
+        broadband_adaptive_solution.low_frequency,
+        broadband_adaptive_solution.high_frequency,
+        broadband_adaptive_solution.max_num_passes,
+        broadband_adaptive_solution.max_delta,
+    ) == ("1GHz", "5GHz", 7, "0.01")
+
+
+def _settings_classes(cls=SimulationSettingsBase):
+    for subclass in cls.__subclasses__():
+        yield subclass
+        yield from _settings_classes(subclass)
+
+
+def test_enum_settings_are_annotated():
+    for module_info in pkgutil.iter_modules(simulation_setup_pkg.__path__):
+        importlib.import_module(f"{simulation_setup_pkg.__name__}.{module_info.name}")
+
+    for settings_cls in _settings_classes():
+        for name, prop in settings_cls._settings_properties().items():
+            if prop.fset is None:
+                continue
+            value_param = list(inspect.signature(prop.fset).parameters)[1]
+            if re.search(rf"\b{value_param}\.value\b", inspect.getsource(prop.fset)):
+                value_type = get_type_hints(prop.fget).get("return")
+                assert isinstance(value_type, type) and issubclass(value_type, Enum), f"{settings_cls.__name__}.{name}"
@@ -0,0 +1,147 @@
+import gc
+
+from ansys.api.edb.v1.edb_messages_pb2 import EDBObjCollectionMessage
+from ansys.api.edb.v1.edb_messages_pb2 import EDBObjMessage
+import pytest
+from utils.fixtures import *  # noqa
+
+from ansys.edb.core.inner import variable_server
+from ansys.edb.core.inner.variable_server import VariableServer
+from ansys.edb.core.layer import layer_collection
+from ansys.edb.core.layer.layer import Layer
+from ansys.edb.core.layer.layer import LayerType
+from ansys.edb.core.layer.layer_collection import LayerCollection
+from ansys.edb.core.layer.stackup_snapshot import SnapshotLayer
+from ansys.edb.core.layer.stackup_snapshot import StackupSnapshot
+from ansys.edb.core.layout.layout import Layout
+from ansys.edb.core.session import _Session
+import ansys.edb.core.utility.io_manager as io_manager
+
+_STACKUP = [
+    # name, id, type, lower elevation, thickness
+    ("top", 1, LayerType.SIGNAL_LAYER, 3.0, 1.0),
+    ("diel_1", 2, LayerType.DIELECTRIC_LAYER, 1.0, 2.0),
+    ("bottom", 3, LayerType.SIGNAL_LAYER, 0.0, 1.0),
+]
+
+
+def _snapshot_layer(name, layer_id, layer_type, lower_elevation, thickness, is_via_layer=False):
+    return SnapshotLayer(
+        None,
+        name,
+        layer_id,
+        layer_type,
+        is_via_layer,
+        lower_elevation,
+        lower_elevation + thickness,
+        thickness,
+        "copper" if layer_type == LayerType.SIGNAL_LAYER else "FR4",
+        "FR4",
+        False,
+    )
+
+
+@pytest.fixture
+def snapshot():
+    layers = [_snapshot_layer(*lyr) for lyr in _STACKUP]
+    layers.append(_snapshot_layer("via_1", 4, LayerType.SIGNAL_LAYER, 0.0, 4.0, True))
+    layers.append(SnapshotLayer(None, "outline", 5, LayerType.OUTLINE_LAYER, False))
+    return StackupSnapshot(layers)
+
+
+def test_snapshot_indexes(snapshot):
+    assert len(snapshot) == 5
+    assert snapshot["diel_1"].layer_id == 2
+    assert snapshot.find_by_id(3).name == "bottom"
+    assert snapshot.find_by_name("missing") is None
+    assert "outline" in snapshot and not snapshot["outline"].is_stackup_layer
+    assert [lyr.name for lyr in snapshot.stackup_layers] == ["bottom", "diel_1", "top"]
+    assert [lyr.name for lyr in snapshot.via_layers] == ["via_1"]
+
+
+@pytest.mark.parametrize(
+    "elevation, expected",
+    [(-0.5, None), (0.0, "bottom"), (0.5, "bottom"), (1.0, "diel_1"), (2.9, "diel_1"), (4.0, "top"), (4.5, None)],
+)
+def test_layer_at_elevation(snapshot, elevation, expected):
+    lyr = snapshot.layer_at_elevation(elevation)
+    assert (lyr.name if lyr is not None else None) == expected
+
+
+def test_layer_at_elevation_with_overlapping_layers():
+    snapshot = StackupSnapshot(
+        [
+            _snapshot_layer("thick", 1, LayerType.DIELECTRIC_LAYER, 0.0, 10.0),
+            _snapshot_layer("thin", 2, LayerType.SIGNAL_LAYER, 2.0, 1.0),
+        ]
+    )
+
+    assert snapshot.layer_at_elevation(2.5).name == "thin"
+    assert snapshot.layer_at_elevation(5.0).name == "thick"
+
+
+def test_layers_between(snapshot):
+    assert [lyr.name for lyr in snapshot.layers_between(0.5, 3.5)] == ["bottom", "diel_1", "top"]
+    assert [lyr.name for lyr in snapshot.layers_between(1.0, 3.0)] == ["diel_1"]
+
+
+def test_layer_collection_snapshot_is_cached_until_modified(mocker):
+    edb_session = _Session("localhost", 50051, None, False, make_current=False)
+    mocker.patch.object(layer_collection, "get_current_session", return_value=edb_session)
+    mocker.patch.object(layer_collection, "is_in_memory", return_value=False)
+    prefetch = mocker.patch.object(io_manager._IOManager, "prefetch")
+    stub = mocker.Mock()
+    stub.StreamLayers.side_effect = lambda request: iter(
+        [EDBObjCollectionMessage(items=[EDBObjMessage(id=lyr[1]) for lyr in _STACKUP])]
+    )
+    mocker.patch.object(layer_collection, "get_layer_collection_stub", return_value=stub)
+    layers_by_id = {lyr[1]: _snapshot_layer(*lyr) for lyr in _STACKUP}
+    mocker.patch.object(SnapshotLayer, "from_layer", side_effect=lambda lyr: layers_by_id[lyr.id])
+    lc = LayerCollection(EDBObjMessage(id=100))
+
+    first = lc.snapshot()
+    assert lc.snapshot() is first
+    assert LayerCollection(EDBObjMessage(id=100)).snapshot() is first
+    assert stub.StreamLayers.call_count == 1
+    assert first.layer_at_elevation(2.0).name == "diel_1"
+    assert [lyr.id for lyr in prefetch.call_args.args[0]] == [1, 2, 3]
+
+    lc.add_layers([Layer(EDBObjMessage(id=6))])
+    assert lc.snapshot() is not first
+    assert stub.StreamLayers.call_count == 2
+
+    layout_stub = mocker.Mock()
+    layout_stub.GetLayerCollection.return_value = EDBObjMessage(id=100)
+    mocker.patch.object(Layout, "_Layout__stub", layout_stub)
+    layout = Layout(EDBObjMessage(id=200))
+    second = layout.layer_collection.snapshot()
+    assert layout.layer_collection.snapshot() is second
+    assert stub.StreamLayers.call_count == 2
+
+    layout.layer_collection = LayerCollection(EDBObjMessage(id=101))
+    assert layout.layer_collection.snapshot() is not second
+    assert stub.StreamLayers.call_count == 3
+
+    mocker.patch.object(VariableServer, "_variable_owner_msg", EDBObjMessage(id=300))
+    mocker.patch.object(variable_server, "get_variable_server_stub")
+    third = layout.layer_collection.snapshot()
+    VariableServer(layout).set_variable_value("h", "1mm")
+    assert layout.layer_collection.snapshot() is not third
+    assert stub.StreamLayers.call_count == 4
+
+
+def test_layer_collection_snapshots_are_released_with_session(mocker):
+    edb_session = _Session("localhost", 50051, None, False, make_current=False)
+    mocker.patch.object(layer_collection, "get_current_session", side_effect=lambda: edb_session)
+    mocker.patch.object(layer_collection, "is_in_memory", return_value=True)
+    mocker.patch.object(io_manager._IOManager, "prefetch")
+    stub = mocker.Mock()
+    stub.GetLayers.return_value = EDBObjCollectionMessage()
+    mocker.patch.object(layer_collection, "get_layer_collection_stub", return_value=stub)
+
+    LayerCollection(EDBObjMessage(id=100)).snapshot()
+    assert edb_session in layer_collection._snapshots
+
+    del edb_session
+    gc.collect()
+    assert len(layer_collection._snapshots) == 0
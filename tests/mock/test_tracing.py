@@ -0,0 +1,168 @@
+from contextlib import contextmanager
+import logging
+
+from ansys.api.edb.v1.edb_messages_pb2 import EDBObjCollectionMessage
+from ansys.api.edb.v1.edb_messages_pb2 import EDBObjMessage
+from ansys.api.edb.v1.primitive_pb2 import SetLayerMessage
+from google.protobuf.wrappers_pb2 import BoolValue
+import pytest
+
+from ansys.edb.core.edb_defs import LayoutObjType
+from ansys.edb.core.inner import ObjBase
+from ansys.edb.core.inner import utils
+from ansys.edb.core.inner.interceptors import IOInterceptor
+from ansys.edb.core.inner.interceptors import TracingInterceptor
+from ansys.edb.core.utility import tracing
+import ansys.edb.core.utility.io_manager as io_manager
+
+_IS_VOID = "/ansys.api.edb.v1.PrimitiveService/IsVoid"
+_SET_LAYER = "/ansys.api.edb.v1.PrimitiveService/SetLayer"
+_STREAM_ITEMS = "/ansys.api.edb.v1.LayoutService/StreamItems"
+
+
+class _Span:
+    def __init__(self, name, attributes):
+        self.name = name
+        self.attributes = dict(attributes or {})
+        self.ended = False
+
+    def set_attribute(self, key, value):
+        self.attributes[key] = value
+
+    def end(self):
+        self.ended = True
+
+
+class _Tracer:
+    def __init__(self):
+        self.spans = []
+
+    def start_span(self, name, attributes=None):
+        span = _Span(name, attributes)
+        self.spans.append(span)
+        return span
+
+    @contextmanager
+    def start_as_current_span(self, name, attributes=None):
+        span = self.start_span(name, attributes)
+        try:
+            yield span
+        finally:
+            span.end()
+
+
+class _Future:
+    def __init__(self, response):
+        self._response = response
+
+    def result(self):
+        return self._response
+
+
+@pytest.fixture
+def tracer(mocker):
+    mocker.patch("ansys.edb.core.session.is_in_memory", return_value=False)
+    mocker.patch.object(io_manager._IOManager, "_enable_caching")
+    mocker.patch("ansys.edb.core.utility.io_manager._get_io_manager_stub")
+    tracer = _Tracer()
+    tracing.set_tracer(tracer)
+    yield tracer
+    tracing.set_tracer(None)
+
+
+def _traced_call(method, request, continuation):
+    call_details = IOInterceptor._ClientCallDetails(method, None, None, None)
+    io_interceptor = IOInterceptor(logging.getLogger(), None)
+    return TracingInterceptor(logging.getLogger()).intercept_unary_unary(
+        lambda details, request: io_interceptor.intercept_unary_unary(continuation, details, request),
+        call_details,
+        request,
+    )
+
+
+def test_no_spans_by_default():
+    assert not tracing.is_tracing()
+    with tracing.get_tracer().start_as_current_span("span") as span:
+        span.set_attribute("key", "value")
+
+
+def test_rpc_spans(tracer):
+    request = EDBObjMessage(id=1)
+    response = BoolValue(value=True)
+
+    with io_manager.enable_io_manager(io_manager.IOMangementType.READ):
+        for _ in range(2):
+            _traced_call(_IS_VOID, request, lambda details, request: _Future(response))
+
+    assert [span.name for span in tracer.spans] == ["ansys.api.edb.v1.PrimitiveService/IsVoid"] * 2
+    sent, cached = (span.attributes for span in tracer.spans)
+    assert sent == {
+        "rpc.system": "grpc",
+        "rpc.service": "ansys.api.edb.v1.PrimitiveService",
+        "rpc.method": "IsVoid",
+        "edb.request_bytes": request.ByteSize(),
+        "edb.response_bytes": response.ByteSize(),
+    }
+    assert (cached["edb.cache_hit"], cached["edb.buffered"]) == (True, False)
+
+
+def test_stream_span_wait_time_excludes_caller_time(mocker, tracer):
+    clock = mocker.patch("ansys.edb.core.inner.interceptors.perf_counter", return_value=0.0)
+    responses = [EDBObjCollectionMessage(items=[EDBObjMessage(id=i)]) for i in range(3)]
+
+    def continuation(client_call_details, request):
+        for response in responses:
+            clock.return_value += 1.0
+            yield response
+
+    call_details = IOInterceptor._ClientCallDetails(_STREAM_ITEMS, None, None, None)
+    for _ in TracingInterceptor(logging.getLogger()).intercept_unary_stream(
+        continuation, call_details, EDBObjMessage()
+    ):
+        clock.return_value += 10.0
+
+    (span,) = tracer.spans
+    assert span.ended
+    assert span.attributes["edb.response_bytes"] == sum(response.ByteSize() for response in responses)
+    assert span.attributes["edb.wait_time"] == 3.0
+
+
+def test_buffer_flush_span(mocker, tracer):
+    with io_manager.enable_io_manager(io_manager.IOMangementType.WRITE):
+        _traced_call(_SET_LAYER, SetLayerMessage(), mocker.Mock())
+
+    rpc_span, flush_span = tracer.spans
+    assert (rpc_span.attributes["edb.cache_hit"], rpc_span.attributes["edb.buffered"]) == (False, True)
+    assert flush_span.name == "edb.io_manager.flush_buffer"
+    assert flush_span.attributes == {"edb.entries": 1, "edb.invalidates_cache": True}
+
+
+def test_prefetch_span(tracer):
+    edb_objs = [ObjBase(EDBObjMessage(id=i)) for i in range(1, 4)]
+
+    utils.batch_get(edb_objs, lambda edb_obj: edb_obj.id)
+
+    assert [(span.name, span.attributes) for span in tracer.spans] == [("edb.io_manager.prefetch", {"edb.objects": 3})]
+
+
+def _collection_rpcs():
+    unary_rpc = lambda request: EDBObjCollectionMessage(items=[EDBObjMessage(id=1)])
+    streaming_rpc = lambda request: iter([EDBObjCollectionMessage(items=[EDBObjMessage(id=i)]) for i in (1, 2)])
+    return unary_rpc, streaming_rpc
+
+
+def test_collection_spans(tracer):
+    owner = ObjBase(EDBObjMessage(id=1))
+
+    with io_manager.enable_io_manager(io_manager.IOMangementType.READ):
+        nets = utils.query_lyt_object_collection(owner, LayoutObjType.NET, *_collection_rpcs())
+    first_net = next(utils.iter_lyt_object_collection(owner, LayoutObjType.NET, *_collection_rpcs()))
+
+    assert [net.id for net in nets] == [1, 2] and first_net.id == 1
+    query_span, iter_span = tracer.spans
+    assert query_span.attributes == {
+        "edb.collection.type": "NET",
+        "edb.collection.streamed": True,
+        "edb.collection.items": 2,
+    }
+    assert iter_span.ended and iter_span.attributes["edb.collection.items"] == 1
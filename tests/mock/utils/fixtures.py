@@ -1,11 +1,15 @@
+from concurrent.futures import ThreadPoolExecutor
 import random
 import string
+import warnings
 
+import grpc
 import pytest
 
 from ansys.edb.core.layer.layer import Layer
 from ansys.edb.core.layout.layout import Layout
 from ansys.edb.core.net.net import Net
+from ansys.edb.core.session import _Session
 
 from .test_utils import create_edb_obj_msg
 from .test_utils import generate_random_int
@@ -22,6 +26,43 @@ def mocked_stub(mocker):
     return _stub
 
 
+@pytest.fixture
+def server_session():
+    """Fixture for connecting sessions to in-process servers.
+
+    Returns
+    -------
+    Callable
+        Function that serves the servicers passed to it and returns a connected session that is not current. Each \
+        servicer is passed with the function that adds it to a server, such as \
+        ``(net_pb2_grpc.add_NetServiceServicer_to_server, servicer)``.
+    """
+    servers = []
+    sessions = []
+
+    def _server_session(*servicers):
+        server = grpc.server(ThreadPoolExecutor(max_workers=4))
+        for add_servicer_to_server, servicer in servicers:
+            add_servicer_to_server(servicer, server)
+        port_num = server.add_insecure_port("localhost:0")
+        server.start()
+        servers.append(server)
+        edb_session = _Session("localhost", port_num, None, False, make_current=False)
+        edb_session.transport_mode = "insecure"
+        with warnings.catch_warnings():
+            # The servers only listen on localhost, so the warning about connecting without TLS does not apply.
+            warnings.simplefilter("ignore", UserWarning)
+            edb_session.connect()
+        sessions.append(edb_session)
+        return edb_session
+
+    yield _server_session
+    for edb_session in sessions:
+        edb_session.disconnect()
+    for server in servers:
+        server.stop(None)
+
+
 @pytest.fixture(params=[True, False])
 def bool_val(request):
     """Parameterized fixture that returns True and False values